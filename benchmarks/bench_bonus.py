@@ -0,0 +1,101 @@
+"""Benchmarks calculating the provisional bonus points of a gameweek's
+fixtures one :class:`Fixture` at a time, as ``Fixture.get_bonus`` used to,
+and in one pass using :func:`fpl.bonus.get_gameweek_bonus`.
+
+Usage::
+
+    python benchmarks/bench_bonus.py
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fpl.bonus import get_gameweek_bonus  # noqa: E402
+from fpl.models.fixture import Fixture  # noqa: E402
+
+
+def get_bonus_per_fixture(fixture):
+    """The previous implementation of ``Fixture.get_bonus(provisional=True)``
+    for a fixture in progress.
+    """
+    bps = fixture.get_bps()
+    home = [b["element"] for b in bps["h"]]
+    away = [b["element"] for b in bps["a"]]
+    bps = bps["a"] + bps["h"]
+    bps = {b["element"]: b["value"] for b in bps}
+    bps_values = set(bps.values())
+
+    try:
+        bps_1st = max(bps_values)
+        bps_values.remove(bps_1st)
+        bps_2nd = max(bps_values)
+        bps_values.remove(bps_2nd)
+        bps_3rd = max(bps_values)
+    except ValueError:
+        return {"a": [], "h": []}
+
+    bonus_3rd = list(filter(lambda x: bps[x] == bps_1st, bps.keys()))
+    bonus_2nd = bonus_1st = []
+    if len(bonus_3rd) == 1:
+        bonus_2nd = list(filter(lambda x: bps[x] == bps_2nd, bps.keys()))
+    if len(bonus_3rd) + len(bonus_2nd) == 2:
+        if len(bonus_3rd) == 2:
+            bonus_1st = list(filter(lambda x: bps[x] == bps_2nd, bps.keys()))
+        else:
+            bonus_1st = list(filter(lambda x: bps[x] == bps_3rd, bps.keys()))
+
+    bonus = ([{"value": 3, "element": b} for b in bonus_3rd] +
+             [{"value": 2, "element": b} for b in bonus_2nd] +
+             [{"value": 1, "element": b} for b in bonus_1st])
+    h = []
+    a = []
+    for b in bonus:
+        if b["element"] in home:
+            h.append(b)
+        elif b["element"] in away:
+            a.append(b)
+    return {"a": a, "h": h}
+
+
+def create_fixtures(number_of_fixtures, players_per_team=16):
+    random.seed(0)
+    fixtures = []
+    for fixture_id in range(1, number_of_fixtures + 1):
+        first_element = (fixture_id - 1) * players_per_team * 2 + 1
+        elements = range(first_element, first_element + players_per_team * 2)
+        bps = [{"value": random.randint(-3, 40), "element": element}
+               for element in elements]
+        fixtures.append({
+            "id": fixture_id,
+            "started": True,
+            "finished": False,
+            "stats": [{"identifier": "bps",
+                       "a": bps[players_per_team:],
+                       "h": bps[:players_per_team]}]
+        })
+    return fixtures
+
+
+def main(number=1000):
+    fixtures = create_fixtures(10)
+
+    def per_fixture():
+        return {fixture["id"]: get_bonus_per_fixture(Fixture(fixture))
+                for fixture in fixtures}
+
+    def gameweek():
+        return get_gameweek_bonus(fixtures)
+
+    assert per_fixture() == gameweek()
+
+    for name, function in (("per fixture", per_fixture),
+                           ("gameweek", gameweek)):
+        seconds = min(timeit.repeat(function, number=number, repeat=3))
+        print(f"{name:>12}: {seconds / number * 1e6:>8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Benchmarks decoding a response the size of
+https://fantasy.premierleague.com/api/bootstrap-static/ with the standard
+library's ``json`` and with :func:`fpl.utils.loads`, and converting it to
+records with :func:`fpl.decoding.to_records`.
+
+Usage::
+
+    python benchmarks/bench_decoding.py
+"""
+import json
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fpl.decoding import to_records  # noqa: E402
+from fpl.utils import loads, orjson  # noqa: E402
+
+
+def create_body(number_of_players=600, number_of_fields=60):
+    random.seed(0)
+    elements = [dict({"id": player_id, "web_name": f"Player {player_id}",
+                      "form": f"{random.uniform(0, 10):.1f}"},
+                     **{f"field_{field}": random.randint(0, 100)
+                        for field in range(number_of_fields - 3)})
+                for player_id in range(1, number_of_players + 1)]
+    teams = [{"id": team_id, "name": f"Team {team_id}"}
+             for team_id in range(1, 21)]
+    events = [{"id": gameweek, "finished": False}
+              for gameweek in range(1, 39)]
+    return json.dumps({"elements": elements, "teams": teams,
+                       "events": events}).encode()
+
+
+def main(number=20):
+    body = create_body()
+    data = loads(body)
+    print(f"{len(body) / 1024:.0f} KiB, orjson "
+          f"{'installed' if orjson else 'not installed'}")
+
+    for name, function in (
+            ("json.loads", lambda: json.loads(body)),
+            ("loads", lambda: loads(body)),
+            ("to_records", lambda: to_records(data, "static"))):
+        seconds = min(timeit.repeat(function, number=number, repeat=3))
+        print(f"{name:>10}: {seconds / number * 1e3:>6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
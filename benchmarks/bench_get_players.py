@@ -0,0 +1,43 @@
+"""Benchmarks ``FPL.get_players`` with a growing number of players, to show
+it scales linearly now that players are looked up by ID.
+
+Usage::
+
+    python benchmarks/bench_get_players.py
+"""
+import asyncio
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fpl import FPL  # noqa: E402
+
+
+def create_fpl(number_of_players):
+    fpl = FPL.__new__(FPL)
+    fpl.session = None
+    fpl.elements = {
+        player_id: {"id": player_id, "team": player_id % 20 + 1,
+                    "element_type": player_id % 4 + 1, "now_cost": 50}
+        for player_id in range(1, number_of_players + 1)
+    }
+    return fpl
+
+
+def main(repeat=5):
+    print(f"{'players':>8} {'total (ms)':>12} {'per player (us)':>16}")
+    for number_of_players in (150, 300, 600, 1200, 2400, 4800):
+        fpl = create_fpl(number_of_players)
+
+        def run():
+            asyncio.run(fpl.get_players(return_json=True))
+
+        seconds = min(timeit.repeat(run, number=1, repeat=repeat))
+        print(f"{number_of_players:>8} {seconds * 1e3:>12.2f} "
+              f"{seconds / number_of_players * 1e6:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
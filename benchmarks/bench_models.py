@@ -0,0 +1,77 @@
+"""Benchmarks building a :class:`Player` for each of the ~600 players, as
+:meth:`FPL.get_players` does, with players that copy each key of their
+information onto the instance (as they used to) and with players that wrap
+it, comparing the construction time and the memory used by the players.
+
+Usage::
+
+    python benchmarks/bench_models.py
+"""
+import os
+import random
+import resource
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fpl.models.player import Player  # noqa: E402
+
+
+class CopyingPlayer(Player):
+    """A player that copies each key of its information onto the instance."""
+
+    def __init__(self, player_information, session):
+        self._session = session
+        for k, v in player_information.items():
+            setattr(self, k, v)
+
+
+def create_elements(number_of_players, number_of_fields=60):
+    random.seed(0)
+    return [dict({"id": player_id},
+                 **{f"field_{field}": random.randint(0, 100)
+                    for field in range(number_of_fields - 1)})
+            for player_id in range(1, number_of_players + 1)]
+
+
+def get_memory(cls, elements):
+    """Returns the number of bytes allocated to build the players."""
+    tracemalloc.start()
+    players = [cls(player, None) for player in elements]
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del players
+    return memory
+
+
+def get_rss(cls, elements, copies=50):
+    """Returns the increase of the maximum RSS (in kB on Linux) after
+    building ``copies`` lists of players.
+    """
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    players = [[cls(player, None) for player in elements]
+               for _ in range(copies)]
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    del players
+    return after - before
+
+
+def main(number=100):
+    elements = create_elements(600)
+
+    for name, cls in (("copying", CopyingPlayer), ("wrapping", Player)):
+        seconds = min(timeit.repeat(
+            lambda: [cls(player, None) for player in elements],
+            number=number, repeat=3))
+        print(f"{name:>9}: {seconds / number * 1e6:>8.1f} us, "
+              f"{get_memory(cls, elements) / 1024:>7.1f} KiB")
+
+    # The maximum RSS only grows, so the smaller one is measured first.
+    for name, cls in (("wrapping", Player), ("copying", CopyingPlayer)):
+        print(f"{name:>9}: +{get_rss(cls, elements)} kB max RSS (50 copies)")
+
+
+if __name__ == "__main__":
+    main()
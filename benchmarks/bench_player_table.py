@@ -0,0 +1,57 @@
+"""Benchmarks ranking all players by points per 90 minutes, using
+:class:`Player` objects and using a :class:`PlayerTable`.
+
+Usage::
+
+    python benchmarks/bench_player_table.py
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fpl.models.player import Player  # noqa: E402
+from fpl.stats import PlayerTable  # noqa: E402
+
+
+def create_elements(number_of_players):
+    random.seed(0)
+    return [{"id": player_id,
+             "total_points": random.randint(0, 250),
+             "minutes": random.randint(0, 3420),
+             "now_cost": random.randint(40, 130),
+             "form": f"{random.uniform(0, 10):.1f}",
+             "element_type": random.randint(1, 4)}
+            for player_id in range(1, number_of_players + 1)]
+
+
+def main(number=1000):
+    elements = create_elements(600)
+    players = [Player(player, None) for player in elements]
+    table = PlayerTable(elements)
+
+    def rank_objects():
+        return [player.id for player in sorted(
+            players, key=lambda player: player.pp90, reverse=True)]
+
+    def rank_table():
+        return table.rank("pp90")
+
+    def top_objects():
+        return rank_objects()[:10]
+
+    def top_table():
+        return table.top("pp90", 10)
+
+    for name, function in (("rank (objects)", rank_objects),
+                           ("rank (table)", rank_table),
+                           ("top 10 (objects)", top_objects),
+                           ("top 10 (table)", top_table)):
+        seconds = min(timeit.repeat(function, number=number, repeat=3))
+        print(f"{name:>18}: {seconds / number * 1e6:>8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import heapq
+
+
+def _get_stats(fixture):
+    """Returns the stats of a fixture keyed by identifier, for both fixtures
+    as returned by the API and their ``Fixture.stats``.
+    """
+    stats = fixture.get("stats", {})
+    if isinstance(stats, dict):
+        return stats
+    return {stat["identifier"]: {"a": stat["a"], "h": stat["h"]}
+            for stat in stats}
+
+
+def calculate_bonus(bps):
+    """Returns the provisional bonus points of a fixture's players given
+    their BPS, following the rules of the Fantasy Premier League:
+
+    * If one player has the highest BPS, they get 3 points, the players with
+      the second highest BPS get 2 points and, if that's one player, the
+      players with the third highest BPS get 1 point.
+    * If two players have the highest BPS, they get 3 points and the players
+      with the second highest BPS get 1 point.
+    * If three or more players have the highest BPS, they get 3 points.
+
+    No bonus points are awarded until there are at least three different BPS
+    values.
+
+    :param bps: The ``"a"`` and ``"h"`` BPS of the fixture, as in its
+        ``stats``, e.g. ``{"a": [{"value": 30, "element": 1}], "h": []}``.
+    :type bps: dict
+    :return: The bonus points of the away (``"a"``) and home (``"h"``)
+        players, in the format of ``Fixture.get_bonus``.
+    :rtype: dict
+    """
+    home = {b["element"] for b in bps["h"]}
+    values = {b["element"]: b["value"] for b in bps["a"] + bps["h"]}
+
+    top_values = heapq.nlargest(3, set(values.values()))
+    if len(top_values) < 3:
+        return {"a": [], "h": []}
+
+    ranked = {value: [] for value in top_values}
+    for element, value in values.items():
+        if value in ranked:
+            ranked[value].append(element)
+
+    first, second, third = (ranked[value] for value in top_values)
+    if len(first) == 1:
+        awarded = [(first, 3), (second, 2)]
+        if len(second) == 1:
+            awarded.append((third, 1))
+    elif len(first) == 2:
+        awarded = [(first, 3), (second, 1)]
+    else:
+        awarded = [(first, 3)]
+
+    bonus = {"a": [], "h": []}
+    for elements, points in awarded:
+        for element in elements:
+            location = "h" if element in home else "a"
+            bonus[location].append({"value": points, "element": element})
+    return bonus
+
+
+def get_fixture_bonus(fixture, provisional=True):
+    """Returns the bonus points of the players in the given fixture, like
+    ``Fixture.get_bonus``: the confirmed bonus points of finished fixtures,
+    the provisional bonus points of fixtures in progress if ``provisional``
+    is ``True``, and none otherwise.
+
+    :param fixture: A fixture as returned by the API, or a ``dict`` with its
+        stats keyed by identifier.
+    :type fixture: dict
+    :param bool provisional: (optional) Calculates the bonus points of
+        fixtures in progress if ``True``. Defaults to ``True``.
+    :rtype: dict
+    """
+    stats = _get_stats(fixture)
+    if fixture.get("finished"):
+        return stats["bonus"]
+    if fixture.get("started") and provisional:
+        return calculate_bonus(stats.get("bps", {"a": [], "h": []}))
+    return {"a": [], "h": []}
+
+
+def get_gameweek_bonus(fixtures, provisional=True):
+    """Returns the bonus points of the players in all the given fixtures of
+    a gameweek, keyed by fixture ID (see :func:`get_fixture_bonus`).
+
+    :param list fixtures: The gameweek's fixtures, as returned by the API.
+    :param bool provisional: (optional) Calculates the bonus points of
+        fixtures in progress if ``True``. Defaults to ``True``.
+    :rtype: dict
+    """
+    return {fixture["id"]: get_fixture_bonus(fixture, provisional)
+            for fixture in fixtures}
+
+
+def get_provisional_bonus_points(fixtures):
+    """Returns the provisional bonus points of each player in the given
+    fixtures that are in progress, keyed by element ID. The points of a
+    player with more than one fixture are summed.
+
+    :param list fixtures: The fixtures, as returned by the API.
+    :rtype: dict
+    """
+    points = {}
+    for fixture in fixtures:
+        if fixture.get("finished") or not fixture.get("started"):
+            continue
+
+        bonus = get_fixture_bonus(fixture)
+        for b in bonus["a"] + bonus["h"]:
+            points[b["element"]] = points.get(b["element"], 0) + b["value"]
+    return points
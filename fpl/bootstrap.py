@@ -0,0 +1,178 @@
+import asyncio
+import time
+from types import MappingProxyType
+
+from .constants import API_URLS
+from .utils import fetch, get_session_option
+
+
+def index_static(static):
+    """Returns the attributes of an :class:`FPL <fpl.FPL>` instance taken
+    from bootstrap-static, with lists of objects that have an ID (e.g.
+    ``elements``) converted to dicts keyed by ID.
+
+    :param dict static: The bootstrap-static response.
+    :rtype: dict
+    """
+    attributes = {}
+    for k, v in static.items():
+        try:
+            v = {w["id"]: w for w in v}
+        except (KeyError, TypeError):
+            pass
+        attributes[k] = v
+
+    attributes["current_gameweek"] = next(
+        event for event in static["events"] if event["is_current"])["id"]
+    return attributes
+
+
+class BootstrapSnapshot:
+    """An indexed bootstrap-static response, shared by all
+    :class:`FPL <fpl.FPL>` instances created from the same
+    :class:`BootstrapStore`. Its attributes are those of an :class:`FPL
+    <fpl.FPL>` instance, e.g. ``elements`` and ``current_gameweek``, and must
+    not be modified.
+
+    :param dict static: The bootstrap-static response.
+    """
+
+    def __init__(self, static):
+        self.static = static
+        self.attributes = MappingProxyType(index_static(static))
+        self.fetched_at = time.time()
+
+    def __getattr__(self, name):
+        try:
+            return self.attributes[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+class BootstrapStore:
+    """A process-wide store of the latest :class:`BootstrapSnapshot`, so
+    bootstrap-static is downloaded and indexed once instead of once per
+    :class:`FPL <fpl.FPL>` instance.
+
+    The snapshot is replaced as a whole when it's refreshed, either
+    explicitly with :meth:`refresh` or every ``interval`` seconds in the
+    background after :meth:`start`. Instances keep using the snapshot they
+    were created with.
+
+    Basic usage::
+
+      >>> from fpl import FPL
+      >>> from fpl.bootstrap import BootstrapStore
+      >>> import aiohttp
+      >>> import asyncio
+      >>>
+      >>> store = BootstrapStore(interval=60)
+      >>>
+      >>> async def handle_request(session):
+      ...     fpl = await FPL.create(session, bootstrap=store)
+      ...     return await fpl.get_player(302)
+      ...
+      >>> async def main():
+      ...     async with aiohttp.ClientSession() as session:
+      ...         store.start(session)
+      ...         players = await asyncio.gather(
+      ...             *[handle_request(session) for _ in range(100)])
+      ...         await store.stop()
+      ...
+      >>> asyncio.run(main())
+
+    :param float interval: (optional) The number of seconds between two
+        background refreshes. Defaults to ``300``.
+    """
+
+    def __init__(self, interval=300):
+        self.interval = interval
+        self.snapshot = None
+        self._refreshing = None
+        self._task = None
+
+    async def get(self, session):
+        """Returns the current snapshot, downloading it first if the store is
+        empty.
+
+        :param aiohttp.ClientSession session: The session used for the
+            download.
+        :rtype: :class:`BootstrapSnapshot`
+        """
+        snapshot = self.snapshot
+        if snapshot is None:
+            snapshot = await self.refresh(session)
+        return snapshot
+
+    async def refresh(self, session):
+        """Downloads bootstrap-static and replaces the current snapshot, if
+        the response changed. Concurrent calls share one download. If a
+        cache is set for the session, the cached response is only reused
+        when the store is empty, or if the API responds with ``304 Not
+        Modified``.
+
+        :param aiohttp.ClientSession session: The session used for the
+            download.
+        :rtype: :class:`BootstrapSnapshot`
+        """
+        if self._refreshing is None:
+            refreshing = asyncio.ensure_future(self._refresh(session))
+            refreshing.add_done_callback(self._refreshed)
+            self._refreshing = refreshing
+
+        return await asyncio.shield(self._refreshing)
+
+    def _refreshed(self, refreshing):
+        if self._refreshing is refreshing:
+            self._refreshing = None
+        # Mark the exception as retrieved, in case all callers have been
+        # cancelled.
+        if not refreshing.cancelled():
+            refreshing.exception()
+
+    async def _refresh(self, session):
+        url = API_URLS["static"]
+
+        # Once there is a snapshot, a refresh must not be served the cached
+        # response it may have been built from, but can revalidate it.
+        cache = get_session_option(session, "cache")
+        if cache is not None and self.snapshot is not None:
+            cache.expire(url)
+
+        static = await fetch(session, url)
+
+        # A response served from the cache has already been indexed
+        if self.snapshot is None or static is not self.snapshot.static:
+            self.snapshot = BootstrapSnapshot(static)
+        return self.snapshot
+
+    def start(self, session):
+        """Starts refreshing the snapshot every ``interval`` seconds in the
+        background.
+
+        :param aiohttp.ClientSession session: The session used for the
+            downloads, which must stay open until :meth:`stop` is called.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run(session))
+
+    async def stop(self):
+        """Stops refreshing the snapshot in the background."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self, session):
+        while True:
+            try:
+                await self.refresh(session)
+            except Exception:
+                # Keep the current snapshot and try again next time
+                pass
+            await asyncio.sleep(self.interval)
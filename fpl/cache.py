@@ -0,0 +1,436 @@
+import json
+import os
+import sqlite3
+import time
+import zlib
+from collections import OrderedDict
+
+from appdirs import user_data_dir
+
+from .utils import loads
+
+#: The number of seconds responses of each endpoint are cached for. ``None``
+#: means responses never expire, ``0`` means they are not cached at all.
+#: Endpoints that need a login, and whose response therefore depends on the
+#: logged in user, are not cached, since the cache is keyed by URL only.
+#: The fixtures of a gameweek are cached as briefly as its live data, since
+#: provisional bonus points are calculated from their BPS.
+DEFAULT_TTLS = {
+    "dynamic": 300,
+    "fixtures": 300,
+    "gameweeks": 300,
+    "gameweek_fixtures": 10,
+    "gameweek_live": 10,
+    "league_classic": 0,
+    "league_h2h": 0,
+    "league_h2h_fixtures": 0,
+    "players": 300,
+    "player": 300,
+    "settings": 3600,
+    "static": 300,
+    "teams": 300,
+    "transfers": 0,
+    "user": 60,
+    "user_cup": 300,
+    "user_history": 300,
+    "user_picks": 60,
+    "user_team": 0,
+    "user_transfers": 60,
+    "user_latest_transfers": 0,
+    "watchlist": 0,
+    "me": 0
+}
+
+#: Endpoints whose responses can no longer change once their gameweek is
+#: finished and its data checked, mapped to the index of the gameweek in the
+#: URL's arguments.
+GAMEWEEK_ENDPOINTS = {
+    "gameweek_fixtures": 0,
+    "gameweek_live": 0,
+    "user_picks": 1
+}
+
+
+class _CacheEntry:
+    __slots__ = ("data", "size", "expires", "etag", "last_modified")
+
+    def __init__(self, data, size, expires, etag=None, last_modified=None):
+        self.data = data
+        self.size = size
+        self.expires = expires
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def is_fresh(self, now):
+        return self.expires is None or now < self.expires
+
+    def can_revalidate(self):
+        return bool(self.etag or self.last_modified)
+
+
+class ResponseCache:
+    """An in-memory cache of decoded API responses, used by
+    :func:`fetch <fpl.utils.fetch>`.
+
+    Responses are cached for a number of seconds depending on their endpoint
+    (see :data:`DEFAULT_TTLS`). Responses of endpoints in
+    :data:`GAMEWEEK_ENDPOINTS` never expire once their gameweek is finished,
+    which the cache learns from the bootstrap-static and events responses
+    passing through it. The least recently used responses are evicted once
+    the cache holds more than ``max_entries`` responses or ``max_bytes``
+    bytes of response bodies.
+
+    Expired responses that came with an ``ETag`` or ``Last-Modified`` header
+    are kept, so :func:`fetch <fpl.utils.fetch>` can send a conditional
+    request and reuse them if the API responds with ``304 Not Modified``.
+
+    Cached responses are shared between everyone fetching the same URL, so
+    they must not be modified.
+
+    :param dict ttls: (optional) Overrides the number of seconds responses of
+        the given endpoints are cached for.
+    :param int max_entries: (optional) The maximum number of responses.
+        Defaults to ``1000``.
+    :param int max_bytes: (optional) The maximum total size of the response
+        bodies in bytes. Defaults to 64 MiB.
+    """
+
+    def __init__(self, ttls=None, max_entries=1000, max_bytes=64 * 2 ** 20):
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries = OrderedDict()
+        self._size = 0
+        self._final_gameweeks = set()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, url):
+        return self.get(url) is not None
+
+    @property
+    def size(self):
+        """The total size of the cached response bodies in bytes.
+
+        :rtype: int
+        """
+        return self._size
+
+    def get_ttl(self, endpoint, arguments=()):
+        """Returns the number of seconds a response of the given endpoint is
+        cached for.
+
+        :param string endpoint: The endpoint's name.
+        :param tuple arguments: (optional) The arguments formatted into the
+            endpoint's URL.
+        :rtype: float or None
+        """
+        index = GAMEWEEK_ENDPOINTS.get(endpoint)
+        if index is not None and len(arguments) > index:
+            try:
+                if int(arguments[index]) in self._final_gameweeks:
+                    return None
+            except ValueError:
+                pass
+
+        return self.ttls.get(endpoint, 0)
+
+    def get(self, url):
+        """Returns the cached response of the given URL, or ``None`` if it
+        isn't cached or has expired.
+
+        :param string url: The URL.
+        """
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+
+        if not entry.is_fresh(time.monotonic()):
+            if not entry.can_revalidate():
+                self.invalidate(url)
+            return None
+
+        self._entries.move_to_end(url)
+        return entry.data
+
+    def get_validators(self, url):
+        """Returns the headers needed to make a conditional request for the
+        given URL, which are empty if it has no cached response that can be
+        revalidated.
+
+        :param string url: The URL.
+        :rtype: dict
+        """
+        entry = self._entries.get(url)
+        validators = {}
+        if entry is None:
+            return validators
+
+        if entry.etag:
+            validators["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            validators["If-Modified-Since"] = entry.last_modified
+        return validators
+
+    def revalidate(self, url, endpoint=None, arguments=()):
+        """Marks the cached response of the given URL as fresh again, after
+        the API responded with ``304 Not Modified``, and returns it. Returns
+        ``None`` if it is no longer cached.
+
+        :param string url: The URL.
+        :param string endpoint: (optional) The endpoint's name.
+        :param tuple arguments: (optional) The arguments formatted into the
+            endpoint's URL.
+        """
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+
+        ttl = self.get_ttl(endpoint, arguments)
+        entry.expires = None if ttl is None else time.monotonic() + ttl
+        self._entries.move_to_end(url)
+        return entry.data
+
+    def set(self, url, data, size, endpoint=None, arguments=(), etag=None,
+            last_modified=None, body=None):
+        """Caches the response of the given URL, if its endpoint's responses
+        are cached.
+
+        :param string url: The URL.
+        :param data: The decoded response.
+        :param int size: The size of the response's body in bytes.
+        :param string endpoint: (optional) The endpoint's name.
+        :param tuple arguments: (optional) The arguments formatted into the
+            endpoint's URL.
+        :param string etag: (optional) The response's ``ETag`` header.
+        :param string last_modified: (optional) The response's
+            ``Last-Modified`` header.
+        :param bytes body: (optional) The response's body. Not used by the
+            in-memory cache.
+        """
+        if endpoint == "static":
+            self._update_final_gameweeks(data.get("events", []))
+        elif endpoint == "gameweeks":
+            self._update_final_gameweeks(data)
+
+        ttl = self.get_ttl(endpoint, arguments)
+        if ttl == 0 or size > self.max_bytes:
+            return
+
+        self._discard(url)
+        expires = None if ttl is None else time.monotonic() + ttl
+        self._entries[url] = _CacheEntry(
+            data, size, expires, etag, last_modified)
+        self._size += size
+        self._evict()
+
+    def expire(self, url):
+        """Marks the cached response of the given URL as expired, so the next
+        :func:`fetch <fpl.utils.fetch>` of the URL sends a request, which is
+        a conditional request if the response can be revalidated.
+
+        :param string url: The URL.
+        """
+        entry = self._entries.get(url)
+        if entry is None:
+            return
+
+        if entry.can_revalidate():
+            entry.expires = time.monotonic()
+        else:
+            self.invalidate(url)
+
+    def invalidate(self, url):
+        """Removes the cached response of the given URL.
+
+        :param string url: The URL.
+        """
+        self._discard(url)
+
+    def clear(self):
+        """Removes all cached responses."""
+        self._entries.clear()
+        self._size = 0
+
+    def _discard(self, url):
+        entry = self._entries.pop(url, None)
+        if entry is not None:
+            self._size -= entry.size
+
+    def _update_final_gameweeks(self, events):
+        for event in events:
+            if event.get("finished") and event.get("data_checked"):
+                self._final_gameweeks.add(event["id"])
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or
+                                 self._size > self.max_bytes):
+            _, entry = self._entries.popitem(last=False)
+            self._size -= entry.size
+
+
+class PersistentCache(ResponseCache):
+    """A :class:`ResponseCache` that also stores responses in a SQLite
+    database, so they survive the process, e.g. between runs of the CLI.
+
+    Responses are kept in memory as well and only read from the database
+    when they are not. Bodies are stored compressed, together with their
+    expiry time, so e.g. the picks of finished gameweeks never have to be
+    fetched again.
+
+    Basic usage::
+
+      >>> from fpl import FPL
+      >>> from fpl.cache import PersistentCache
+      >>> import aiohttp
+      >>> import asyncio
+      >>>
+      >>> async def main():
+      ...     async with aiohttp.ClientSession() as session:
+      ...         fpl = FPL(session, cache=PersistentCache())
+      ...         user = await fpl.get_user(3808385)
+      ...         picks = await user.get_picks()
+      ...
+      >>> asyncio.run(main())
+
+    :param string path: (optional) The path of the SQLite database. Defaults
+        to ``cache.sqlite`` in the user's data directory.
+    :param int compression_level: (optional) The zlib compression level of the
+        stored bodies. Defaults to ``6``.
+
+    The other parameters are the same as those of :class:`ResponseCache`.
+    """
+
+    def __init__(self, path=None, ttls=None, max_entries=1000,
+                 max_bytes=64 * 2 ** 20, compression_level=6):
+        super().__init__(ttls, max_entries, max_bytes)
+
+        if path is None:
+            data_directory = user_data_dir("fpl", "fpl")
+            os.makedirs(data_directory, exist_ok=True)
+            path = os.path.join(data_directory, "cache.sqlite")
+
+        self.path = path
+        self.compression_level = compression_level
+
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url text PRIMARY KEY,"
+            "body blob,"
+            "size integer,"
+            "expires real,"
+            "etag text,"
+            "last_modified text)")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS final_gameweeks ("
+            "id integer PRIMARY KEY)")
+        self._connection.commit()
+
+        self._final_gameweeks.update(
+            row[0] for row in self._connection.execute(
+                "SELECT id FROM final_gameweeks"))
+        self.purge()
+
+    def get(self, url):
+        if url not in self._entries:
+            self._load(url)
+        return super().get(url)
+
+    def get_validators(self, url):
+        if url not in self._entries:
+            self._load(url)
+        return super().get_validators(url)
+
+    def revalidate(self, url, endpoint=None, arguments=()):
+        data = super().revalidate(url, endpoint, arguments)
+        if data is not None:
+            self._connection.execute(
+                "UPDATE responses SET expires=? WHERE url=?",
+                (self._to_time(self._entries[url].expires), url))
+            self._connection.commit()
+        return data
+
+    def set(self, url, data, size, endpoint=None, arguments=(), etag=None,
+            last_modified=None, body=None):
+        super().set(url, data, size, endpoint, arguments, etag,
+                    last_modified, body)
+
+        entry = self._entries.get(url)
+        if entry is None or entry.data is not data:
+            return
+
+        if body is None:
+            body = json.dumps(data).encode()
+
+        self._connection.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+            (url, zlib.compress(body, self.compression_level), size,
+             self._to_time(entry.expires), etag, last_modified))
+        self._connection.commit()
+
+    def invalidate(self, url):
+        super().invalidate(url)
+        self._connection.execute("DELETE FROM responses WHERE url=?", (url,))
+        self._connection.commit()
+
+    def clear(self):
+        super().clear()
+        self._connection.execute("DELETE FROM responses")
+        self._connection.commit()
+
+    def purge(self):
+        """Removes expired responses that cannot be revalidated from the
+        database.
+        """
+        self._connection.execute(
+            "DELETE FROM responses WHERE expires < ? AND etag IS NULL AND "
+            "last_modified IS NULL", (time.time(),))
+        self._connection.commit()
+
+    def close(self):
+        """Closes the connection to the database."""
+        self._connection.close()
+
+    def _update_final_gameweeks(self, events):
+        super()._update_final_gameweeks(events)
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO final_gameweeks VALUES (?)",
+            [(gameweek,) for gameweek in self._final_gameweeks])
+        self._connection.commit()
+
+    def _load(self, url):
+        """Copies the response of the given URL from the database into
+        memory, if it's stored there.
+        """
+        row = self._connection.execute(
+            "SELECT body, size, expires, etag, last_modified FROM responses "
+            "WHERE url=?", (url,)).fetchone()
+        if row is None:
+            return
+
+        body, size, expires, etag, last_modified = row
+        data = loads(zlib.decompress(body))
+        if expires is not None:
+            expires = time.monotonic() + expires - time.time()
+
+        self._entries[url] = _CacheEntry(
+            data, size, expires, etag, last_modified)
+        self._size += size
+        self._evict()
+
+    @staticmethod
+    def _to_time(expires):
+        """Converts an expiry time of :func:`time.monotonic` to one of
+        :func:`time.time`, which is comparable between processes.
+        """
+        if expires is None:
+            return None
+        return time.time() + expires - time.monotonic()
+
+
+DEFAULT_CACHE = ResponseCache()
@@ -8,6 +8,7 @@ from prettytable import PrettyTable
 
 from fpl import FPL
 
+from .cache import PersistentCache
 from .constants import MYTEAM_FORMAT, PICKS_FORMAT
 from .utils import chip_converter, coroutine, position_converter
 
@@ -15,6 +16,7 @@ data_directory = user_data_dir("fpl", "fpl")
 os.makedirs(data_directory, exist_ok=True)
 sql_file = os.path.join(data_directory, "fpl.sqlite")
 connection = sqlite3.connect(sql_file)
+response_cache = PersistentCache(os.path.join(data_directory, "cache.sqlite"))
 
 
 class HiddenPassword(object):
@@ -55,7 +57,7 @@ async def get_picks(team):
     """
     player_ids = [player["element"] for player in team]
     async with aiohttp.ClientSession() as session:
-        fpl = FPL(session)
+        fpl = await FPL.create(session, cache=response_cache)
         players = await fpl.get_players(player_ids)
 
     for player_data in team:
@@ -233,7 +235,7 @@ async def myteam(user_id, email, password):
         password = password.password
 
     async with aiohttp.ClientSession() as session:
-        fpl = FPL(session)
+        fpl = await FPL.create(session, cache=response_cache)
         await fpl.login(email, password)
         try:
             user = await fpl.get_user(user_id)
@@ -315,7 +317,7 @@ async def format_picks(user):
 async def picks(user_id):
     """Echoes a user's picks to the terminal."""
     async with aiohttp.ClientSession() as session:
-        fpl = FPL(session)
+        fpl = await FPL.create(session, cache=response_cache)
         user = await fpl.get_user(user_id)
         await format_picks(user)
 
@@ -370,7 +372,7 @@ async def importaccount(user_id, email, password):
                 user_id))
 
         async with aiohttp.ClientSession() as session:
-            fpl = FPL(session)
+            fpl = await FPL.create(session, cache=response_cache)
             # Check if log in possible with provided email and password
             try:
                 await fpl.login(email, password)
@@ -30,5 +30,10 @@ API_URLS = {
 PICKS_FORMAT = "{} {}{}"
 MYTEAM_FORMAT = "{}{}"
 
+DEFAULT_MAX_CONCURRENCY = 25
+
+# Responses of at least this many bytes are decoded outside the event loop.
+DEFAULT_DECODE_THRESHOLD = 256 * 1024
+
 MIN_GAMEWEEK = 1
 MAX_GAMEWEEK = 47
\ No newline at end of file
@@ -0,0 +1,176 @@
+from collections import namedtuple
+
+from .utils import fetch, loads, match_endpoint
+
+
+class Record(object):
+    """The base class of the records, compact and immutable named tuples
+    holding the fields of an API object that are used the most. Fields that
+    are missing from an object are ``None``.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, information):
+        """Returns the record of the given object, ignoring the fields that
+        the record doesn't have.
+
+        :param dict information: The object, e.g. a player.
+        """
+        return cls._make(map(information.get, cls._fields))
+
+
+class Element(Record, namedtuple("Element", [
+        "id", "web_name", "first_name", "second_name", "team",
+        "element_type", "status", "now_cost", "total_points", "event_points",
+        "minutes", "goals_scored", "assists", "clean_sheets", "bonus", "bps",
+        "form", "points_per_game", "selected_by_percent"])):
+    """A player of https://fantasy.premierleague.com/api/bootstrap-static/.
+    """
+
+    __slots__ = ()
+
+
+class Team(Record, namedtuple("Team", [
+        "id", "name", "short_name", "code", "strength",
+        "strength_overall_home", "strength_overall_away",
+        "strength_attack_home", "strength_attack_away",
+        "strength_defence_home", "strength_defence_away"])):
+    """A team of https://fantasy.premierleague.com/api/bootstrap-static/."""
+
+    __slots__ = ()
+
+
+class Event(Record, namedtuple("Event", [
+        "id", "name", "deadline_time", "finished", "is_previous",
+        "is_current", "is_next", "average_entry_score", "highest_score"])):
+    """A gameweek of https://fantasy.premierleague.com/api/bootstrap-static/.
+    """
+
+    __slots__ = ()
+
+
+class Fixture(Record, namedtuple("Fixture", [
+        "id", "event", "kickoff_time", "team_h", "team_a", "team_h_score",
+        "team_a_score", "team_h_difficulty", "team_a_difficulty", "started",
+        "finished", "finished_provisional", "minutes", "stats"])):
+    """A fixture of https://fantasy.premierleague.com/api/fixtures/."""
+
+    __slots__ = ()
+
+
+class LiveElement(Record, namedtuple("LiveElement", "id stats explain")):
+    """A player of https://fantasy.premierleague.com/api/event/1/live."""
+
+    __slots__ = ()
+
+
+class Pick(Record, namedtuple("Pick", [
+        "element", "position", "multiplier", "is_captain",
+        "is_vice_captain"])):
+    """A pick of a user's team in a gameweek, as in
+    https://fantasy.premierleague.com/api/entry/91928/event/1/picks/.
+    """
+
+    __slots__ = ()
+
+
+class History(Record, namedtuple("History", [
+        "event", "points", "total_points", "rank", "overall_rank", "bank",
+        "value", "event_transfers", "event_transfers_cost",
+        "points_on_bench"])):
+    """A gameweek of a user's history, as in
+    https://fantasy.premierleague.com/api/entry/91928/history/.
+    """
+
+    __slots__ = ()
+
+
+class StandingsRow(Record, namedtuple("StandingsRow", [
+        "id", "entry", "entry_name", "player_name", "rank", "last_rank",
+        "rank_sort", "total", "event_total"])):
+    """A row of the standings of a league, as in
+    https://fantasy.premierleague.com/api/leagues-classic/1137/standings/.
+    """
+
+    __slots__ = ()
+
+
+#: Maps the name of each ``API_URLS`` endpoint that has records to the path
+#: of each list of objects in its response and their record.
+SCHEMAS = {
+    "static": {"elements": (("elements",), Element),
+               "teams": (("teams",), Team),
+               "events": (("events",), Event)},
+    "gameweeks": {"events": ((), Event)},
+    "fixtures": {"fixtures": ((), Fixture)},
+    "gameweek_fixtures": {"fixtures": ((), Fixture)},
+    "gameweek_live": {"elements": (("elements",), LiveElement)},
+    "user_picks": {"picks": (("picks",), Pick)},
+    "user_history": {"current": (("current",), History)},
+    "league_classic": {"standings": (("standings", "results"),
+                                     StandingsRow)},
+    "league_h2h": {"standings": (("standings", "results"), StandingsRow)}
+}
+
+
+def to_records(data, endpoint):
+    """Returns the records of the given response of an ``API_URLS`` endpoint,
+    as a ``dict`` mapping the name of each list of objects in the response
+    to a list of records (see :data:`SCHEMAS`).
+
+    Basic usage::
+
+      >>> from fpl.decoding import to_records
+      >>> records = to_records(static, "static")
+      >>> records["elements"][0].web_name
+      'Cech'
+
+    :param data: The response.
+    :type data: dict or list
+    :param string endpoint: The name of the endpoint, e.g. ``"static"``.
+    :rtype: dict
+    :raises ValueError: if the endpoint has no records
+    """
+    try:
+        schema = SCHEMAS[endpoint]
+    except KeyError:
+        raise ValueError(f"Endpoint {endpoint} has no records")
+
+    records = {}
+    for name, (path, record) in schema.items():
+        objects = data
+        for key in path:
+            objects = objects[key]
+        from_dict = record.from_dict
+        records[name] = [from_dict(information) for information in objects]
+    return records
+
+
+def decode(body, endpoint):
+    """Decodes the given body of a response of an ``API_URLS`` endpoint into
+    records (see :func:`to_records`), using :func:`loads
+    <fpl.utils.loads>`.
+
+    :param body: The body.
+    :type body: bytes or string
+    :param string endpoint: The name of the endpoint, e.g. ``"static"``.
+    :rtype: dict
+    :raises ValueError: if the endpoint has no records
+    """
+    return to_records(loads(body), endpoint)
+
+
+async def fetch_records(session, url):
+    """Returns the records of the response of a GET request to the given URL
+    of an ``API_URLS`` endpoint (see :func:`to_records`), fetched with
+    :func:`fetch <fpl.utils.fetch>`.
+
+    :param aiohttp.ClientSession session: A session.
+    :param string url: The URL.
+    :rtype: dict
+    :raises ValueError: if the URL's endpoint has no records
+    """
+    endpoint, _ = match_endpoint(url)
+    return to_records(await fetch(session, url), endpoint)
@@ -0,0 +1,244 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .utils import team_converter
+
+#: The difficulty of a blank gameweek, i.e. the highest difficulty, so teams
+#: with a blank gameweek don't rank as having the easiest fixtures.
+BLANK_DIFFICULTY = 5.0
+
+
+class DifficultyMatrix:
+    """The fixture difficulty of every team in every gameweek, as NumPy
+    arrays shaped ``(team, gameweek)``, so e.g. the easiest next ``N``
+    gameweeks of every team are computed as whole-array operations. Requires
+    NumPy, which can be installed with ``pip install fpl[numpy]``.
+
+    Teams are indexed by ID - 1 and gameweeks by ID - 1. The difficulties of
+    a team's fixtures in a double gameweek are summed, and blank gameweeks
+    are ``nan``; ``counts`` holds the number of fixtures of each team in each
+    gameweek.
+
+    Basic usage::
+
+      >>> from fpl import FPL
+      >>> import aiohttp
+      >>> import asyncio
+      >>>
+      >>> async def main():
+      ...     async with aiohttp.ClientSession() as session:
+      ...         fpl = await FPL.create(session)
+      ...         matrix = await fpl.get_difficulty_matrix()
+      ...     return matrix.get_easiest(fpl.current_gameweek + 1, 6)
+      ...
+      >>> easiest_teams = asyncio.run(main())
+
+    :param numpy.ndarray difficulty: The summed difficulty of each team's
+        fixtures per gameweek, ``nan`` if they have none.
+    :param numpy.ndarray counts: The number of fixtures of each team per
+        gameweek.
+    :raises ImportError: NumPy is not installed
+    """
+
+    def __init__(self, difficulty, counts):
+        if np is None:
+            raise ImportError(
+                "DifficultyMatrix requires NumPy, install it with "
+                "`pip install fpl[numpy]`.")
+
+        self.difficulty = difficulty
+        self.counts = counts
+
+    @classmethod
+    def from_fixtures(cls, fixtures, teams=20, gameweeks=None):
+        """Builds the matrix of the official difficulty
+        (``team_h_difficulty`` and ``team_a_difficulty``) of the given
+        fixtures. Fixtures without a gameweek are left out.
+
+        :param fixtures: The fixtures, e.g. a
+            :class:`FixtureStore <fpl.fixture_store.FixtureStore>`.
+        :param int teams: (optional) The number of teams. Defaults to ``20``.
+        :param int gameweeks: (optional) The number of gameweeks. Defaults
+            to the last gameweek of the fixtures.
+        :rtype: :class:`DifficultyMatrix`
+        """
+        rows = []
+        for fixture in fixtures:
+            if fixture.get("event") is None:
+                continue
+            rows.append((fixture["team_h"], fixture["event"],
+                         fixture["team_h_difficulty"]))
+            rows.append((fixture["team_a"], fixture["event"],
+                         fixture["team_a_difficulty"]))
+        return cls._from_rows(rows, teams, gameweeks)
+
+    @classmethod
+    def from_fdr(cls, fixtures, fdr, position="all", teams=20,
+                 gameweeks=None):
+        """Builds the matrix of the difficulty of the given fixtures according
+        to the given FDR, i.e. the FDR of each team's opponent for the given
+        position. Since the FDR's ``"H"`` and ``"A"`` are the difficulty of
+        playing the opponent for players playing at home and away, a team
+        playing at home gets its opponent's ``"H"`` FDR. Opponents without an
+        FDR get the neutral difficulty ``3.0``.
+
+        :param fixtures: The fixtures, e.g. a
+            :class:`FixtureStore <fpl.fixture_store.FixtureStore>`.
+        :param dict fdr: The FDR, as returned by :meth:`FPL.FDR
+            <fpl.FPL.FDR>`.
+        :param string position: (optional) The position, e.g.
+            ``"midfielder"``. Defaults to ``"all"``.
+        :param int teams: (optional) The number of teams. Defaults to ``20``.
+        :param int gameweeks: (optional) The number of gameweeks. Defaults
+            to the last gameweek of the fixtures.
+        :rtype: :class:`DifficultyMatrix`
+        """
+        def get_difficulty(opponent, location):
+            try:
+                return fdr[team_converter(opponent)][position][location]
+            except KeyError:
+                return 3.0
+
+        rows = []
+        for fixture in fixtures:
+            if fixture.get("event") is None:
+                continue
+            rows.append((fixture["team_h"], fixture["event"],
+                         get_difficulty(fixture["team_a"], "H")))
+            rows.append((fixture["team_a"], fixture["event"],
+                         get_difficulty(fixture["team_h"], "A")))
+        return cls._from_rows(rows, teams, gameweeks)
+
+    @classmethod
+    def _from_rows(cls, rows, teams, gameweeks):
+        """Builds the matrix from ``(team, gameweek, difficulty)`` rows."""
+        if np is None:
+            raise ImportError(
+                "DifficultyMatrix requires NumPy, install it with "
+                "`pip install fpl[numpy]`.")
+
+        rows = np.array(rows, dtype=np.float64).reshape(-1, 3)
+        last_gameweek = int(rows[:, 1].max()) if len(rows) else 0
+        if gameweeks is None:
+            gameweeks = last_gameweek
+        elif gameweeks < last_gameweek:
+            raise ValueError(
+                f"The fixtures include gameweek {last_gameweek}, but "
+                f"gameweeks is {gameweeks}.")
+
+        indices = (rows[:, 0].astype(np.int64) - 1,
+                   rows[:, 1].astype(np.int64) - 1)
+
+        difficulty = np.zeros((teams, gameweeks), dtype=np.float64)
+        counts = np.zeros((teams, gameweeks), dtype=np.int64)
+        np.add.at(difficulty, indices, rows[:, 2])
+        np.add.at(counts, indices, 1)
+        difficulty[counts == 0] = np.nan
+        return cls(difficulty, counts)
+
+    @property
+    def is_blank(self):
+        """Whether each team has no fixtures in each gameweek.
+
+        :rtype: numpy.ndarray
+        """
+        return self.counts == 0
+
+    @property
+    def is_double(self):
+        """Whether each team has more than one fixture in each gameweek.
+
+        :rtype: numpy.ndarray
+        """
+        return self.counts > 1
+
+    def _get_cumulative(self, blank_difficulty, per_fixture):
+        """Returns the cumulative difficulty (and number of fixtures) along
+        the gameweek axis, with a leading column of zeros.
+        """
+        difficulty = np.where(
+            self.is_blank, 0.0 if per_fixture else blank_difficulty,
+            self.difficulty)
+        zeros = np.zeros((len(difficulty), 1))
+        cumulative = np.concatenate(
+            [zeros, np.cumsum(difficulty, axis=1)], axis=1)
+        counts = np.concatenate(
+            [zeros, np.cumsum(self.counts, axis=1)], axis=1)
+        return cumulative, counts
+
+    def get_rolling(self, number_of_gameweeks,
+                    blank_difficulty=BLANK_DIFFICULTY, per_fixture=False):
+        """Returns the difficulty of every window of ``number_of_gameweeks``
+        consecutive gameweeks of every team, shaped ``(team, first
+        gameweek)``, i.e. column ``i`` is the window starting at gameweek
+        ``i + 1``.
+
+        :param int number_of_gameweeks: The number of gameweeks in a window.
+        :param float blank_difficulty: (optional) The difficulty of a blank
+            gameweek. Defaults to :data:`BLANK_DIFFICULTY`.
+        :param bool per_fixture: (optional) Returns the average difficulty
+            per fixture instead of the total if ``True``, ignoring blank
+            gameweeks, so windows without fixtures are ``nan``. Defaults to
+            ``False``.
+        :rtype: numpy.ndarray
+        """
+        if number_of_gameweeks < 1:
+            raise ValueError("number_of_gameweeks must be at least 1.")
+
+        cumulative, counts = self._get_cumulative(
+            blank_difficulty, per_fixture)
+        totals = (cumulative[:, number_of_gameweeks:] -
+                  cumulative[:, :-number_of_gameweeks])
+        if not per_fixture:
+            return totals
+
+        fixtures = (counts[:, number_of_gameweeks:] -
+                    counts[:, :-number_of_gameweeks])
+        return np.divide(totals, fixtures,
+                         out=np.full_like(totals, np.nan), where=fixtures > 0)
+
+    def get_window(self, first_gameweek, number_of_gameweeks,
+                   blank_difficulty=BLANK_DIFFICULTY, per_fixture=False):
+        """Returns the difficulty of the ``number_of_gameweeks`` gameweeks
+        starting at ``first_gameweek`` of every team. Windows running past
+        the last gameweek are cut short, and windows starting after it (e.g.
+        after the season's last gameweek) are ``nan``.
+
+        See :meth:`get_rolling` for the other parameters.
+
+        :param int first_gameweek: The ID of the first gameweek.
+        :param int number_of_gameweeks: The number of gameweeks.
+        :rtype: numpy.ndarray
+        :raises ValueError: if ``first_gameweek`` is less than 1
+        """
+        if first_gameweek < 1:
+            raise ValueError("first_gameweek must be at least 1.")
+        if number_of_gameweeks < 1:
+            raise ValueError("number_of_gameweeks must be at least 1.")
+        if first_gameweek > self.difficulty.shape[1]:
+            return np.full(len(self.difficulty), np.nan)
+
+        last_gameweek = min(first_gameweek + number_of_gameweeks - 1,
+                            self.difficulty.shape[1])
+        rolling = self.get_rolling(
+            last_gameweek - first_gameweek + 1, blank_difficulty, per_fixture)
+        return rolling[:, first_gameweek - 1]
+
+    def get_easiest(self, first_gameweek, number_of_gameweeks,
+                    blank_difficulty=BLANK_DIFFICULTY, per_fixture=False):
+        """Returns the IDs of all teams, ordered from the easiest to the
+        hardest ``number_of_gameweeks`` gameweeks starting at
+        ``first_gameweek`` (see :meth:`get_window`). Teams without a
+        difficulty (``nan``) come last.
+
+        See :meth:`get_rolling` for the other parameters.
+
+        :param int first_gameweek: The ID of the first gameweek.
+        :param int number_of_gameweeks: The number of gameweeks.
+        :rtype: numpy.ndarray
+        """
+        window = self.get_window(first_gameweek, number_of_gameweeks,
+                                 blank_difficulty, per_fixture)
+        return np.argsort(window, kind="stable") + 1
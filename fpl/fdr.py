@@ -0,0 +1,389 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .utils import position_converter, scale, team_converter
+
+#: The positions of the FDR, where ``"all"`` includes every position.
+POSITIONS = ("all", "goalkeeper", "defender", "midfielder", "forward")
+
+LOCATIONS = ("H", "A")
+
+
+class FDREngine:
+    """Maintains the points scored against each team, per position and
+    location, as running totals and counts, from which it computes the same
+    Fixture Difficulty Ranking (FDR) as :meth:`FPL.FDR <fpl.FPL.FDR>`.
+
+    Players' history rows are ingested incrementally: a row that was ingested
+    before only changes the totals if its points changed (e.g. after bonus
+    points were added), so after a gameweek only the summaries of players who
+    played have to be ingested again, e.g. those refreshed by a
+    :class:`SummaryRefresher <fpl.refresh.SummaryRefresher>`. The FDR is
+    computed in O(teams × positions) the first time it's read after a change.
+
+    Basic usage::
+
+      >>> from fpl import FPL
+      >>> from fpl.fdr import FDREngine
+      >>> from fpl.refresh import SummaryRefresher
+      >>> import aiohttp
+      >>> import asyncio
+      >>>
+      >>> async def main():
+      ...     async with aiohttp.ClientSession() as session:
+      ...         fpl = await FPL.create(session)
+      ...         refresher = SummaryRefresher(session)
+      ...         engine = FDREngine()
+      ...         refreshed = await refresher.refresh(fpl.elements)
+      ...         engine.ingest_summaries(
+      ...             fpl.elements, refresher.summaries, refreshed)
+      ...     return engine.get_fdr()
+      ...
+      >>> fdr = asyncio.run(main())
+    """
+
+    def __init__(self):
+        # Maps (team, position, location) to [total points, number of rows]
+        self._totals = {}
+        # Maps (player ID, fixture ID) to the key and points of the row's
+        # contribution to the totals
+        self._rows = {}
+        self._fdr = None
+
+    def __len__(self):
+        return len(self._rows)
+
+    def ingest(self, player, history):
+        """Adds the given history rows of a player to the totals, replacing
+        the rows of the same fixtures ingested before. Rows in which the
+        player didn't play are ignored.
+
+        :param dict player: The player, with at least their ``id`` and
+            ``element_type``.
+        :param list history: The player's history rows, taken from their
+            summary.
+        """
+        position = position_converter(player["element_type"]).lower()
+        for fixture in history:
+            key = (player["id"], fixture["fixture"])
+            if fixture["minutes"] == 0:
+                self._remove(key)
+                continue
+
+            opponent = team_converter(fixture["opponent_team"])
+            location = "H" if fixture["was_home"] else "A"
+            row = ((opponent, position, location), fixture["total_points"])
+            if self._rows.get(key) == row:
+                continue
+
+            self._remove(key)
+            self._rows[key] = row
+            self._add(row, 1)
+
+    def ingest_summaries(self, elements, summaries, player_ids=None):
+        """Ingests the history of the given players' summaries.
+
+        :param dict elements: The players, keyed by ID like ``FPL.elements``.
+        :param dict summaries: The players' summaries, keyed by ID.
+        :param player_ids: (optional) The IDs of the players to ingest.
+            Defaults to all players in ``summaries``.
+        :type player_ids: list or set
+        """
+        if player_ids is None:
+            player_ids = summaries
+
+        for player_id in player_ids:
+            self.ingest(elements[player_id], summaries[player_id]["history"])
+
+    def remove_player(self, player_id):
+        """Removes all rows of the given player from the totals.
+
+        :param int player_id: A player's ID.
+        """
+        for key in [key for key in self._rows if key[0] == player_id]:
+            self._remove(key)
+
+    def _remove(self, key):
+        row = self._rows.pop(key, None)
+        if row is not None:
+            self._add(row, -1)
+
+    def _add(self, row, sign):
+        (opponent, position, location), points = row
+        for key in ((opponent, "all", location),
+                    (opponent, position, location)):
+            totals = self._totals.setdefault(key, [0, 0])
+            totals[0] += sign * points
+            totals[1] += sign
+            if not totals[1]:
+                del self._totals[key]
+        self._fdr = None
+
+    def get_average_points_against(self):
+        """Returns the average points scored against each team, per position
+        and location, like the averages :meth:`FPL.FDR <fpl.FPL.FDR>` is
+        based on.
+
+        :rtype: dict
+        """
+        teams = {team for team, _, _ in self._totals}
+        average_points = {}
+        for team in teams:
+            average_points[team] = {}
+            for position in POSITIONS:
+                average_points[team][position] = {}
+                for location in LOCATIONS:
+                    total, count = self._totals.get(
+                        (team, position, location), (0, 0))
+                    average_points[team][position][location] = (
+                        total / float(count) if count else 0.0)
+        return average_points
+
+    def get_fdr(self):
+        """Returns the FDR of each team, per position and location, scaled
+        between 1.0 and 5.0, in the same format as
+        :meth:`FPL.FDR <fpl.FPL.FDR>`.
+
+        :rtype: dict
+        """
+        if self._fdr is None:
+            self._fdr = self._calculate_fdr()
+
+        return {team: {position: dict(locations)
+                       for position, locations in positions.items()}
+                for team, positions in self._fdr.items()}
+
+    def _calculate_fdr(self):
+        average_points = self.get_average_points_against()
+
+        for position in POSITIONS:
+            for location in LOCATIONS:
+                values = [positions[position][location]
+                          for positions in average_points.values()]
+                if not values:
+                    continue
+
+                min_, max_ = min(values), max(values)
+                for positions in average_points.values():
+                    value = positions[position][location]
+                    # Every team is equally difficult if they all conceded
+                    # the same number of points.
+                    positions[position][location] = (
+                        scale(value, 5.0, 1.0, min_, max_)
+                        if max_ > min_ else 3.0)
+
+        return average_points
+
+
+class PointsAgainstTensor:
+    """The points scored against each team as NumPy arrays shaped
+    ``(team, position, location, gameweek)``, so averages, extrema and the
+    scaled FDR are computed as whole-array operations, for any window of
+    gameweeks. Requires NumPy, which can be installed with
+    ``pip install fpl[numpy]``.
+
+    Teams are indexed by ID - 1, positions by ``element_type`` - 1 (see
+    :data:`POSITIONS` for the order of the positions of the FDR, which
+    includes ``"all"``), locations by home (0) and away (1), and gameweeks by
+    ID - 1.
+
+    Basic usage::
+
+      >>> from fpl import FPL
+      >>> from fpl.fdr import PointsAgainstTensor
+      >>> import aiohttp
+      >>> import asyncio
+      >>>
+      >>> async def main():
+      ...     async with aiohttp.ClientSession() as session:
+      ...         fpl = await FPL.create(session)
+      ...         players = await fpl.get_players(
+      ...             include_summary=True, return_json=True)
+      ...     tensor = PointsAgainstTensor.from_players(players)
+      ...     return tensor.to_dict(tensor.get_fdr(tensor.get_last(6)))
+      ...
+      >>> fdr_last_6 = asyncio.run(main())
+
+    :param numpy.ndarray totals: The total points scored against each team.
+    :param numpy.ndarray counts: The number of history rows they were scored
+        in.
+    :raises ImportError: NumPy is not installed
+    """
+
+    def __init__(self, totals, counts):
+        if np is None:
+            raise ImportError(
+                "PointsAgainstTensor requires NumPy, install it with "
+                "`pip install fpl[numpy]`.")
+
+        self.totals = totals
+        self.counts = counts
+
+    @classmethod
+    def from_players(cls, players, teams=20, gameweeks=None):
+        """Builds the tensor from the history of the given players, who must
+        include their summary, e.g. those returned by
+        ``FPL.get_players(include_summary=True, return_json=True)``. Rows in
+        which the player didn't play are ignored.
+
+        :param list players: The players.
+        :param int teams: (optional) The number of teams. Defaults to ``20``.
+        :param int gameweeks: (optional) The number of gameweeks. Defaults
+            to the last gameweek of the history rows.
+        :rtype: :class:`PointsAgainstTensor`
+        """
+        return cls.from_histories(
+            ((player["element_type"], player["history"])
+             for player in players), teams, gameweeks)
+
+    @classmethod
+    def from_summaries(cls, elements, summaries, teams=20, gameweeks=None):
+        """Builds the tensor from players' summaries, e.g. those of a
+        :class:`SummaryRefresher <fpl.refresh.SummaryRefresher>`.
+
+        :param dict elements: The players, keyed by ID like ``FPL.elements``.
+        :param dict summaries: The players' summaries, keyed by ID.
+        :param int teams: (optional) The number of teams. Defaults to ``20``.
+        :param int gameweeks: (optional) The number of gameweeks. Defaults
+            to the last gameweek of the history rows.
+        :rtype: :class:`PointsAgainstTensor`
+        """
+        return cls.from_histories(
+            ((elements[player_id]["element_type"], summary["history"])
+             for player_id, summary in summaries.items()), teams, gameweeks)
+
+    @classmethod
+    def from_histories(cls, histories, teams=20, gameweeks=None):
+        """Builds the tensor from ``(element_type, history)`` pairs.
+
+        :param histories: An iterable of ``(element_type, history)`` pairs.
+        :param int teams: (optional) The number of teams. Defaults to ``20``.
+        :param int gameweeks: (optional) The number of gameweeks. Defaults
+            to the last gameweek of the history rows.
+        :rtype: :class:`PointsAgainstTensor`
+        """
+        if np is None:
+            raise ImportError(
+                "PointsAgainstTensor requires NumPy, install it with "
+                "`pip install fpl[numpy]`.")
+
+        rows = [(fixture["opponent_team"] - 1, element_type - 1,
+                 0 if fixture["was_home"] else 1, fixture["round"] - 1,
+                 fixture["total_points"])
+                for element_type, history in histories
+                for fixture in history if fixture["minutes"] > 0]
+        rows = np.array(rows, dtype=np.int64).reshape(-1, 5)
+
+        last_gameweek = int(rows[:, 3].max()) + 1 if len(rows) else 0
+        if gameweeks is None:
+            gameweeks = last_gameweek
+        elif gameweeks < last_gameweek:
+            raise ValueError(
+                f"The history includes gameweek {last_gameweek}, but "
+                f"gameweeks is {gameweeks}.")
+
+        shape = (teams, len(POSITIONS) - 1, len(LOCATIONS), gameweeks)
+        totals = np.zeros(shape, dtype=np.float64)
+        counts = np.zeros(shape, dtype=np.int64)
+        indices = tuple(rows[:, :4].T)
+        np.add.at(totals, indices, rows[:, 4])
+        np.add.at(counts, indices, 1)
+        return cls(totals, counts)
+
+    def get_last(self, number_of_gameweeks, current_gameweek=None):
+        """Returns the IDs of the last ``number_of_gameweeks`` gameweeks up
+        to and including ``current_gameweek``, which defaults to the last
+        gameweek with any points.
+
+        :param int number_of_gameweeks: The number of gameweeks.
+        :param int current_gameweek: (optional) The last gameweek.
+        :rtype: range
+        """
+        if current_gameweek is None:
+            played = np.flatnonzero(self.counts.sum(axis=(0, 1, 2)))
+            current_gameweek = int(played[-1]) + 1 if len(played) else 0
+        first = max(1, current_gameweek - number_of_gameweeks + 1)
+        return range(first, current_gameweek + 1)
+
+    def _sum(self, gameweeks):
+        """Returns the totals and counts summed over the given gameweeks,
+        with ``"all"`` positions prepended to the position axis.
+        """
+        totals, counts = self.totals, self.counts
+        if gameweeks is not None:
+            # Gameweeks after the last one have no points yet
+            indices = np.asarray(gameweeks, dtype=np.int64) - 1
+            indices = indices[indices < totals.shape[-1]]
+            totals, counts = totals[..., indices], counts[..., indices]
+
+        totals, counts = totals.sum(axis=-1), counts.sum(axis=-1)
+        totals = np.concatenate(
+            [totals.sum(axis=1, keepdims=True), totals], axis=1)
+        counts = np.concatenate(
+            [counts.sum(axis=1, keepdims=True), counts], axis=1)
+        return totals, counts
+
+    def get_average_points_against(self, gameweeks=None):
+        """Returns the average points scored against each team, shaped
+        ``(team, position, location)`` with positions ordered like
+        :data:`POSITIONS`. Teams without any points in the gameweeks are
+        ``nan``, positions without any points of the other teams ``0``, like
+        :meth:`FDREngine.get_average_points_against`.
+
+        :param gameweeks: (optional) The IDs of the gameweeks, e.g.
+            ``range(1, 7)``. Defaults to all gameweeks.
+        :rtype: numpy.ndarray
+        """
+        totals, counts = self._sum(gameweeks)
+        averages = np.zeros_like(totals)
+        np.divide(totals, counts, out=averages, where=counts > 0)
+        averages[counts[:, 0].sum(axis=-1) == 0] = np.nan
+        return averages
+
+    def get_fdr(self, gameweeks=None):
+        """Returns the FDR of each team, shaped ``(team, position,
+        location)``, scaled between 1.0 and 5.0 like :meth:`FPL.FDR
+        <fpl.FPL.FDR>`. Teams without any points in the gameweeks are
+        ``nan``.
+
+        :param gameweeks: (optional) The IDs of the gameweeks, e.g.
+            ``tensor.get_last(6)``. Defaults to all gameweeks.
+        :rtype: numpy.ndarray
+        """
+        averages = self.get_average_points_against(gameweeks)
+        fdr = np.full_like(averages, np.nan)
+        if np.isnan(averages).all():
+            return fdr
+
+        min_ = np.nanmin(averages, axis=0)
+        max_ = np.nanmax(averages, axis=0)
+        spread = max_ - min_
+        scaled = np.divide(averages - min_, spread,
+                           out=np.full_like(averages, 0.5), where=spread > 0)
+        # Every team is equally difficult if they all conceded the same
+        # number of points.
+        fdr = 5.0 - 4.0 * scaled
+        fdr[np.isnan(averages)] = np.nan
+        return fdr
+
+    @staticmethod
+    def to_dict(values):
+        """Converts an array shaped ``(team, position, location)``, e.g. the
+        FDR, to the ``dict`` format of :meth:`FPL.FDR <fpl.FPL.FDR>`,
+        leaving out teams whose values are ``nan``.
+
+        :param numpy.ndarray values: The array.
+        :rtype: dict
+        """
+        result = {}
+        for team_index, positions in enumerate(values):
+            if np.isnan(positions).all():
+                continue
+
+            result[team_converter(team_index + 1)] = {
+                position: dict(zip(LOCATIONS, map(float, locations)))
+                for position, locations in zip(POSITIONS, positions)
+            }
+        return result
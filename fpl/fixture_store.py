@@ -0,0 +1,283 @@
+import asyncio
+from datetime import datetime, timezone
+
+from .constants import API_URLS
+from .utils import fetch
+
+
+_store = None
+
+
+def get_fixture_store(fixtures):
+    """Returns the :class:`FixtureStore` of the given (e.g. cached) response
+    of https://fantasy.premierleague.com/api/fixtures/, building it if it
+    isn't the response the last store was built from.
+
+    :param list fixtures: The fixtures.
+    :rtype: :class:`FixtureStore`
+    """
+    global _store
+    store = _store
+    if store is None or store.source is not fixtures:
+        store = FixtureStore(fixtures)
+        _store = store
+    return store
+
+
+def get_kickoff_date(fixture):
+    """Returns the (UTC) date of the given fixture's kickoff, or ``None`` if
+    it hasn't been scheduled yet.
+
+    :param dict fixture: A fixture.
+    :rtype: datetime.date or None
+    """
+    kickoff_time = fixture.get("kickoff_time")
+    if not kickoff_time:
+        return None
+
+    kickoff_time = datetime.strptime(kickoff_time, "%Y-%m-%dT%H:%M:%SZ")
+    return kickoff_time.replace(tzinfo=timezone.utc).date()
+
+
+class FixtureStore:
+    """The fixtures of the season, indexed by ID, gameweek, team and kickoff
+    date, built from a single download of
+    https://fantasy.premierleague.com/api/fixtures/.
+
+    The fixtures of gameweeks that are in progress can be refreshed without
+    downloading all fixtures again, using :meth:`refresh_gameweek` or
+    :meth:`refresh_live`.
+
+    Basic usage::
+
+      >>> from fpl.fixture_store import FixtureStore
+      >>> import aiohttp
+      >>> import asyncio
+      >>>
+      >>> async def main():
+      ...     async with aiohttp.ClientSession() as session:
+      ...         store = await FixtureStore.load(session)
+      ...         await store.refresh_live(session)
+      ...     return store.get_fixtures(team=14, gameweeks=range(1, 6))
+      ...
+      >>> fixtures = asyncio.run(main())
+
+    The fixtures are taken from the (possibly cached) responses and must not
+    be modified.
+
+    :param list fixtures: (optional) The fixtures.
+    """
+
+    def __init__(self, fixtures=()):
+        #: The response the store was built from, if any.
+        self.source = fixtures
+        self._fixtures = {}
+        self._by_gameweek = {}
+        self._by_team = {}
+        self._by_date = {}
+        self.update(fixtures)
+
+    @classmethod
+    async def load(cls, session):
+        """Returns a store of all fixtures, downloaded with the given session.
+
+        :param aiohttp.ClientSession session: A session.
+        :rtype: :class:`FixtureStore`
+        """
+        return cls(await fetch(session, API_URLS["fixtures"]))
+
+    def __len__(self):
+        return len(self._fixtures)
+
+    def __iter__(self):
+        return iter(self._sort(self._fixtures))
+
+    def __contains__(self, fixture_id):
+        try:
+            return int(fixture_id) in self._fixtures
+        except (TypeError, ValueError):
+            return False
+
+    def update(self, fixtures):
+        """Adds the given fixtures to the store, replacing those with the same
+        ID, e.g. after their gameweek's fixtures were downloaded again.
+
+        :param list fixtures: The fixtures.
+        """
+        for fixture in fixtures:
+            self._remove(fixture["id"])
+            self._fixtures[fixture["id"]] = fixture
+            for index, key in self._get_keys(fixture):
+                index.setdefault(key, set()).add(fixture["id"])
+
+    def _remove(self, fixture_id):
+        fixture = self._fixtures.pop(fixture_id, None)
+        if fixture is None:
+            return
+
+        for index, key in self._get_keys(fixture):
+            index[key].discard(fixture_id)
+            if not index[key]:
+                del index[key]
+
+    def _get_keys(self, fixture):
+        return ((self._by_gameweek, fixture.get("event")),
+                (self._by_team, fixture.get("team_h")),
+                (self._by_team, fixture.get("team_a")),
+                (self._by_date, get_kickoff_date(fixture)))
+
+    def _sort(self, fixture_ids):
+        """Returns the fixtures with the given IDs in order of kickoff, with
+        unscheduled fixtures last.
+        """
+        fixtures = [self._fixtures[fixture_id] for fixture_id in fixture_ids]
+        fixtures.sort(key=lambda fixture: (
+            fixture.get("kickoff_time") is None,
+            fixture.get("kickoff_time") or "", fixture["id"]))
+        return fixtures
+
+    def get(self, fixture_id):
+        """Returns the fixture with the given ID.
+
+        :param int fixture_id: The fixture's ID.
+        :rtype: dict
+        :raises ValueError: if fixture with ``fixture_id`` not found
+        """
+        try:
+            return self._fixtures[int(fixture_id)]
+        except KeyError:
+            raise ValueError(f"Fixture with ID {fixture_id} not found")
+
+    def get_fixtures(self, gameweek=None, team=None, date=None,
+                     gameweeks=None):
+        """Returns the fixtures matching all the given conditions, in order of
+        kickoff. Conditions that are ``None`` are ignored.
+
+        :param int gameweek: (optional) The fixtures' gameweek.
+        :param int team: (optional) The ID of a team playing in the fixtures.
+        :param datetime.date date: (optional) The (UTC) date of the fixtures'
+            kickoff.
+        :param gameweeks: (optional) The IDs of the fixtures' gameweeks, e.g.
+            ``range(1, 6)``.
+        :rtype: list
+        """
+        candidates = None
+        for index, key in ((self._by_gameweek, gameweek),
+                           (self._by_team, team),
+                           (self._by_date, date)):
+            if key is None:
+                continue
+
+            fixture_ids = index.get(key, set())
+            candidates = (fixture_ids if candidates is None
+                          else candidates & fixture_ids)
+
+        if gameweeks is not None:
+            fixture_ids = set().union(*(self._by_gameweek.get(gameweek, ())
+                                        for gameweek in gameweeks))
+            candidates = (fixture_ids if candidates is None
+                          else candidates & fixture_ids)
+
+        if candidates is None:
+            candidates = self._fixtures
+        return self._sort(candidates)
+
+    def get_team_fixtures(self, team_id, gameweeks=None):
+        """Returns the fixtures of the given team in order of kickoff, from
+        the team's point of view: each fixture is a copy with ``is_home``,
+        ``opponent``, the team's ``difficulty``, and ``is_double`` (whether
+        the team plays more than once in the fixture's gameweek) added.
+
+        :param int team_id: The team's ID.
+        :param gameweeks: (optional) The IDs of the fixtures' gameweeks.
+        :rtype: list
+        """
+        fixtures = self.get_fixtures(team=team_id, gameweeks=gameweeks)
+        fixtures_per_gameweek = {}
+        for fixture in fixtures:
+            gameweek = fixture.get("event")
+            fixtures_per_gameweek[gameweek] = (
+                fixtures_per_gameweek.get(gameweek, 0) + 1)
+
+        team_fixtures = []
+        for fixture in fixtures:
+            is_home = fixture["team_h"] == team_id
+            gameweek = fixture.get("event")
+            team_fixtures.append(dict(
+                fixture,
+                is_home=is_home,
+                opponent=fixture["team_a"] if is_home else fixture["team_h"],
+                difficulty=fixture.get(
+                    "team_h_difficulty" if is_home else "team_a_difficulty"),
+                is_double=(gameweek is not None and
+                           fixtures_per_gameweek[gameweek] > 1)))
+        return team_fixtures
+
+    def get_team_schedule(self, team_id, gameweeks=None):
+        """Returns the schedule of the given team: for each gameweek, its
+        fixtures (see :meth:`get_team_fixtures`) and whether it's a blank
+        (no fixtures) or double (more than one fixture) gameweek for the team.
+
+        :param int team_id: The team's ID.
+        :param gameweeks: (optional) The IDs of the gameweeks. Defaults to all
+            gameweeks with fixtures.
+        :rtype: list
+        """
+        if gameweeks is None:
+            gameweeks = self.get_gameweeks()
+
+        fixtures = {}
+        for fixture in self.get_team_fixtures(team_id, gameweeks):
+            fixtures.setdefault(fixture["event"], []).append(fixture)
+
+        schedule = []
+        for gameweek in gameweeks:
+            gameweek_fixtures = fixtures.get(gameweek, [])
+            schedule.append({
+                "event": gameweek,
+                "fixtures": gameweek_fixtures,
+                "is_blank": not gameweek_fixtures,
+                "is_double": len(gameweek_fixtures) > 1
+            })
+        return schedule
+
+    def get_gameweeks(self):
+        """Returns the IDs of the gameweeks with fixtures, in order.
+
+        :rtype: list
+        """
+        return sorted(gameweek for gameweek in self._by_gameweek
+                      if gameweek is not None)
+
+    def get_live_gameweeks(self):
+        """Returns the IDs of the gameweeks with fixtures that have started,
+        but whose points may still change.
+
+        :rtype: list
+        """
+        return sorted({fixture["event"] for fixture in self._fixtures.values()
+                       if fixture.get("started") and
+                       not fixture.get("finished")})
+
+    async def refresh_gameweek(self, session, gameweek):
+        """Downloads the fixtures of the given gameweek and updates the store
+        with them.
+
+        :param aiohttp.ClientSession session: A session.
+        :param int gameweek: The gameweek's ID.
+        """
+        fixtures = await fetch(
+            session, API_URLS["gameweek_fixtures"].format(gameweek))
+        self.update(fixtures)
+
+    async def refresh_live(self, session):
+        """Refreshes the fixtures of the gameweeks that are in progress (see
+        :meth:`get_live_gameweeks`), and returns their IDs.
+
+        :param aiohttp.ClientSession session: A session.
+        :rtype: list
+        """
+        gameweeks = self.get_live_gameweeks()
+        await asyncio.gather(*[self.refresh_gameweek(session, gameweek)
+                               for gameweek in gameweeks])
+        return gameweeks
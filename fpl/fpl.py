@@ -24,12 +24,18 @@ Fantasy Premier League API:
 * /transfers
 """
 import asyncio
-import itertools
 import os
 
 import requests
 
-from .constants import API_URLS
+from .bootstrap import index_static
+from .cache import DEFAULT_CACHE
+from .constants import API_URLS, DEFAULT_MAX_CONCURRENCY
+from .difficulty import DifficultyMatrix
+from .fdr import FDREngine
+from .fixture_store import get_fixture_store
+from .indexes import get_player_index
+from .live import LiveGameweek, poll_events
 from .models.classic_league import ClassicLeague
 from .models.fixture import Fixture
 from .models.gameweek import Gameweek
@@ -37,28 +43,147 @@ from .models.h2h_league import H2HLeague
 from .models.player import Player, PlayerSummary
 from .models.team import Team
 from .models.user import User
-from .utils import (average, fetch, get_current_user, logged_in,
-                    position_converter, scale, team_converter)
+from .utils import (fetch, get_current_user, logged_in, position_converter,
+                    set_default_session_options, set_session_options, stream,
+                    team_converter)
+
+
+# Marks the options of :class:`FPL` that weren't given.
+_default = object()
 
 
 class FPL:
-    """The FPL class."""
+    """The FPL class.
+
+    The options below are set for the session (see
+    :func:`set_session_options <fpl.utils.set_session_options>`), so they
+    are shared by all instances using it. Options that aren't given keep the
+    value they already have for the session.
+
+    Responses are cached (see ``cache``), by default in a cache shared by all
+    sessions of the process, so the ``dict``s returned with
+    ``return_json=True`` and the information wrapped by the models are shared
+    as well. They must not be modified; copy them first if needed, e.g. with
+    ``copy.deepcopy``.
+
+    :param aiohttp.ClientSession session: The session used for sending
+        requests.
+    :param retry_policy: (optional) The policy used for retrying failed
+        requests. Also used by all models created by this instance. If
+        ``None`` the session's policy is kept, which defaults to
+        :data:`DEFAULT_RETRY_POLICY <fpl.retry.DEFAULT_RETRY_POLICY>`.
+    :type retry_policy: :class:`RetryPolicy <fpl.retry.RetryPolicy>`
+    :param max_concurrency: (optional) The maximum number of requests sent
+        concurrently by this instance and all models created by it, e.g. when
+        fetching all players' summaries. An ``asyncio.Semaphore`` can be given
+        instead to share the limit between several sessions. If ``None`` the
+        number of concurrent requests is not limited. Defaults to the
+        session's limit, or ``DEFAULT_MAX_CONCURRENCY`` if it has none.
+    :type max_concurrency: int or asyncio.Semaphore
+    :param rate_limiter: (optional) Limits the number of requests per second
+        sent to each endpoint by this instance and all models created by it.
+        If ``None`` the session's rate limiter is kept.
+    :type rate_limiter: :class:`RateLimiter <fpl.rate_limit.RateLimiter>`
+    :param cache: (optional) The cache of API responses used by this instance
+        and all models created by it. If ``None`` responses are not cached.
+        Defaults to the session's cache, or the process-wide
+        :data:`fpl.cache.DEFAULT_CACHE` if none has been set.
+    :type cache: :class:`ResponseCache <fpl.cache.ResponseCache>`
+    """
+
+    def __init__(self, session, retry_policy=None, max_concurrency=_default,
+                 rate_limiter=None, cache=_default):
+        self._configure(session, retry_policy, max_concurrency, rate_limiter,
+                        cache)
+
+        # Blocks the event loop, use ``await FPL.create(session)`` instead
+        static = requests.get(API_URLS["static"]).json()
+        self._set_static(static)
+
+    @classmethod
+    async def create(cls, session, retry_policy=None, max_concurrency=_default,
+                     rate_limiter=None, cache=_default, bootstrap=None):
+        """Returns a new :class:`FPL` instance. Unlike ``FPL(session)``, which
+        downloads https://fantasy.premierleague.com/api/bootstrap-static/
+        synchronously, this doesn't block the event loop, and the download
+        uses the instance's cache, retry policy and limits.
+
+        Basic usage::
+
+          >>> from fpl import FPL
+          >>> import aiohttp
+          >>> import asyncio
+          >>>
+          >>> async def main():
+          ...     async with aiohttp.ClientSession() as session:
+          ...         fpl = await FPL.create(session)
+          ...     print(fpl.current_gameweek)
+          ...
+          >>> asyncio.run(main())
+          1
+
+        The other parameters are the same as those of :class:`FPL`.
+
+        :param bootstrap: (optional) A store whose current snapshot of
+            bootstrap-static is used instead of downloading it, so many
+            instances can share one download.
+        :type bootstrap: :class:`BootstrapStore <fpl.bootstrap.BootstrapStore>`
+        :rtype: :class:`FPL`
+        """
+        fpl = cls.__new__(cls)
+        fpl._configure(session, retry_policy, max_concurrency, rate_limiter,
+                       cache)
 
-    def __init__(self, session):
+        if bootstrap is not None:
+            snapshot = await bootstrap.get(session)
+            fpl.__dict__.update(snapshot.attributes)
+        else:
+            static = await fetch(session, API_URLS["static"])
+            fpl._set_static(static)
+        return fpl
+
+    def _configure(self, session, retry_policy, max_concurrency,
+                   rate_limiter, cache):
+        """Sets the session and the given options of its requests, and the
+        default options it doesn't have yet.
+        """
         self.session = session
 
-        # TODO: use aiohttp instead
-        static = requests.get(API_URLS["static"]).json()
-        for k, v in static.items():
-            try:
-                v = {w["id"]: w for w in v}
-            except (KeyError, TypeError):
-                pass
+        options = {}
+        if retry_policy is not None:
+            options["retry_policy"] = retry_policy
+        if rate_limiter is not None:
+            options["rate_limiter"] = rate_limiter
+        if max_concurrency is not _default:
+            if isinstance(max_concurrency, int):
+                if max_concurrency < 1:
+                    raise ValueError("max_concurrency must be at least 1.")
+                max_concurrency = asyncio.Semaphore(max_concurrency)
+            options["semaphore"] = max_concurrency
+        if cache is not _default:
+            options["cache"] = cache
+        set_session_options(session, **options)
+
+        defaults = {"cache": DEFAULT_CACHE}
+        if max_concurrency is _default:
+            defaults["semaphore"] = asyncio.Semaphore(DEFAULT_MAX_CONCURRENCY)
+        set_default_session_options(session, **defaults)
+
+    def _set_static(self, static):
+        """Sets the attributes taken from bootstrap-static, e.g. ``elements``.
+        """
+        for k, v in index_static(static).items():
             setattr(self, k, v)
-        setattr(self,
-                "current_gameweek",
-                next(event for event in static["events"]
-                     if event["is_current"])["id"])
+
+    @property
+    def players(self):
+        """Secondary indexes over ``elements`` for querying players by team,
+        position, status and price, e.g.
+        ``fpl.players.where(team=11, element_type=3, max_cost=80)``.
+
+        :rtype: :class:`PlayerIndex <fpl.indexes.PlayerIndex>`
+        """
+        return get_player_index(getattr(self, "elements"))
 
     async def get_user(self, user_id=None, return_json=False):
         """Returns the user with the given ``user_id``.
@@ -70,6 +195,8 @@ class FPL:
         :type user_id: string or int
         :param return_json: (optional) Boolean. If ``True`` returns a ``dict``,
             if ``False`` returns a :class:`User` object. Defaults to ``False``.
+            The ``dict``s are shared and must not be modified (see
+            :class:`FPL <fpl.FPL>`).
         :type return_json: bool
         :rtype: :class:`User` or `dict`
         """
@@ -102,7 +229,8 @@ class FPL:
             If not set a list of *all* teams will be returned.
         :param return_json: (optional) Boolean. If ``True`` returns a list of
             ``dict``s, if ``False`` returns a list of  :class:`Team` objects.
-            Defaults to ``False``.
+            Defaults to ``False``. The ``dict``s are shared and must not be
+            modified (see :class:`FPL <fpl.FPL>`).
         :type return_json: bool
         :rtype: list
         """
@@ -130,6 +258,8 @@ class FPL:
         :type team_id: string or int
         :param return_json: (optional) Boolean. If ``True`` returns a ``dict``,
             if ``False`` returns a :class:`Team` object. Defaults to ``False``.
+            The ``dict``s are shared and must not be modified (see
+            :class:`FPL <fpl.FPL>`).
         :type return_json: bool
         :rtype: :class:`Team` or ``dict``
 
@@ -161,8 +291,7 @@ class FPL:
         assert 0 < int(
             team_id) < 21, "Team ID must be a number between 1 and 20."
         teams = getattr(self, "teams")
-        team = next(team for team in teams.values()
-                    if team["id"] == int(team_id))
+        team = teams[int(team_id)]
 
         if return_json:
             return team
@@ -178,7 +307,8 @@ class FPL:
         :param int player_id: A player's ID.
         :param return_json: (optional) Boolean. If ``True`` returns a ``dict``,
             if ``False`` returns a :class:`PlayerSummary` object. Defaults to
-            ``False``.
+            ``False``. The ``dict``s are shared and must not be modified (see
+            :class:`FPL <fpl.FPL>`).
         :type return_json: bool
         :rtype: :class:`PlayerSummary` or ``dict``
         """
@@ -201,7 +331,8 @@ class FPL:
         :param list player_ids: A list of player IDs.
         :param return_json: (optional) Boolean. If ``True`` returns a list of
             ``dict``s, if ``False`` returns a list of  :class:`PlayerSummary`
-            objects. Defaults to ``False``.
+            objects. Defaults to ``False``. The ``dict``s are shared and must
+            not be modified (see :class:`FPL <fpl.FPL>`).
         :type return_json: bool
         :rtype: list
         """
@@ -220,6 +351,71 @@ class FPL:
         return [PlayerSummary(player_summary)
                 for player_summary in player_summaries]
 
+    def stream_player_summaries(self, player_ids, ordered=False,
+                                limit=DEFAULT_MAX_CONCURRENCY,
+                                return_json=False):
+        """Yields the summaries of players whose ID are in the ``player_ids``
+        list as soon as they are downloaded, unlike
+        :meth:`get_player_summaries`, which returns them once all of them
+        are. At most ``limit`` summaries are downloaded at once.
+
+        Information is taken from e.g.:
+            https://fantasy.premierleague.com/api/element-summary/1/
+
+        Basic usage::
+
+          >>> async for summary in fpl.stream_player_summaries(player_ids):
+          ...     process(summary)
+
+        :param list player_ids: A list of player IDs.
+        :param bool ordered: (optional) Yields the summaries in the order of
+            ``player_ids`` if ``True``. Defaults to ``False``.
+        :param int limit: (optional) The maximum number of summaries being
+            downloaded at once. Defaults to ``25``.
+        :param return_json: (optional) Boolean. If ``True`` yields ``dict``s,
+            if ``False`` yields :class:`PlayerSummary` objects. Defaults to
+            ``False``. The ``dict``s are shared and must not be modified (see
+            :class:`FPL <fpl.FPL>`).
+        :type return_json: bool
+        """
+        return stream(
+            (self.get_player_summary(player_id, return_json)
+             for player_id in player_ids), limit, ordered)
+
+    def stream_players(self, player_ids=None, include_summary=False,
+                       ordered=False, limit=DEFAULT_MAX_CONCURRENCY,
+                       return_json=False):
+        """Yields either *all* players, or the players whose IDs are in the
+        given ``player_ids`` list, as soon as they are available, unlike
+        :meth:`get_players`, which returns them once all of them are. At
+        most ``limit`` summaries are downloaded at once.
+
+        Information is taken from e.g.:
+            https://fantasy.premierleague.com/api/bootstrap-static/
+            https://fantasy.premierleague.com/api/element-summary/1/ (optional)
+
+        :param list player_ids: (optional) A list of player IDs
+        :param boolean include_summary: (optional) Includes a player's summary
+            if ``True``.
+        :param bool ordered: (optional) Yields the players in the order of
+            ``player_ids`` if ``True``. Defaults to ``False``.
+        :param int limit: (optional) The maximum number of summaries being
+            downloaded at once. Defaults to ``25``.
+        :param return_json: (optional) Boolean. If ``True`` yields ``dict``s,
+            if ``False`` yields :class:`Player` objects. Defaults to ``False``.
+            The ``dict``s are shared and must not be modified (see
+            :class:`FPL <fpl.FPL>`).
+        :type return_json: bool
+        """
+        players = getattr(self, "elements")
+
+        if not player_ids:
+            player_ids = list(players)
+
+        return stream(
+            (self.get_player(player_id, players, include_summary, return_json)
+             for player_id in player_ids), limit, ordered)
+
     async def get_player(self, player_id, players=None, include_summary=False,
                          return_json=False):
         """Returns the player with the given ``player_id``.
@@ -230,28 +426,32 @@ class FPL:
 
         :param player_id: A player's ID.
         :type player_id: string or int
-        :param list players: (optional) A list of players.
+        :param players: (optional) The players to look the player up in,
+            either a list or a ``dict`` keyed by ID like ``FPL.elements``.
+        :type players: list or dict
         :param bool include_summary: (optional) Includes a player's summary
             if ``True``.
         :param return_json: (optional) Boolean. If ``True`` returns a ``dict``,
             if ``False`` returns a :class:`Player` object. Defaults to
-            ``False``.
+            ``False``. The ``dict``s are shared and must not be modified (see
+            :class:`FPL <fpl.FPL>`).
         :rtype: :class:`Player` or ``dict``
         :raises ValueError: Player with ``player_id`` not found
         """
         if not players:
             players = getattr(self, "elements")
+        elif not isinstance(players, dict):
+            players = {player["id"]: player for player in players}
 
         try:
-            player = next(player for player in players.values()
-                          if player["id"] == player_id)
-        except StopIteration:
+            player = players[int(player_id)]
+        except KeyError:
             raise ValueError(f"Player with ID {player_id} not found")
 
         if include_summary:
             player_summary = await self.get_player_summary(
                 player["id"], return_json=True)
-            player.update(player_summary)
+            player = dict(player, **player_summary)
 
         if return_json:
             return player
@@ -271,8 +471,9 @@ class FPL:
         :param boolean include_summary: (optional) Includes a player's summary
             if ``True``.
         :param return_json: (optional) Boolean. If ``True`` returns a list of
-            ``dict``s, if ``False`` returns a list of  :class:`Player`
-            objects. Defaults to ``False``.
+            ``dict``s, if ``False`` returns a list of  :class:`Player` objects.
+            Defaults to ``False``. The ``dict``s are shared and must not be
+            modified (see :class:`FPL <fpl.FPL>`).
         :type return_json: bool
         :rtype: list
         """
@@ -289,40 +490,56 @@ class FPL:
 
         return players
 
+    async def get_fixture_store(self):
+        """Returns a :class:`FixtureStore <fpl.fixture_store.FixtureStore>`
+        of all fixtures. The store is built once per (cached) response of
+        https://fantasy.premierleague.com/api/fixtures/, so with a warm cache
+        looking up fixtures doesn't send any requests.
+
+        :rtype: :class:`FixtureStore <fpl.fixture_store.FixtureStore>`
+        """
+        fixtures = await fetch(self.session, API_URLS["fixtures"])
+        return get_fixture_store(fixtures)
+
+    async def get_difficulty_matrix(self, position=None):
+        """Returns the fixture difficulty of every team in every gameweek.
+        Requires NumPy.
+
+        :param string position: (optional) If set, the difficulty is taken
+            from :meth:`FDR` for the given position (e.g. ``"all"`` or
+            ``"forward"``) instead of the official difficulty. Note that
+            :meth:`FDR` downloads every player's summary.
+        :rtype: :class:`DifficultyMatrix <fpl.difficulty.DifficultyMatrix>`
+        """
+        store = await self.get_fixture_store()
+        gameweeks = max(len(getattr(self, "events", ())),
+                        max(store.get_gameweeks(), default=0))
+
+        if position is None:
+            return DifficultyMatrix.from_fixtures(
+                store, gameweeks=gameweeks)
+
+        fdr = await self.FDR()
+        return DifficultyMatrix.from_fdr(
+            store, fdr, position, gameweeks=gameweeks)
+
     async def get_fixture(self, fixture_id, return_json=False):
         """Returns the fixture with the given ``fixture_id``.
 
         Information is taken from e.g.:
             https://fantasy.premierleague.com/api/fixtures/
-            https://fantasy.premierleague.com/api/fixtures/?event=1
 
         :param int fixture_id: The fixture's ID.
         :param return_json: (optional) Boolean. If ``True`` returns a ``dict``,
             if ``False`` returns a :class:`Fixture` object. Defaults to
-            ``False``.
+            ``False``. The ``dict``s are shared and must not be modified (see
+            :class:`FPL <fpl.FPL>`).
         :type return_json: bool
         :rtype: :class:`Fixture` or ``dict``
         :raises ValueError: if fixture with ``fixture_id`` not found
         """
-        fixtures = await fetch(self.session, API_URLS["fixtures"])
-
-        try:
-            fixture = next(fixture for fixture in fixtures
-                           if fixture["id"] == fixture_id)
-        except StopIteration:
-            raise ValueError(f"Fixture with ID {fixture_id} not found")
-        fixture_gameweek = fixture["event"]
-
-        gameweek_fixtures = await fetch(
-            self.session,
-            API_URLS["gameweek_fixtures"].format(fixture_gameweek))
-
-        try:
-            fixture = next(fixture for fixture in gameweek_fixtures
-                           if fixture["id"] == fixture_id)
-        except StopIteration:
-            raise ValueError(
-                f"Fixture with ID {fixture_id} not found in gameweek fixtures")
+        store = await self.get_fixture_store()
+        fixture = store.get(fixture_id)
 
         if return_json:
             return fixture
@@ -335,31 +552,21 @@ class FPL:
 
         Information is taken from e.g.:
             https://fantasy.premierleague.com/api/fixtures/
-            https://fantasy.premierleague.com/api/fixtures/?event=1
 
         :param list fixture_ids: A list of fixture IDs.
         :param return_json: (optional) Boolean. If ``True`` returns a list of
             ``dict``s, if ``False`` returns a list of  :class:`Fixture`
-            objects. Defaults to ``False``.
+            objects. Defaults to ``False``. The ``dict``s are shared and must
+            not be modified (see :class:`FPL <fpl.FPL>`).
         :type return_json: bool
         :rtype: list
         """
         if not fixture_ids:
             return []
 
-        fixtures = await fetch(self.session, API_URLS["fixtures"])
-        fixture_gameweeks = set(fixture["event"] for fixture in fixtures
-                                if fixture["id"] in fixture_ids)
-        tasks = [asyncio.ensure_future(
-                 fetch(self.session,
-                       API_URLS["gameweek_fixtures"].format(gameweek)))
-                 for gameweek in fixture_gameweeks]
-
-        gameweek_fixtures = await asyncio.gather(*tasks)
-        merged_fixtures = list(itertools.chain(*gameweek_fixtures))
-
-        fixtures = [fixture for fixture in merged_fixtures
-                    if fixture["id"] in fixture_ids]
+        store = await self.get_fixture_store()
+        fixtures = [store.get(fixture_id) for fixture_id in fixture_ids
+                    if fixture_id in store]
 
         if return_json:
             return fixtures
@@ -376,8 +583,9 @@ class FPL:
         :param gameweek: A gameweek.
         :type gameweek: string or int
         :param return_json: (optional) Boolean. If ``True`` returns a list of
-            ``dict``s, if ``False`` returns a list of  :class:`Player`
-            objects. Defaults to ``False``.
+            ``dict``s, if ``False`` returns a list of  :class:`Player` objects.
+            Defaults to ``False``. The ``dict``s are shared and must not be
+            modified (see :class:`FPL <fpl.FPL>`).
         :type return_json: bool
         :rtype: list
         """
@@ -394,22 +602,16 @@ class FPL:
 
         Information is taken from e.g.:
             https://fantasy.premierleague.com/api/fixtures/
-            https://fantasy.premierleague.com/api/fixtures/?event=1
 
         :param return_json: (optional) Boolean. If ``True`` returns a list of
             ``dict``s, if ``False`` returns a list of  :class:`Fixture`
-            objects. Defaults to ``False``.
+            objects. Defaults to ``False``. The ``dict``s are shared and must
+            not be modified (see :class:`FPL <fpl.FPL>`).
         :type return_json: bool
         :rtype: list
         """
-        gameweeks = range(1, 39)
-        tasks = [asyncio.ensure_future(
-                 fetch(self.session,
-                       API_URLS["gameweek_fixtures"].format(gameweek)))
-                 for gameweek in gameweeks]
-
-        gameweek_fixtures = await asyncio.gather(*tasks)
-        fixtures = list(itertools.chain(*gameweek_fixtures))
+        store = await self.get_fixture_store()
+        fixtures = list(store)
 
         if return_json:
             return fixtures
@@ -429,7 +631,8 @@ class FPL:
             if ``True``.
         :param return_json: (optional) Boolean. If ``True`` returns a ``dict``,
             if ``False`` returns a :class:`Gameweek` object. Defaults to
-            ``False``.
+            ``False``. The ``dict``s are shared and must not be modified (see
+            :class:`FPL <fpl.FPL>`).
         :type return_json: bool
         :rtype: :class:`Gameweek` or ``dict``
         """
@@ -437,44 +640,51 @@ class FPL:
         static_gameweeks = getattr(self, "events")
 
         try:
-            static_gameweek = next(
-                gameweek for gameweek in static_gameweeks.values() if
-                gameweek["id"] == gameweek_id)
-        except StopIteration:
+            static_gameweek = static_gameweeks[int(gameweek_id)]
+        except KeyError:
             raise ValueError(f"Gameweek with ID {gameweek_id} not found")
 
         if include_live:
-            live_gameweek = await fetch(
-                self.session, API_URLS["gameweek_live"].format(gameweek_id))
+            live_gameweek = LiveGameweek(
+                self.session, gameweek_id,
+                include_bonus=not static_gameweek["finished"])
+            await live_gameweek.update()
+            static_gameweek = dict(static_gameweek, **live_gameweek.to_dict())
 
-            # Convert element list to dict
-            live_gameweek["elements"] = {
-                element["id"]: element for element in live_gameweek["elements"]}
+        if return_json:
+            return static_gameweek
 
-            # Include live bonus points
-            if not static_gameweek["finished"]:
-                fixtures = await self.get_fixtures_by_gameweek(gameweek_id)
-                fixtures = filter(lambda f: not f.finished, fixtures)
-                bonus_for_gameweek = []
+        return Gameweek(static_gameweek)
 
-                for fixture in fixtures:
-                    bonus = fixture.get_bonus(provisional=True)
-                    bonus_for_gameweek.extend(bonus["a"] + bonus["h"])
+    def get_live_gameweek(self, gameweek_id):
+        """Returns a :class:`LiveGameweek <fpl.live.LiveGameweek>` of the
+        gameweek with the ID ``gameweek_id``, which keeps its live data up to
+        date with each call of its ``update`` method.
 
-                bonus_for_gameweek = {bonus["element"]: bonus["value"]
-                                      for bonus in bonus_for_gameweek}
+        :param int gameweek_id: A gameweek's ID.
+        :rtype: :class:`LiveGameweek <fpl.live.LiveGameweek>`
+        """
+        return LiveGameweek(self.session, gameweek_id)
 
-                for player_id, bonus_points in bonus_for_gameweek.items():
-                    if live_gameweek["elements"][player_id]["stats"]["bonus"] == 0:
-                        live_gameweek["elements"][player_id]["stats"]["bonus"] += bonus_points
-                        live_gameweek["elements"][player_id]["stats"]["total_points"] += bonus_points
+    def live_events(self, gameweek_id, interval=30):
+        """Returns an async iterator of the changes of the live stats of the
+        gameweek with the ID ``gameweek_id``, e.g. goals, cards, saves and
+        (provisional) bonus points, as
+        :class:`LiveEvent <fpl.live.LiveEvent>` objects. It polls the
+        gameweek's live data every ``interval`` seconds, and stops once all
+        of its fixtures are finished.
 
-            static_gameweek.update(live_gameweek)
+        Basic usage::
 
-        if return_json:
-            return static_gameweek
+          >>> async for event in fpl.live_events(fpl.current_gameweek):
+          ...     if event.type == "goal":
+          ...         print(f"{event.element} scored {event.delta} goal(s)")
 
-        return Gameweek(static_gameweek)
+        :param int gameweek_id: A gameweek's ID.
+        :param float interval: (optional) The number of seconds between two
+            polls. Defaults to ``30``.
+        """
+        return poll_events(self.get_live_gameweek(gameweek_id), interval)
 
     async def get_gameweeks(self, gameweek_ids=None, include_live=False,
                             return_json=False):
@@ -488,7 +698,8 @@ class FPL:
         :param list gameweek_ids: (optional) A list of gameweek IDs.
         :param return_json: (optional) Boolean. If ``True`` returns a list of
             ``dict``s, if ``False`` returns a list of  :class:`Gameweek`
-            objects. Defaults to ``False``.
+            objects. Defaults to ``False``. The ``dict``s are shared and must
+            not be modified (see :class:`FPL <fpl.FPL>`).
         :type return_json: bool
         :rtype: list
         """
@@ -514,7 +725,8 @@ class FPL:
         :type league_id: string or int
         :param return_json: (optional) Boolean. If ``True`` returns a ``dict``,
             if ``False`` returns a :class:`ClassicLeague` object. Defaults to
-            ``False``.
+            ``False``. The ``dict``s are shared and must not be modified (see
+            :class:`FPL <fpl.FPL>`).
         :type return_json: bool
         :rtype: :class:`ClassicLeague` or ``dict``
         """
@@ -540,7 +752,8 @@ class FPL:
         :type league_id: string or int
         :param return_json: (optional) Boolean. If ``True`` returns a ``dict``,
             if ``False`` returns a :class:`H2HLeague` object. Defaults to
-            ``False``.
+            ``False``. The ``dict``s are shared and must not be modified (see
+            :class:`FPL <fpl.FPL>`).
         :type return_json: bool
         :rtype: :class:`H2HLeague` or ``dict``
         """
@@ -656,6 +869,10 @@ class FPL:
         These numbers are also between 1.0 and 5.0 to give a similar ranking
         system to the official FDR.
 
+        This downloads every player's summary; use an
+        :class:`FDREngine <fpl.fdr.FDREngine>` to keep the FDR up to date
+        incrementally instead.
+
         An example:
 
         .. code-block:: javascript
@@ -710,74 +927,11 @@ class FPL:
 
         :rtype: dict
         """
-        def average_points_against(points_against):
-            """Returns a dict with the average points scored against all teams,
-            per position and location.
-
-            :param dict points_against: A dict containing the points scored
-                against each team in the Premier League.
-            :rtype: dict
-            """
-            for team, positions in points_against.items():
-                for position in positions.values():
-                    position["H"] = average(position["H"])
-                    position["A"] = average(position["A"])
-
-                points_against[team] = positions
-
-            return points_against
-
-        def get_extrema(points_against):
-            """Returns the extrema for each position and location.
-
-            :param dict points_against: A dict containing the points scored
-                against each team in the Premier League.
-            :rtype: dict
-            """
-            averages = {}
-            for _, positions in points_against.items():
-                for position, average in positions.items():
-                    averages.setdefault(position, {"H": [], "A": []})
-                    averages[position]["H"].append(average["H"])
-                    averages[position]["A"].append(average["A"])
-
-            for position, locations in averages.items():
-                min_h = min(locations["H"])
-                min_a = min(locations["A"])
-                max_h = max(locations["H"])
-                max_a = max(locations["A"])
-                averages[position]["H"] = [min_h, max_h]
-                averages[position]["A"] = [min_a, max_a]
-
-            return averages
-
-        def calculate_fdr(average_points, extrema):
-            """Returns a dict containing the FDR for each team, which is
-            calculated by scaling the average points conceded per position
-            between 1.0 and 5.0 using the given extrema.
-
-            :param dict points_against: A dict containing the points scored
-                against each team in the Premier League.
-            :param dict extrema: A dict containing the extrema for each
-                position and location.
-            :rtype: dict
-            """
-            for team, positions in average_points.items():
-                for position, locations in positions.items():
-                    min_h, max_h = extrema[position]["H"]
-                    min_a, max_a = extrema[position]["A"]
-
-                    fdr_h = scale(locations["H"], 5.0, 1.0, min_h, max_h)
-                    fdr_a = scale(locations["A"], 5.0, 1.0, min_a, max_a)
-
-                    average_points[team][position]["H"] = fdr_h
-                    average_points[team][position]["A"] = fdr_a
-
-            return average_points
-
-        points_against = await self.get_points_against()
-        average_points = average_points_against(points_against)
-        extrema = get_extrema(average_points)
-        fdr = calculate_fdr(average_points, extrema)
-
-        return fdr
+        players = await self.get_players(
+            include_summary=True, return_json=True)
+
+        engine = FDREngine()
+        for player in players:
+            engine.ingest(player, player["history"])
+
+        return engine.get_fdr()
@@ -0,0 +1,162 @@
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+from .stats import PlayerTable
+
+#: The fields of a player with an equality index.
+INDEXED_FIELDS = ("team", "element_type", "status")
+
+_indexes = OrderedDict()
+_MAX_INDEXES = 4
+
+
+class PlayerIndex:
+    """Secondary indexes over the players (``elements``) of bootstrap-static,
+    so players can be queried by team, position, status and price without
+    scanning all of them.
+
+    Equality indexes map each value of the fields in :data:`INDEXED_FIELDS`
+    to the IDs of the players with that value, and players are sorted by
+    ``now_cost`` for range queries. A query starts from the smallest set of
+    candidates matching one of its conditions, and only checks the other
+    conditions for those, so it costs O(k) instead of O(n).
+
+    Basic usage::
+
+      >>> from fpl import FPL
+      >>> import aiohttp
+      >>> import asyncio
+      >>>
+      >>> async def main():
+      ...     async with aiohttp.ClientSession() as session:
+      ...         fpl = await FPL.create(session)
+      ...     return fpl.players.where(team=11, element_type=3, max_cost=80)
+      ...
+      >>> midfielders = asyncio.run(main())
+
+    The players are taken from the bootstrap-static response and must not be
+    modified.
+
+    :param elements: The players, either a list or a ``dict`` keyed by ID
+        like ``FPL.elements``.
+    :type elements: list or dict
+    """
+
+    def __init__(self, elements):
+        if not isinstance(elements, dict):
+            elements = {player["id"]: player for player in elements}
+        self.elements = elements
+
+        self._indexes = {field: {} for field in INDEXED_FIELDS}
+        for player_id, player in elements.items():
+            for field, index in self._indexes.items():
+                index.setdefault(player.get(field), []).append(player_id)
+
+        by_cost = sorted(elements.items(),
+                         key=lambda item: item[1].get("now_cost", 0))
+        self._costs = [player.get("now_cost", 0) for _, player in by_cost]
+        self._ids_by_cost = [player_id for player_id, _ in by_cost]
+        self._table = None
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __iter__(self):
+        return iter(self.elements.values())
+
+    def __contains__(self, player_id):
+        return player_id in self.elements
+
+    def __getitem__(self, player_id):
+        return self.elements[player_id]
+
+    @property
+    def table(self):
+        """A columnar view of the players for vectorized metrics and rankings,
+        built the first time it's used. Requires NumPy.
+
+        :rtype: :class:`PlayerTable <fpl.stats.PlayerTable>`
+        """
+        if self._table is None:
+            self._table = PlayerTable(self.elements)
+        return self._table
+
+    def get_values(self, field):
+        """Returns the distinct values of the given indexed field.
+
+        :param string field: One of :data:`INDEXED_FIELDS`.
+        :rtype: list
+        """
+        return list(self._indexes[field])
+
+    def where(self, team=None, element_type=None, status=None, min_cost=None,
+              max_cost=None):
+        """Returns the players matching all the given conditions, sorted by
+        ID. Conditions that are ``None`` are ignored.
+
+        :param int team: (optional) The ID of the players' team.
+        :param int element_type: (optional) The players' position, e.g. ``3``
+            for midfielders.
+        :param string status: (optional) The players' status, e.g. ``"a"``
+            for available players.
+        :param int min_cost: (optional) The players' minimum ``now_cost``,
+            e.g. ``55`` for £5.5m.
+        :param int max_cost: (optional) The players' maximum ``now_cost``.
+        :rtype: list
+        """
+        conditions = {field: value for field, value in zip(
+            INDEXED_FIELDS, (team, element_type, status)) if value is not None}
+
+        candidates = None
+        if min_cost is not None or max_cost is not None:
+            low = 0 if min_cost is None else bisect_left(
+                self._costs, min_cost)
+            high = len(self._costs) if max_cost is None else bisect_right(
+                self._costs, max_cost)
+            candidates = self._ids_by_cost[low:max(low, high)]
+
+        for field, value in conditions.items():
+            player_ids = self._indexes[field].get(value, [])
+            if candidates is None or len(player_ids) < len(candidates):
+                candidates = player_ids
+
+        if candidates is None:
+            return list(self.elements.values())
+
+        players = []
+        for player_id in candidates:
+            player = self.elements[player_id]
+            if all(player.get(field) == value
+                   for field, value in conditions.items()):
+                cost = player.get("now_cost", 0)
+                if ((min_cost is None or cost >= min_cost) and
+                        (max_cost is None or cost <= max_cost)):
+                    players.append(player)
+
+        players.sort(key=lambda player: player["id"])
+        return players
+
+
+def get_player_index(elements):
+    """Returns the :class:`PlayerIndex` of the given players, building it if
+    needed. The indexes of the last few (e.g. cached) bootstrap-static
+    responses are kept, so they're only built once per response.
+
+    :param elements: The players, either a list or a ``dict`` keyed by ID
+        like ``FPL.elements``.
+    :type elements: list or dict
+    :rtype: :class:`PlayerIndex`
+    """
+    # The players are kept alongside their index, so their ID can't be reused
+    # by another object.
+    key = id(elements)
+    try:
+        _, index = _indexes[key]
+    except KeyError:
+        index = PlayerIndex(elements)
+        _indexes[key] = (elements, index)
+        while len(_indexes) > _MAX_INDEXES:
+            _indexes.popitem(last=False)
+    else:
+        _indexes.move_to_end(key)
+    return index
@@ -0,0 +1,297 @@
+import asyncio
+from collections import namedtuple
+
+from .bonus import get_fixture_bonus
+from .constants import API_URLS
+from .utils import fetch
+
+
+#: Maps the live stats of an element to the type of the events emitted when
+#: they change.
+EVENT_TYPES = {
+    "goals_scored": "goal",
+    "assists": "assist",
+    "own_goals": "own_goal",
+    "yellow_cards": "yellow_card",
+    "red_cards": "red_card",
+    "saves": "save",
+    "penalties_saved": "penalty_save",
+    "penalties_missed": "penalty_miss",
+    "minutes": "minutes",
+    "bps": "bps",
+    "bonus": "bonus",
+    "total_points": "points"
+}
+
+
+class LiveEvent(namedtuple("LiveEvent", "type element value previous")):
+    """A change of one of an element's live stats, e.g. a goal.
+
+    :param string type: The event's type, one of the values of
+        :data:`EVENT_TYPES`, e.g. ``"goal"`` or ``"bonus"`` (which includes
+        changes of provisional bonus points).
+    :param int element: The element's ID.
+    :param value: The stat's new value.
+    :param previous: The stat's previous value.
+    """
+
+    __slots__ = ()
+
+    @property
+    def delta(self):
+        """The change of the stat's value, e.g. ``2`` if two goals were
+        scored between two polls.
+        """
+        return self.value - self.previous
+
+
+def get_events(old_element, new_element):
+    """Returns the :class:`LiveEvent` of each stat that changed between two
+    versions of a live element.
+
+    :param dict old_element: The element's previous live data.
+    :param dict new_element: The element's current live data.
+    :rtype: list
+    """
+    old_stats = old_element["stats"]
+    new_stats = new_element["stats"]
+    return [LiveEvent(event_type, new_element["id"], new_stats.get(stat, 0),
+                      old_stats.get(stat, 0))
+            for stat, event_type in EVENT_TYPES.items()
+            if new_stats.get(stat, 0) != old_stats.get(stat, 0)]
+
+
+def get_fixture_stat(fixture, identifier):
+    """Returns the given stat (e.g. ``"bps"``) of a fixture as returned by
+    the API, i.e. a dict with the ``"a"`` and ``"h"`` values, or ``None`` if
+    the fixture doesn't have it.
+
+    :param dict fixture: A fixture.
+    :param string identifier: The stat's identifier.
+    :rtype: dict or None
+    """
+    for stat in fixture.get("stats", []):
+        if stat["identifier"] == identifier:
+            return stat
+    return None
+
+
+def get_provisional_bonus(fixture):
+    """Returns the provisional bonus points of the players in the given
+    fixture, keyed by element ID, using the rules of
+    :func:`fpl.bonus.calculate_bonus`.
+    Finished fixtures and fixtures that haven't started have none.
+
+    :param dict fixture: A fixture.
+    :rtype: dict
+    """
+    if fixture.get("finished") or not fixture.get("started"):
+        return {}
+
+    bonus = get_fixture_bonus(fixture)
+    return {b["element"]: b["value"] for b in bonus["a"] + bonus["h"]}
+
+
+class LiveGameweek:
+    """The live data of a gameweek, including provisional bonus points, kept
+    up to date by applying the changes between successive polls of
+    https://fantasy.premierleague.com/api/event/1/live/ and the gameweek's
+    fixtures.
+
+    Each :meth:`update` only rebuilds the elements whose live data or
+    provisional bonus changed, only recomputes the provisional bonus of
+    fixtures whose BPS changed, and returns the IDs of the changed elements.
+
+    Basic usage::
+
+      >>> from fpl import FPL
+      >>> import aiohttp
+      >>> import asyncio
+      >>>
+      >>> async def main():
+      ...     async with aiohttp.ClientSession() as session:
+      ...         fpl = await FPL.create(session)
+      ...         live = fpl.get_live_gameweek(fpl.current_gameweek)
+      ...         while True:
+      ...             changed = await live.update()
+      ...             for element_id in changed:
+      ...                 print(live.elements[element_id]["stats"])
+      ...             await asyncio.sleep(30)
+      ...
+      >>> asyncio.run(main())
+
+    The live data are taken from the (possibly cached) responses and must not
+    be modified.
+
+    :param aiohttp.ClientSession session: The session used for the
+        downloads.
+    :param int gameweek_id: The gameweek's ID.
+    :param bool include_bonus: (optional) Adds the provisional bonus points
+        of fixtures in progress if ``True``. Defaults to ``True``.
+    """
+
+    def __init__(self, session, gameweek_id, include_bonus=True):
+        self.session = session
+        self.id = gameweek_id
+        self.include_bonus = include_bonus
+
+        #: The live elements, keyed by ID, with their provisional bonus
+        #: points added to their ``bonus`` and ``total_points`` stats.
+        self.elements = {}
+        #: The gameweek's fixtures, keyed by ID.
+        self.fixtures = {}
+        #: The provisional bonus points of each element, keyed by ID.
+        self.bonus = {}
+        #: The IDs of the elements that changed in the last update.
+        self.changed = set()
+        #: The elements that changed in the last update, as they were before
+        #: it, keyed by ID. Elements that were new are left out.
+        self.previous = {}
+
+        self._live = {}
+        self._raw_elements = {}
+        self._fixture_states = {}
+        self._fixture_bonus = {}
+
+    async def update(self):
+        """Downloads the live data (and fixtures) of the gameweek, applies
+        them, and returns the IDs of the elements that changed.
+
+        :rtype: set
+        """
+        live_url = API_URLS["gameweek_live"].format(self.id)
+        if not self.include_bonus:
+            return self.apply(await fetch(self.session, live_url))
+
+        fixtures_url = API_URLS["gameweek_fixtures"].format(self.id)
+        live, fixtures = await asyncio.gather(
+            fetch(self.session, live_url), fetch(self.session, fixtures_url))
+        return self.apply(live, fixtures)
+
+    def apply(self, live, fixtures=()):
+        """Applies the given live data and fixtures of the gameweek, and
+        returns the IDs of the elements that changed.
+
+        :param dict live: The response of the gameweek's live endpoint.
+        :param list fixtures: (optional) The gameweek's fixtures.
+        :rtype: set
+        """
+        changed_bonus = self._apply_fixtures(fixtures)
+
+        changed = set()
+        previous = {}
+        for element in live["elements"]:
+            element_id = element["id"]
+            old_element = self._raw_elements.get(element_id)
+            if (old_element is element or old_element == element) and \
+                    element_id not in changed_bonus:
+                continue
+
+            if element_id in self.elements:
+                previous[element_id] = self.elements[element_id]
+            self._raw_elements[element_id] = element
+            self.elements[element_id] = self._add_bonus(element)
+            changed.add(element_id)
+
+        self._live = live
+        self.changed = changed
+        self.previous = previous
+        return changed
+
+    def get_events(self):
+        """Returns the :class:`LiveEvent` of each stat of an element that
+        changed in the last update, ordered by element ID. Elements that were
+        new in it have no events.
+
+        :rtype: list
+        """
+        events = []
+        for element_id in sorted(self.previous):
+            events.extend(get_events(
+                self.previous[element_id], self.elements[element_id]))
+        return events
+
+    def is_finished(self):
+        """Returns whether all fixtures of the gameweek are finished, i.e.
+        their bonus points have been confirmed.
+
+        :rtype: bool
+        """
+        return bool(self.fixtures) and all(
+            fixture.get("finished") for fixture in self.fixtures.values())
+
+    def _apply_fixtures(self, fixtures):
+        """Updates the fixtures and the provisional bonus of those whose BPS
+        changed, and returns the IDs of the elements whose provisional bonus
+        changed.
+        """
+        changed = set()
+        for fixture in fixtures:
+            fixture_id = fixture["id"]
+            self.fixtures[fixture_id] = fixture
+
+            state = (fixture.get("started"), fixture.get("finished"),
+                     get_fixture_stat(fixture, "bps"))
+            if self._fixture_states.get(fixture_id) == state:
+                continue
+            self._fixture_states[fixture_id] = state
+
+            bonus = get_provisional_bonus(fixture)
+            old_bonus = self._fixture_bonus.get(fixture_id, {})
+            if bonus != old_bonus:
+                self._fixture_bonus[fixture_id] = bonus
+                changed.update(element_id for element_id in old_bonus
+                               if old_bonus[element_id] != bonus.get(
+                                   element_id))
+                changed.update(element_id for element_id in bonus
+                               if bonus[element_id] != old_bonus.get(
+                                   element_id))
+
+        for element_id in changed:
+            points = sum(bonus.get(element_id, 0)
+                         for bonus in self._fixture_bonus.values())
+            if points:
+                self.bonus[element_id] = points
+            else:
+                self.bonus.pop(element_id, None)
+        return changed
+
+    def _add_bonus(self, element):
+        """Returns the given element with its provisional bonus points added,
+        if their bonus points haven't been added to their stats yet.
+        """
+        points = self.bonus.get(element["id"])
+        if not points or element["stats"]["bonus"] != 0:
+            return element
+
+        stats = dict(element["stats"])
+        stats["bonus"] += points
+        stats["total_points"] += points
+        return dict(element, stats=stats)
+
+    def to_dict(self):
+        """Returns the live data of the gameweek, with its elements keyed by
+        ID and their provisional bonus points added.
+
+        :rtype: dict
+        """
+        return dict(self._live, elements=dict(self.elements))
+
+
+async def poll_events(live_gameweek, interval=30):
+    """Polls the given live gameweek every ``interval`` seconds and yields
+    the :class:`LiveEvent` of every change, as an async generator. The first
+    poll only establishes the current state. Stops once all fixtures of the
+    gameweek are finished.
+
+    :param live_gameweek: The live gameweek.
+    :type live_gameweek: :class:`LiveGameweek`
+    :param float interval: (optional) The number of seconds between two
+        polls. Defaults to ``30``.
+    """
+    await live_gameweek.update()
+    while not live_gameweek.is_finished():
+        await asyncio.sleep(interval)
+        await live_gameweek.update()
+        for event in live_gameweek.get_events():
+            yield event
@@ -0,0 +1,30 @@
+class Model:
+    """The base class of the models, which wraps the information (e.g. the
+    ``dict`` of a player returned by the API) a model is built from instead
+    of copying each of its keys onto the instance. Its keys are looked up
+    when they are accessed as attributes, e.g. ``player.total_points``.
+
+    Attributes set on a model are stored on the model itself, so the
+    information it wraps, which may be shared with e.g. a cached response, is
+    never modified.
+
+    :param dict information: The model's information.
+    """
+
+    __slots__ = ("_information", "__dict__")
+
+    def __init__(self, information):
+        self._information = information
+
+    def __getattr__(self, name):
+        # Only called for attributes that aren't set on the model itself.
+        try:
+            information = object.__getattribute__(self, "_information")
+            return information[name]
+        except (AttributeError, KeyError):
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute "
+                f"{name!r}") from None
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._information))
@@ -1,8 +1,9 @@
 from ..constants import API_URLS
 from ..utils import fetch
+from .base import Model
 
 
-class ClassicLeague():
+class ClassicLeague(Model):
     """A class representing a classic league in the Fantasy Premier League.
 
     Basic usage::
@@ -21,12 +22,12 @@ class ClassicLeague():
       >>> asyncio.run(main())
       Official /r/FantasyPL Classic League - 1137
     """
+    __slots__ = ("_session",)
+
     def __init__(self, league_information, session):
+        super().__init__(league_information)
         self._session = session
 
-        for k, v in league_information.items():
-            setattr(self, k, v)
-
     async def get_standings(self, page=1, page_new_entries=1, phase=1):
         """Returns the league's standings of the given page.
 
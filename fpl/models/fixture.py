@@ -1,4 +1,6 @@
+from ..bonus import calculate_bonus
 from ..utils import team_converter
+from .base import Model
 from .player import Player
 
 
@@ -10,7 +12,7 @@ def add_player(location, information):
 
 
 # noinspection PyUnresolvedReferences
-class Fixture:
+class Fixture(Model):
     """A class representing fixtures in the Fantasy Premier League.
 
     Basic usage::
@@ -29,11 +31,13 @@ class Fixture:
       Arsenal vs. Man City - 10 Aug 19:00
     """
 
+    __slots__ = ()
+
     def __init__(self, fixture_information):
-        for k, v in fixture_information.items():
-            if k == "stats":
-                v = {w["identifier"]: {"a": w["a"], "h": w["h"]} for w in v}
-            setattr(self, k, v)
+        super().__init__(fixture_information)
+        if "stats" in fixture_information:
+            self.stats = {w["identifier"]: {"a": w["a"], "h": w["h"]}
+                          for w in fixture_information["stats"]}
 
     def get_goalscorers(self):
         """Returns all players who scored in the fixture.
@@ -123,54 +127,7 @@ class Fixture:
         if self.finished:
             return self.stats["bonus"]
         elif self.started and provisional:
-            bps = self.get_bps()
-            home = [b["element"] for b in bps["h"]]
-            away = [b["element"] for b in bps["a"]]
-            bps = bps["a"] + bps["h"]
-            bps = {b["element"]: b["value"] for b in bps}
-            bps_values = set(bps.values())
-
-            try:
-                bps_1st = max(bps_values)
-                bps_values.remove(bps_1st)
-                bps_2nd = max(bps_values)
-                bps_values.remove(bps_2nd)
-                bps_3rd = max(bps_values)
-            except ValueError:
-                return {"a": [], "h": []}
-
-            else:
-                bonus_3rd = list(
-                    filter(lambda x: bps[x] == bps_1st, bps.keys()))
-                bonus_2nd = bonus_1st = []
-
-                if len(bonus_3rd) == 1:
-                    bonus_2nd = list(
-                        filter(lambda x: bps[x] == bps_2nd, bps.keys()))
-                if len(bonus_3rd) + len(bonus_2nd) == 2:
-                    # 2 way tie for 3 bonus
-                    if len(bonus_3rd) == 2:
-                        bonus_1st = list(
-                            filter(lambda x: bps[x] == bps_2nd, bps.keys()))
-                    else:
-                        bonus_1st = list(
-                            filter(lambda x: bps[x] == bps_3rd, bps.keys()))
-
-                bonus_3rd = [{"value": 3, "element": b} for b in bonus_3rd]
-                bonus_2nd = [{"value": 2, "element": b} for b in bonus_2nd]
-                bonus_1st = [{"value": 1, "element": b} for b in bonus_1st]
-                bonus = bonus_3rd + bonus_2nd + bonus_1st
-
-                h = []
-                a = []
-
-                for b in bonus:
-                    if b["element"] in home:
-                        h.append(b)
-                    elif b["element"] in away:
-                        a.append(b)
-
-                return {"a": a, "h": h}
+            return calculate_bonus(self.get_bps())
         else:
             return {"a": [], "h": []}
 
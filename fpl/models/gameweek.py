@@ -1,4 +1,7 @@
-class Gameweek():
+from .base import Model
+
+
+class Gameweek(Model):
     """A class representing a gameweek of the Fantasy Premier League.
 
     Basic usage::
@@ -16,9 +19,10 @@ class Gameweek():
       >>> asyncio.run(main())
       Gameweek 1 - 10 Aug 19:00
     """
+    __slots__ = ()
+
     def __init__(self, gameweek_information):
-        for k, v in gameweek_information.items():
-            setattr(self, k, v)
+        super().__init__(gameweek_information)
 
     def __str__(self):
         return f"{self.name}"
@@ -2,9 +2,10 @@ import asyncio
 
 from ..constants import API_URLS
 from ..utils import fetch, get_current_gameweek, logged_in
+from .base import Model
 
 
-class H2HLeague():
+class H2HLeague(Model):
     """
     A class representing a H2H league in the Fantasy Premier League.
 
@@ -25,12 +26,12 @@ class H2HLeague():
       League 760869 - 760869
     """
 
+    __slots__ = ("_session",)
+
     def __init__(self, league_information, session):
+        super().__init__(league_information)
         self._session = session
 
-        for k, v in league_information.items():
-            setattr(self, k, v)
-
     async def get_fixtures(self, gameweek=None, page=1):
         """Returns a list of fixtures / results of the H2H league.
 
@@ -1,8 +1,9 @@
 from ..constants import API_URLS
 from ..utils import fetch, position_converter, team_converter
+from .base import Model
 
 
-class Player():
+class Player(Model):
     """A class representing a player in the Fantasy Premier League.
 
     Basic usage::
@@ -21,10 +22,11 @@ class Player():
       Pogba - Midfielder - Man Utd
     """
 
+    __slots__ = ("_session",)
+
     def __init__(self, player_information, session):
+        super().__init__(player_information)
         self._session = session
-        for k, v in player_information.items():
-            setattr(self, k, v)
 
     @property
     async def games_played(self):
@@ -76,10 +78,11 @@ class Player():
                 f"{team_converter(self.team)}")
 
 
-class PlayerSummary:
+class PlayerSummary(Model):
     """A class representing a player in the Fantasy Premier League's summary.
     """
 
+    __slots__ = ()
+
     def __init__(self, player_summary):
-        for k, v in player_summary.items():
-            setattr(self, k, v)
+        super().__init__(player_summary)
@@ -1,9 +1,12 @@
 from ..constants import API_URLS
+from ..fixture_store import get_fixture_store
+from ..indexes import get_player_index
 from ..utils import fetch
+from .base import Model
 from .player import Player
 
 
-class Team():
+class Team(Model):
     """A class representing a real team in the Fantasy Premier League.
 
     Basic usage::
@@ -21,10 +24,11 @@ class Team():
       >>> asyncio.run(main())
       Man Utd
     """
+    __slots__ = ("_session",)
+
     def __init__(self, team_information, session):
+        super().__init__(team_information)
         self._session = session
-        for k, v in team_information.items():
-            setattr(self, k, v)
 
     async def get_players(self, return_json=False):
         """Returns a list containing the players who play for the team. Does
@@ -32,7 +36,8 @@ class Team():
 
         :param return_json: (optional) Boolean. If ``True`` returns a list of
             dicts, if ``False`` returns a list of Player objects. Defaults to
-            ``False``.
+            ``False``. The ``dict``s are shared and must not be modified (see
+            :class:`FPL <fpl.FPL>`).
         :type return_json: bool
         :rtype: list
         """
@@ -40,9 +45,8 @@ class Team():
 
         if not team_players:
             players = await fetch(self._session, API_URLS["static"])
-            players = players["elements"]
-            team_players = [player for player in players
-                            if player["team"] == self.id]
+            team_players = get_player_index(
+                players["elements"]).where(team=self.id)
             self.players = team_players
 
         if return_json:
@@ -51,11 +55,15 @@ class Team():
         return [Player(player, self._session) for player in team_players]
 
     async def get_fixtures(self, return_json=False):
-        """Returns a list containing the team's fixtures.
+        """Returns a list containing the team's remaining fixtures, each with
+        ``is_home``, ``opponent``, the team's ``difficulty`` and
+        ``is_double`` added. The fixtures of all teams are taken from a single
+        (cached) download of https://fantasy.premierleague.com/api/fixtures/.
 
         :param return_json: (optional) Boolean. If ``True`` returns a list of
-            dicts, if ``False`` returns a list of TeamFixture objects.
-            Defaults to ``False``.
+            dicts, if ``False`` returns a list of TeamFixture objects. Defaults
+            to ``False``. The ``dict``s are shared and must not be modified
+            (see :class:`FPL <fpl.FPL>`).
         :type return_json: bool
         :rtype: list
         """
@@ -63,15 +71,9 @@ class Team():
         if fixtures:
             return fixtures
 
-        players = getattr(self, "players", [])
-        if not players:
-            await self.get_players()
-
-        player = self.players[0]
-        url = API_URLS["player"].format(player["id"])
-        player_summary = await fetch(self._session, url)
-
-        self.fixtures = player_summary["fixtures"]
+        store = await self._get_fixture_store()
+        self.fixtures = [fixture for fixture in store.get_team_fixtures(self.id)
+                         if not fixture.get("finished")]
 
         if return_json:
             return self.fixtures
@@ -79,5 +81,21 @@ class Team():
         # TODO: create TeamFixture
         return self.fixtures
 
+    async def get_schedule(self, gameweeks=None):
+        """Returns the team's schedule: a list with for each gameweek a dict
+        containing its ``event``, the team's ``fixtures`` and whether it's a
+        blank (``is_blank``) or double (``is_double``) gameweek for the team.
+
+        :param gameweeks: (optional) The IDs of the gameweeks. Defaults to all
+            gameweeks.
+        :rtype: list
+        """
+        store = await self._get_fixture_store()
+        return store.get_team_schedule(self.id, gameweeks)
+
+    async def _get_fixture_store(self):
+        fixtures = await fetch(self._session, API_URLS["fixtures"])
+        return get_fixture_store(fixtures)
+
     def __str__(self):
         return self.name
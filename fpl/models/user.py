@@ -6,6 +6,7 @@ from urllib3.util import response
 
 from ..constants import API_URLS, MIN_GAMEWEEK, MAX_GAMEWEEK
 from ..utils import fetch, logged_in, post, get_headers
+from .base import Model
 
 is_c = "is_captain"
 is_vc = "is_vice_captain"
@@ -103,7 +104,7 @@ def _set_captain(lineup, captain, captain_type, player_ids):
             player[captain_type] = True
 
 
-class User():
+class User(Model):
     """A class representing a user of the Fantasy Premier League.
 
     >>> from fpl import FPL
@@ -120,10 +121,11 @@ class User():
       Amos Bastian - Netherlands
     """
 
+    __slots__ = ("_session",)
+
     def __init__(self, user_information, session):
+        super().__init__(user_information)
         self._session = session
-        for k, v in user_information.items():
-            setattr(self, k, v)
 
     async def get_gameweek_history(self, gameweek=None):
         """Returns a list containing the gameweek history of the user.
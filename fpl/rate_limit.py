@@ -0,0 +1,138 @@
+import asyncio
+import math
+import time
+
+
+class TokenBucket:
+    """A token bucket allowing ``rate`` requests per second on average, with
+    bursts of at most ``capacity`` requests.
+
+    Waiting requests reserve a token before sleeping, which means requests
+    are let through in the order in which they arrived and no lock is needed.
+
+    :param float rate: The number of tokens added to the bucket per second.
+    :param int capacity: (optional) The maximum number of tokens in the
+        bucket. Defaults to ``rate`` rounded up.
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("rate must be a positive number.")
+
+        if capacity is None:
+            capacity = math.ceil(rate)
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+
+        self.rate = float(rate)
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+
+    def reserve(self):
+        """Takes a token from the bucket and returns the number of seconds the
+        caller must wait before using it.
+
+        :rtype: float
+        """
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        self._tokens -= 1
+
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+    async def acquire(self):
+        """Waits until a token is available and takes it."""
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """A class limiting the number of requests per second sent to each
+    endpoint of the Fantasy Premier League API.
+
+    Budgets are keyed by the names used in :data:`fpl.constants.API_URLS`.
+    A tuple of names shares a single budget, e.g. all league endpoints.
+    Requests to endpoints without a budget use the ``default`` budget, or are
+    not limited at all if it is ``None``. A budget is either a number of
+    requests per second, or a ``(rate, burst)`` tuple.
+
+    Basic usage::
+
+      >>> from fpl import FPL
+      >>> from fpl.rate_limit import RateLimiter
+      >>> import aiohttp
+      >>> import asyncio
+      >>>
+      >>> limiter = RateLimiter({
+      ...     "player": (10, 20),
+      ...     "user_picks": 5,
+      ...     ("league_classic", "league_h2h", "league_h2h_fixtures"): 2,
+      ...     "gameweek_live": (1, 2)
+      ... })
+      >>>
+      >>> async def main():
+      ...     async with aiohttp.ClientSession() as session:
+      ...         fpl = FPL(session, rate_limiter=limiter)
+      ...         players = await fpl.get_players(include_summary=True)
+      ...
+      >>> asyncio.run(main())
+
+    The same limiter can be given to several :class:`FPL <fpl.FPL>`
+    instances to make them share their budgets.
+
+    :param dict budgets: (optional) Maps endpoint names to budgets.
+    :param default: (optional) The budget of endpoints not in ``budgets``.
+    :type default: float or tuple
+    """
+
+    def __init__(self, budgets=None, default=None):
+        self._buckets = {}
+        for endpoints, budget in (budgets or {}).items():
+            if isinstance(endpoints, str):
+                endpoints = (endpoints,)
+
+            bucket = self._create_bucket(budget)
+            for endpoint in endpoints:
+                self._buckets[endpoint] = bucket
+
+        self._default = default
+        self._default_buckets = {}
+
+    @staticmethod
+    def _create_bucket(budget):
+        if isinstance(budget, (tuple, list)):
+            return TokenBucket(*budget)
+        return TokenBucket(budget)
+
+    def get_bucket(self, endpoint):
+        """Returns the token bucket of the given endpoint, or ``None`` if
+        requests to it are not limited.
+
+        :param string endpoint: The endpoint's name, or ``None`` if the URL
+            is not an endpoint of the API.
+        :rtype: :class:`TokenBucket` or ``None``
+        """
+        bucket = self._buckets.get(endpoint)
+        if bucket is not None or self._default is None:
+            return bucket
+
+        bucket = self._default_buckets.get(endpoint)
+        if bucket is None:
+            bucket = self._create_bucket(self._default)
+            self._default_buckets[endpoint] = bucket
+        return bucket
+
+    async def acquire(self, endpoint):
+        """Waits until a request to the given endpoint may be sent.
+
+        :param string endpoint: The endpoint's name.
+        """
+        bucket = self.get_bucket(endpoint)
+        if bucket is not None:
+            await bucket.acquire()
@@ -0,0 +1,126 @@
+from .constants import API_URLS, DEFAULT_MAX_CONCURRENCY
+from .utils import fetch, get_session_option, stream
+
+#: The fields of a player in bootstrap-static compared to decide whether their
+#: summary has changed. A player's summary history only gains a row in which
+#: they scored points or played minutes when one of these changes.
+DELTA_FIELDS = (
+    "total_points",
+    "minutes",
+    "event_points",
+    "news",
+    "now_cost",
+    "status"
+)
+
+
+def get_changed_players(old_elements, new_elements, fields=DELTA_FIELDS):
+    """Returns the IDs of the players in ``new_elements`` who are not in
+    ``old_elements``, or whose value of one of the given fields differs.
+
+    :param dict old_elements: The players of the previous bootstrap-static
+        response, keyed by ID like ``FPL.elements``.
+    :param dict new_elements: The players of the current bootstrap-static
+        response, keyed by ID.
+    :param tuple fields: (optional) The fields compared. Defaults to
+        :data:`DELTA_FIELDS`.
+    :rtype: set
+    """
+    changed = set()
+    for player_id, player in new_elements.items():
+        old_player = old_elements.get(player_id)
+        if old_player is None or any(
+                old_player.get(field) != player.get(field)
+                for field in fields):
+            changed.add(player_id)
+    return changed
+
+
+class SummaryRefresher:
+    """Keeps the summaries of all players up to date by comparing successive
+    bootstrap-static responses, and only downloading the summaries of the
+    players that changed (see :func:`get_changed_players`). The first refresh
+    downloads every summary.
+
+    The summaries are patched in place: ``summaries`` is the same ``dict``
+    after every refresh, with the changed players' summaries replaced and
+    those of players no longer in the game removed.
+
+    Basic usage::
+
+      >>> from fpl import FPL
+      >>> from fpl.refresh import SummaryRefresher
+      >>> import aiohttp
+      >>> import asyncio
+      >>>
+      >>> async def main():
+      ...     async with aiohttp.ClientSession() as session:
+      ...         refresher = SummaryRefresher(session)
+      ...         fpl = await FPL.create(session)
+      ...         await refresher.refresh(fpl.elements)
+      ...         # After the next gameweek
+      ...         fpl = await FPL.create(session)
+      ...         refreshed = await refresher.refresh(fpl.elements)
+      ...     return refresher.summaries
+      ...
+      >>> summaries = asyncio.run(main())
+
+    :param aiohttp.ClientSession session: The session used for the
+        downloads.
+    :param tuple fields: (optional) The fields compared. Defaults to
+        :data:`DELTA_FIELDS`.
+    :param int limit: (optional) The maximum number of summaries being
+        downloaded at once. Defaults to ``25``.
+    """
+
+    def __init__(self, session, fields=DELTA_FIELDS,
+                 limit=DEFAULT_MAX_CONCURRENCY):
+        self.session = session
+        self.fields = fields
+        self.limit = limit
+        #: The players' summaries, keyed by ID.
+        self.summaries = {}
+        self._elements = {}
+
+    async def refresh(self, elements):
+        """Downloads the summaries of the players whose summary changed since
+        the last refresh, and patches ``summaries`` with them. Returns the IDs
+        of the refreshed players.
+
+        If a download fails, the summaries downloaded before it are kept, and
+        the other changed players are refreshed again next time.
+
+        :param elements: The players of the current bootstrap-static
+            response, either a list or a ``dict`` keyed by ID like
+            ``FPL.elements``.
+        :type elements: list or dict
+        :rtype: set
+        """
+        if not isinstance(elements, dict):
+            elements = {player["id"]: player for player in elements}
+
+        for player_id in set(self._elements) - set(elements):
+            del self._elements[player_id]
+            self.summaries.pop(player_id, None)
+
+        changed = get_changed_players(self._elements, elements, self.fields)
+
+        refreshed = set()
+        summaries = stream(
+            (self._download(player_id) for player_id in sorted(changed)),
+            self.limit)
+        async for player_id, summary in summaries:
+            self.summaries[player_id] = summary
+            self._elements[player_id] = elements[player_id]
+            refreshed.add(player_id)
+        return refreshed
+
+    async def _download(self, player_id):
+        url = API_URLS["player"].format(player_id)
+
+        # A cached summary may be older than the change.
+        cache = get_session_option(self.session, "cache")
+        if cache is not None:
+            cache.invalidate(url)
+
+        return player_id, await fetch(self.session, url)
@@ -0,0 +1,145 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+class RetryPolicy:
+    """A class describing how failed requests to the Fantasy Premier League
+    API are retried.
+
+    A request is retried if it failed because of a connection error, or if
+    the API responded with a status code found in ``status_rules``. The delay
+    between attempts grows exponentially (``backoff_factor * 2 ** (attempt -
+    1)``), is capped at ``max_backoff`` and, if ``jitter`` is ``True``, is
+    randomised between 0 and that value. A ``Retry-After`` header sent by the
+    API takes precedence over the computed delay.
+
+    Basic usage::
+
+      >>> from fpl import FPL
+      >>> from fpl.retry import RetryPolicy
+      >>> import aiohttp
+      >>> import asyncio
+      >>>
+      >>> async def main():
+      ...     async with aiohttp.ClientSession() as session:
+      ...         policy = RetryPolicy(max_attempts=3, status_rules={503: 2})
+      ...         fpl = FPL(session, retry_policy=policy)
+      ...         player = await fpl.get_player_summary(302)
+      ...
+      >>> asyncio.run(main())
+
+    :param int max_attempts: (optional) The maximum number of attempts made
+        for a single request, including the first one. Defaults to ``5``.
+    :param float backoff_factor: (optional) The base delay in seconds.
+        Defaults to ``0.5``.
+    :param float max_backoff: (optional) The maximum delay in seconds between
+        two attempts. A ``Retry-After`` larger than this value is not waited
+        for. Defaults to ``30.0``.
+    :param bool jitter: (optional) Randomises the delay if ``True``. Defaults
+        to ``True``.
+    :param dict status_rules: (optional) Maps a status code to the maximum
+        number of attempts for responses with that status code. Status codes
+        that are not in the mapping are never retried.
+    """
+
+    DEFAULT_STATUS_RULES = {
+        429: 5,
+        500: 3,
+        502: 5,
+        503: 5,
+        504: 5
+    }
+
+    #: Status codes for which the API has not processed the request, meaning
+    #: a non-idempotent request (e.g. a transfer) can safely be sent again.
+    UNPROCESSED_STATUSES = frozenset([429, 503])
+
+    def __init__(self, max_attempts=5, backoff_factor=0.5, max_backoff=30.0,
+                 jitter=True, status_rules=None):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+
+        if status_rules is None:
+            status_rules = self.DEFAULT_STATUS_RULES
+        self.status_rules = dict(status_rules)
+
+    def should_retry(self, attempt, status=None, idempotent=True):
+        """Returns ``True`` if a request that failed on its ``attempt``-th
+        attempt should be sent again.
+
+        :param int attempt: The number of attempts made so far.
+        :param status: (optional) The response's status code, or ``None`` if
+            the request failed because of a connection error.
+        :type status: int or None
+        :param bool idempotent: (optional) ``False`` if sending the request
+            twice could have side effects, in which case only responses the
+            API did not process are retried. Defaults to ``True``.
+        :rtype: bool
+        """
+        if attempt >= self.max_attempts:
+            return False
+
+        if status is None:
+            return idempotent
+
+        if not idempotent and status not in self.UNPROCESSED_STATUSES:
+            return False
+
+        return attempt < self.status_rules.get(status, 0)
+
+    def get_backoff(self, attempt, retry_after=None):
+        """Returns the number of seconds to wait before the next attempt, or
+        ``None`` if the ``Retry-After`` asks to wait longer than
+        ``max_backoff``.
+
+        :param int attempt: The number of attempts made so far.
+        :param retry_after: (optional) The value of the response's
+            ``Retry-After`` header.
+        :type retry_after: string or None
+        :rtype: float or None
+        """
+        delay = parse_retry_after(retry_after)
+        if delay is not None:
+            return delay if delay <= self.max_backoff else None
+
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        return delay
+
+
+def parse_retry_after(retry_after):
+    """Returns the number of seconds given by a ``Retry-After`` header, which
+    is either a number of seconds or a HTTP date.
+
+    :param retry_after: The value of the ``Retry-After`` header.
+    :type retry_after: string or None
+    :rtype: float or None
+    """
+    if not retry_after:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
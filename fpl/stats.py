@@ -0,0 +1,198 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+#: The numeric fields of a player stored as columns by default. Fields the
+#: API returns as strings, e.g. ``form``, are converted to floats.
+NUMERIC_FIELDS = (
+    "total_points",
+    "minutes",
+    "now_cost",
+    "form",
+    "points_per_game",
+    "selected_by_percent",
+    "ict_index",
+    "influence",
+    "creativity",
+    "threat",
+    "goals_scored",
+    "assists",
+    "clean_sheets",
+    "bonus",
+    "team",
+    "element_type"
+)
+
+#: Metrics derived from the stored columns, computed by :class:`PlayerTable`.
+DERIVED_METRICS = ("pp90", "points_per_million")
+
+
+class PlayerTable:
+    """A columnar view of the players (``elements``) of bootstrap-static,
+    storing each numeric field as a NumPy array, so derived metrics, filters
+    and rankings are computed for all players at once. Requires NumPy, which
+    can be installed with ``pip install fpl[numpy]``.
+
+    Row ``i`` of every column belongs to the player with ID ``ids[i]``.
+
+    Basic usage::
+
+      >>> from fpl import FPL
+      >>> import aiohttp
+      >>> import asyncio
+      >>>
+      >>> async def main():
+      ...     async with aiohttp.ClientSession() as session:
+      ...         fpl = await FPL.create(session)
+      ...     table = fpl.players.table
+      ...     midfielders = table["element_type"] == 3
+      ...     return table.top("pp90", 10, mask=midfielders)
+      ...
+      >>> best_midfielders = asyncio.run(main())
+
+    :param elements: The players, either a list or a ``dict`` keyed by ID
+        like ``FPL.elements``.
+    :type elements: list or dict
+    :param tuple fields: (optional) The fields stored as columns. Defaults to
+        :data:`NUMERIC_FIELDS`.
+    :raises ImportError: NumPy is not installed
+    """
+
+    def __init__(self, elements, fields=NUMERIC_FIELDS):
+        if np is None:
+            raise ImportError(
+                "PlayerTable requires NumPy, install it with "
+                "`pip install fpl[numpy]`.")
+
+        if isinstance(elements, dict):
+            elements = list(elements.values())
+
+        self.ids = np.array([player["id"] for player in elements],
+                            dtype=np.int64)
+        self._rows = {player_id: row
+                      for row, player_id in enumerate(self.ids.tolist())}
+        self._columns = {
+            field: np.array([float(player.get(field) or 0)
+                             for player in elements], dtype=np.float64)
+            for field in fields
+        }
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, field):
+        return field in self._columns or field in DERIVED_METRICS
+
+    def __getitem__(self, field):
+        """Returns the column of the given field or derived metric.
+
+        :param string field: The field's name, e.g. ``"total_points"``.
+        :rtype: numpy.ndarray
+        """
+        if field in DERIVED_METRICS:
+            return getattr(self, field)
+        return self._columns[field]
+
+    @property
+    def fields(self):
+        """The names of the stored columns.
+
+        :rtype: list
+        """
+        return list(self._columns)
+
+    def get_row(self, player_id):
+        """Returns the row of the player with the given ID.
+
+        :param int player_id: A player's ID.
+        :rtype: int
+        :raises ValueError: Player with ``player_id`` not found
+        """
+        try:
+            return self._rows[int(player_id)]
+        except KeyError:
+            raise ValueError(f"Player with ID {player_id} not found")
+
+    def get(self, player_id, field):
+        """Returns the value of the given field or derived metric for the
+        player with the given ID.
+
+        :param int player_id: A player's ID.
+        :param string field: The field's name.
+        :rtype: float
+        """
+        return float(self[field][self.get_row(player_id)])
+
+    @property
+    def pp90(self):
+        """Points per 90 minutes of every player, like
+        :attr:`Player.pp90 <fpl.models.player.Player.pp90>`.
+
+        :rtype: numpy.ndarray
+        """
+        return self._divide(self["total_points"] * 90.0, self["minutes"])
+
+    @property
+    def points_per_million(self):
+        """Total points per £1m of every player's current cost.
+
+        :rtype: numpy.ndarray
+        """
+        return self._divide(self["total_points"] * 10.0, self["now_cost"])
+
+    @staticmethod
+    def _divide(numerator, denominator):
+        result = np.zeros_like(numerator)
+        np.divide(numerator, denominator, out=result,
+                  where=denominator != 0)
+        return result
+
+    def _get_values(self, metric):
+        if isinstance(metric, str):
+            return self[metric]
+        return np.asarray(metric, dtype=np.float64)
+
+    def rank(self, metric, descending=True, mask=None):
+        """Returns the IDs of the players sorted by the given metric. Players
+        with equal values keep their order in the table.
+
+        :param metric: A field, a derived metric, or an array with a value
+            for every row.
+        :type metric: string or numpy.ndarray
+        :param bool descending: (optional) Sorts the highest values first if
+            ``True``. Defaults to ``True``.
+        :param numpy.ndarray mask: (optional) A boolean array selecting the
+            players to rank, e.g. ``table["now_cost"] <= 80``.
+        :rtype: numpy.ndarray
+        """
+        values = self._get_values(metric)
+        rows = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        order = np.argsort(
+            -values[rows] if descending else values[rows], kind="stable")
+        return self.ids[rows[order]]
+
+    def top(self, metric, k, mask=None):
+        """Returns the IDs of the ``k`` players with the highest values of the
+        given metric, highest first. Only the top ``k`` values are sorted.
+
+        :param metric: A field, a derived metric, or an array with a value
+            for every row.
+        :type metric: string or numpy.ndarray
+        :param int k: The number of players.
+        :param numpy.ndarray mask: (optional) A boolean array selecting the
+            players to consider.
+        :rtype: numpy.ndarray
+        """
+        values = self._get_values(metric)
+        rows = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        if k <= 0:
+            return self.ids[:0]
+
+        values = -values[rows]
+        if k < len(rows):
+            top_k = np.argpartition(values, k - 1)[:k]
+            rows, values = rows[top_k], values[top_k]
+        # Sort by value, then by row for a deterministic order of ties
+        order = np.lexsort((rows, values))
+        return self.ids[rows[order]]
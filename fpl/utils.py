@@ -1,24 +1,374 @@
 import asyncio
+import collections
+import itertools
+import json
+import re
+import weakref
 from functools import update_wrapper
 
-from fpl.constants import API_URLS
+import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from fpl.constants import API_URLS, DEFAULT_DECODE_THRESHOLD
+from fpl.retry import DEFAULT_RETRY_POLICY
 
 headers = {"User-Agent": "https://github.com/amosbastian/fpl"}
 
+_session_options = weakref.WeakKeyDictionary()
+_in_flight = weakref.WeakKeyDictionary()
+
+
+class _Unlimited:
+    """An async context manager used instead of a semaphore when the number
+    of concurrent requests is not limited.
+    """
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+_unlimited = _Unlimited()
+
+
+def _endpoint_pattern(url):
+    """Returns a regular expression matching the URLs created by formatting
+    the given entry of ``API_URLS``, with or without a query string.
+    """
+    pattern = re.escape(url).replace(re.escape("{}"), "([^/]*)")
+    if "?" not in url:
+        pattern += r"(?:\?.*)?"
+    return re.compile(pattern + "$")
+
+
+# Longer URLs first, so e.g. "fixtures/?event={}" is matched before
+# "fixtures/".
+_endpoint_patterns = [
+    (name, _endpoint_pattern(url))
+    for name, url in sorted(API_URLS.items(), key=lambda item: -len(item[1]))
+]
+
+
+def match_endpoint(url):
+    """Returns the name of the ``API_URLS`` endpoint the given URL belongs to
+    and the arguments formatted into it, e.g. ``("player", ("1",))`` for
+    https://fantasy.premierleague.com/api/element-summary/1/, or
+    ``(None, ())`` if it doesn't belong to any endpoint.
+
+    :param string url: The URL.
+    :rtype: tuple
+    """
+    for name, pattern in _endpoint_patterns:
+        match = pattern.match(url)
+        if match:
+            return name, match.groups()
+    return None, ()
+
+
+def get_endpoint(url):
+    """Returns the name of the ``API_URLS`` endpoint the given URL belongs
+    to, e.g. ``"player"`` for
+    https://fantasy.premierleague.com/api/element-summary/1/, or ``None`` if
+    it doesn't belong to any endpoint.
+
+    :param string url: The URL.
+    :rtype: string or None
+    """
+    return match_endpoint(url)[0]
+
+
+def set_session_options(session, **options):
+    """Sets options used by :func:`fetch` and :func:`post` for every request
+    sent with the given session, e.g. ``retry_policy``, ``rate_limiter``,
+    ``cache`` or ``semaphore`` (an ``asyncio.Semaphore`` limiting the number
+    of concurrent requests, which may be shared by several sessions). Because
+    all models share the session of the :class:`FPL <fpl.FPL>` instance that
+    created them, they share its options as well.
+
+    Responses of at least ``decode_threshold`` bytes (defaults to
+    :data:`DEFAULT_DECODE_THRESHOLD <fpl.constants.DEFAULT_DECODE_THRESHOLD>`)
+    are decoded outside the event loop, in ``decode_executor`` (a
+    ``concurrent.futures.Executor``, defaults to the event loop's default
+    executor), see :func:`decode_response`.
+
+    :param aiohttp.ClientSession session: A session.
+    """
+    try:
+        _session_options.setdefault(session, {}).update(options)
+    except TypeError:
+        pass
+
+
+def set_default_session_options(session, **options):
+    """Sets the given options (see :func:`set_session_options`) for the
+    given session, except those that have already been set for it.
+
+    :param aiohttp.ClientSession session: A session.
+    """
+    try:
+        session_options = _session_options.setdefault(session, {})
+    except TypeError:
+        return
+
+    for name, value in options.items():
+        session_options.setdefault(name, value)
+
+
+def get_session_option(session, name, default=None):
+    """Returns the option with the given ``name`` set for the session, or
+    ``default`` if it has not been set.
 
-async def fetch(session, url):
+    :param aiohttp.ClientSession session: A session.
+    :param string name: The option's name.
+    """
+    try:
+        options = _session_options.get(session, {})
+    except TypeError:
+        return default
+
+    value = options.get(name)
+    return default if value is None else value
+
+
+def loads(body):
+    """Decodes the given JSON body, using orjson if it's installed (which can
+    be done with ``pip install fpl[orjson]``) and the standard library's
+    ``json`` otherwise.
+
+    :param body: The body.
+    :type body: bytes or string
+    :rtype: dict or list
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+async def decode_response(session, body):
+    """Decodes the given JSON body of a response received with the given
+    session using :func:`loads`. Bodies of at least the session's
+    ``decode_threshold`` bytes are decoded in its ``decode_executor``, so
+    decoding e.g. https://fantasy.premierleague.com/api/bootstrap-static/
+    doesn't block the other requests.
+
+    Since decoding holds the GIL, a ``concurrent.futures.ProcessPoolExecutor``
+    keeps the event loop more responsive than the default thread pool, at
+    the cost of sending the decoded response back to the event loop.
+
+    :param aiohttp.ClientSession session: A session.
+    :param bytes body: The body.
+    :rtype: dict or list
+    """
+    threshold = get_session_option(
+        session, "decode_threshold", DEFAULT_DECODE_THRESHOLD)
+    if len(body) < threshold:
+        return loads(body)
+
+    loop = asyncio.get_event_loop()
+    executor = get_session_option(session, "decode_executor")
+    return await loop.run_in_executor(executor, loads, body)
+
+
+async def fetch(session, url, retry_policy=None):
+    """Returns the JSON response of a GET request to the given URL.
+
+    Connection errors and responses with a status code listed in the retry
+    policy are retried; any other error response raises
+    ``aiohttp.ClientResponseError``. If a ``rate_limiter`` or ``semaphore``
+    is set for the session, every attempt waits for them before being sent.
+    If a ``cache`` is set for the session, fresh cached responses are
+    returned without sending a request, and expired ones are revalidated with
+    a conditional request; they are shared and must not be modified.
+
+    Concurrent calls fetching the same URL with the same session share a
+    single request and its response.
+
+    :param aiohttp.ClientSession session: A session.
+    :param string url: The URL.
+    :param retry_policy: (optional) The retry policy. Defaults to the policy
+        set for the session, or :data:`fpl.retry.DEFAULT_RETRY_POLICY`.
+    :type retry_policy: :class:`RetryPolicy <fpl.retry.RetryPolicy>`
+    """
+    cache = get_session_option(session, "cache")
+    if cache is not None:
+        data = cache.get(url)
+        if data is not None:
+            return data
+
+    try:
+        requests = _in_flight.setdefault(session, {})
+    except TypeError:
+        return await _fetch(session, url, retry_policy)
+
+    request = requests.get(url)
+    if request is None:
+        request = asyncio.ensure_future(_fetch(session, url, retry_policy))
+        requests[url] = request
+
+        def done(request):
+            if requests.get(url) is request:
+                del requests[url]
+            # Mark the exception as retrieved, in case all callers have been
+            # cancelled.
+            if not request.cancelled():
+                request.exception()
+
+        request.add_done_callback(done)
+
+    # Shielded, so cancelling one caller doesn't cancel the request of the
+    # others.
+    return await asyncio.shield(request)
+
+
+async def _fetch(session, url, retry_policy):
+    """Sends the GET request of :func:`fetch`, retrying and revalidating the
+    cached response as needed.
+    """
+    policy = retry_policy or get_session_option(
+        session, "retry_policy", DEFAULT_RETRY_POLICY)
+    semaphore = get_session_option(session, "semaphore", _unlimited)
+    rate_limiter = get_session_option(session, "rate_limiter")
+    cache = get_session_option(session, "cache")
+    endpoint, arguments = match_endpoint(url)
+
+    attempt = 0
     while True:
+        attempt += 1
+        if rate_limiter:
+            await rate_limiter.acquire(endpoint)
+
+        request_headers = headers
+        if cache is not None:
+            request_headers = dict(headers, **cache.get_validators(url))
+
         try:
-            async with session.get(url, headers=headers) as response:
-                assert response.status == 200
+            async with semaphore, session.get(
+                    url, headers=request_headers) as response:
+                if response.status == 304 and cache is not None:
+                    data = cache.revalidate(url, endpoint, arguments)
+                    if data is not None:
+                        return data
+                    # The cached response was evicted in the meantime, so send
+                    # an unconditional request instead.
+                    continue
+
+                if response.status < 400:
+                    body = await response.read()
+                    data = await decode_response(session, body)
+                    if cache is not None:
+                        cache.set(url, data, len(body), endpoint, arguments,
+                                  response.headers.get("ETag"),
+                                  response.headers.get("Last-Modified"),
+                                  body)
+                    return data
+
+                if not policy.should_retry(attempt, response.status):
+                    response.raise_for_status()
+
+                delay = policy.get_backoff(
+                    attempt, response.headers.get("Retry-After"))
+                if delay is None:
+                    response.raise_for_status()
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if not policy.should_retry(attempt):
+                raise
+            delay = policy.get_backoff(attempt)
+
+        await asyncio.sleep(delay)
+
+
+async def post(session, url, payload, headers, retry_policy=None):
+    """Returns the JSON response of a POST request to the given URL.
+
+    Since a POST request may have side effects, it is only retried if the
+    API responded with a status code meaning it did not process the request
+    (e.g. ``429 Too Many Requests``).
+
+    :param aiohttp.ClientSession session: A session.
+    :param string url: The URL.
+    :param string payload: The request's body.
+    :param dict headers: The request's headers.
+    :param retry_policy: (optional) The retry policy. Defaults to the policy
+        set for the session, or :data:`fpl.retry.DEFAULT_RETRY_POLICY`.
+    :type retry_policy: :class:`RetryPolicy <fpl.retry.RetryPolicy>`
+    """
+    policy = retry_policy or get_session_option(
+        session, "retry_policy", DEFAULT_RETRY_POLICY)
+    semaphore = get_session_option(session, "semaphore", _unlimited)
+    rate_limiter = get_session_option(session, "rate_limiter")
+    endpoint = get_endpoint(url)
+    attempt = 0
+
+    while True:
+        attempt += 1
+        if rate_limiter:
+            await rate_limiter.acquire(endpoint)
+
+        async with semaphore, session.post(
+                url, data=payload, headers=headers) as response:
+            delay = None
+            if policy.should_retry(
+                    attempt, response.status, idempotent=False):
+                delay = policy.get_backoff(
+                    attempt, response.headers.get("Retry-After"))
+
+            if delay is None:
                 return await response.json()
-        except Exception:
-            pass
 
+        await asyncio.sleep(delay)
 
-async def post(session, url, payload, headers):
-    async with session.post(url, data=payload, headers=headers) as response:
-        return await response.json()
+
+async def stream(coroutines, limit, ordered=False):
+    """Runs the given coroutines concurrently and yields their results as an
+    async generator, with at most ``limit`` of them running at once.
+    Coroutines are only taken from the iterable when there is room for them,
+    so a generator of coroutines doesn't create all of them up front.
+
+    If a coroutine raises an exception, or the generator is closed early, the
+    coroutines that are still running are cancelled.
+
+    :param coroutines: An iterable of coroutines.
+    :param int limit: The maximum number of coroutines running at once.
+    :param bool ordered: (optional) Yields the results in the order of the
+        coroutines if ``True``, or as soon as they are available if
+        ``False``. Defaults to ``False``.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1.")
+
+    coroutines = iter(coroutines)
+    pending = collections.deque()
+
+    def fill():
+        for coroutine in itertools.islice(coroutines, limit - len(pending)):
+            pending.append(asyncio.ensure_future(coroutine))
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                done = [await pending[0]]
+                pending.popleft()
+            else:
+                finished, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+                done = [task.result() for task in pending
+                        if task in finished]
+                for task in finished:
+                    pending.remove(task)
+
+            fill()
+            for result in done:
+                yield result
+    finally:
+        for task in pending:
+            task.cancel()
 
 
 async def get_total_players(session):
@@ -39,6 +39,10 @@ setup(
         "pytest",
         "requests"
     ],
+    extras_require={
+        "numpy": ["numpy"],
+        "orjson": ["orjson"]
+    },
     entry_points="""
         [console_scripts]
         fpl=fpl.cli:cli
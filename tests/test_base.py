@@ -0,0 +1,39 @@
+import pickle
+
+import pytest
+
+from fpl.models.base import Model
+from fpl.models.player import Player
+
+
+class TestModel(object):
+    @staticmethod
+    def test_attributes():
+        information = {"id": 1, "web_name": "Pogba", "total_points": 50}
+        model = Model(information)
+        for k, v in information.items():
+            assert getattr(model, k) == v
+        assert hasattr(model, "id")
+        assert not hasattr(model, "news")
+        with pytest.raises(AttributeError):
+            model.news
+        assert {"id", "web_name", "total_points"} <= set(dir(model))
+
+    @staticmethod
+    def test_set_attribute():
+        information = {"id": 1, "event_points": 3}
+        model = Model(information)
+        model.event_points *= 2
+        model.role = " (C)"
+        assert model.event_points == 6
+        assert model.role == " (C)"
+        assert information == {"id": 1, "event_points": 3}
+
+    @staticmethod
+    def test_pickle():
+        player = Player({"id": 1, "minutes": 90, "total_points": 5}, None)
+        player.is_captain = True
+        unpickled = pickle.loads(pickle.dumps(player))
+        assert unpickled.id == 1
+        assert unpickled.is_captain
+        assert unpickled.pp90 == 5.0
@@ -0,0 +1,105 @@
+from fpl.bonus import (calculate_bonus, get_fixture_bonus, get_gameweek_bonus,
+                       get_provisional_bonus_points)
+
+
+def create_bps(home, away):
+    """Returns the BPS of a fixture from ``{element: value}`` dicts."""
+    return {"h": [{"value": value, "element": element}
+                  for element, value in home.items()],
+            "a": [{"value": value, "element": element}
+                  for element, value in away.items()]}
+
+
+def create_fixture(fixture_id, home, away, started=True, finished=False):
+    bps = create_bps(home, away)
+    return {"id": fixture_id, "started": started, "finished": finished,
+            "stats": [{"identifier": "bps", "a": bps["a"], "h": bps["h"]},
+                      {"identifier": "bonus", "a": [], "h": []}]}
+
+
+class TestCalculateBonus(object):
+    @staticmethod
+    def test_no_ties():
+        bonus = calculate_bonus(create_bps({1: 30, 2: 10}, {3: 25, 4: 20}))
+        assert bonus == {"a": [{"value": 2, "element": 3},
+                               {"value": 1, "element": 4}],
+                         "h": [{"value": 3, "element": 1}]}
+        bonus = calculate_bonus(create_bps({1: 30, 2: 24}, {3: 25, 4: 20}))
+        assert bonus == {"a": [{"value": 2, "element": 3}],
+                         "h": [{"value": 3, "element": 1},
+                               {"value": 1, "element": 2}]}
+
+    @staticmethod
+    def test_tie_for_first():
+        bonus = calculate_bonus(create_bps({1: 30, 2: 10}, {3: 30, 4: 20}))
+        assert bonus == {"a": [{"value": 3, "element": 3},
+                               {"value": 1, "element": 4}],
+                         "h": [{"value": 3, "element": 1}]}
+
+        bonus = calculate_bonus(
+            create_bps({1: 30, 2: 30, 5: 1}, {3: 30, 4: 20}))
+        assert bonus == {"a": [{"value": 3, "element": 3}],
+                         "h": [{"value": 3, "element": 1},
+                               {"value": 3, "element": 2}]}
+
+    @staticmethod
+    def test_tie_for_second():
+        bonus = calculate_bonus(
+            create_bps({1: 30, 2: 20, 5: 10}, {3: 20, 4: 15}))
+        assert bonus == {"a": [{"value": 2, "element": 3}],
+                         "h": [{"value": 3, "element": 1},
+                               {"value": 2, "element": 2}]}
+
+    @staticmethod
+    def test_tie_for_third():
+        bonus = calculate_bonus(
+            create_bps({1: 30, 2: 20, 5: 10}, {3: 15, 4: 15}))
+        assert bonus == {"a": [{"value": 1, "element": 3},
+                               {"value": 1, "element": 4}],
+                         "h": [{"value": 3, "element": 1},
+                               {"value": 2, "element": 2}]}
+
+    @staticmethod
+    def test_fewer_than_three_values():
+        assert calculate_bonus(create_bps({}, {})) == {"a": [], "h": []}
+        bonus = calculate_bonus(create_bps({1: 30, 2: 20}, {3: 20}))
+        assert bonus == {"a": [], "h": []}
+
+
+class TestGameweekBonus(object):
+    @staticmethod
+    def test_get_fixture_bonus():
+        fixture = create_fixture(1, {1: 30, 2: 20}, {3: 10})
+        assert get_fixture_bonus(fixture) == {
+            "a": [{"value": 1, "element": 3}],
+            "h": [{"value": 3, "element": 1}, {"value": 2, "element": 2}]}
+        assert get_fixture_bonus(fixture, provisional=False) == {
+            "a": [], "h": []}
+
+        fixture["started"] = False
+        assert get_fixture_bonus(fixture) == {"a": [], "h": []}
+
+        fixture["started"] = fixture["finished"] = True
+        fixture["stats"][1]["h"] = [{"value": 3, "element": 2}]
+        assert get_fixture_bonus(fixture) == {
+            "a": [], "h": [{"value": 3, "element": 2}]}
+
+    @staticmethod
+    def test_get_gameweek_bonus():
+        fixtures = [create_fixture(1, {1: 30, 2: 20}, {3: 10}),
+                    create_fixture(2, {4: 30}, {5: 20, 6: 10},
+                                   started=False)]
+        assert get_gameweek_bonus(fixtures) == {
+            1: {"a": [{"value": 1, "element": 3}],
+                "h": [{"value": 3, "element": 1},
+                      {"value": 2, "element": 2}]},
+            2: {"a": [], "h": []}}
+
+    @staticmethod
+    def test_get_provisional_bonus_points():
+        fixtures = [create_fixture(1, {1: 30, 2: 20}, {3: 10}),
+                    create_fixture(2, {1: 30, 4: 20}, {5: 10}),
+                    create_fixture(3, {6: 30, 7: 20}, {8: 10},
+                                   finished=True)]
+        assert get_provisional_bonus_points(fixtures) == {
+            1: 6, 2: 2, 3: 1, 4: 2, 5: 1}
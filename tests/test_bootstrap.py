@@ -0,0 +1,127 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from fpl.bootstrap import BootstrapSnapshot, BootstrapStore, index_static
+from fpl.cache import ResponseCache
+from fpl.utils import set_session_options
+from tests.helper import AsyncMock
+
+static_data = {
+    "events": [
+        {"id": 1, "is_current": False},
+        {"id": 2, "is_current": True}
+    ],
+    "elements": [{"id": 1, "team": 1}, {"id": 2, "team": 2}],
+    "teams": [{"id": 1}, {"id": 2}],
+    "game_settings": {"league_join_private_max": 25},
+    "total_players": 100
+}
+
+
+def test_index_static():
+    attributes = index_static(static_data)
+    assert attributes["elements"] == {1: {"id": 1, "team": 1},
+                                      2: {"id": 2, "team": 2}}
+    assert attributes["game_settings"] == {"league_join_private_max": 25}
+    assert attributes["total_players"] == 100
+    assert attributes["current_gameweek"] == 2
+
+
+class TestBootstrapSnapshot(object):
+    @staticmethod
+    def test_attributes():
+        snapshot = BootstrapSnapshot(static_data)
+        assert snapshot.static is static_data
+        assert snapshot.current_gameweek == 2
+        assert set(snapshot.teams) == {1, 2}
+
+        with pytest.raises(AttributeError):
+            snapshot.unknown
+
+        with pytest.raises(TypeError):
+            snapshot.attributes["elements"] = {}
+
+
+class TestBootstrapStore(object):
+    async def test_get_downloads_once(self, loop, mocker):
+        mocked_fetch = mocker.patch(
+            "fpl.bootstrap.fetch", return_value=static_data,
+            new_callable=AsyncMock)
+        store = BootstrapStore()
+
+        snapshots = await asyncio.gather(
+            *[store.get(None) for _ in range(10)])
+        assert all(snapshot is snapshots[0] for snapshot in snapshots)
+        mocked_fetch.assert_called_once()
+
+        assert await store.get(None) is snapshots[0]
+        mocked_fetch.assert_called_once()
+
+    async def test_refresh_swaps_changed_snapshot(self, loop, mocker):
+        mocked_fetch = mocker.patch(
+            "fpl.bootstrap.fetch", return_value=static_data,
+            new_callable=AsyncMock)
+        store = BootstrapStore()
+        first = await store.get(None)
+
+        # The same (cached) response isn't indexed again
+        assert await store.refresh(None) is first
+
+        mocked_fetch.return_value = dict(static_data, total_players=101)
+        second = await store.refresh(None)
+        assert second is not first
+        assert store.snapshot is second
+        assert second.total_players == 101
+        assert first.total_players == 100
+
+    async def test_background_refresh(self, loop, mocker):
+        mocked_fetch = mocker.patch(
+            "fpl.bootstrap.fetch", return_value=static_data,
+            new_callable=AsyncMock)
+        store = BootstrapStore(interval=0.01)
+        store.start(None)
+        await asyncio.sleep(0.035)
+        await store.stop()
+
+        assert mocked_fetch.call_count >= 3
+        assert store.snapshot.static is static_data
+
+    async def test_refresh_bypasses_cache(self, loop, mocker, aiohttp_server):
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v2"':
+                return web.Response(status=304)
+
+            version = min(len(requests), 2)
+            return web.json_response(
+                dict(static_data, total_players=100 + version),
+                headers={"ETag": f'"v{version}"'})
+
+        app = web.Application()
+        app.router.add_get("/api/bootstrap-static/", handler)
+        server = await aiohttp_server(app)
+        mocker.patch.dict("fpl.bootstrap.API_URLS", {
+            "static": str(server.make_url("/api/bootstrap-static/"))})
+        mocker.patch("fpl.utils.match_endpoint",
+                     return_value=("static", ()))
+
+        store = BootstrapStore()
+        async with aiohttp.ClientSession() as session:
+            set_session_options(session, cache=ResponseCache())
+            first = await store.get(session)
+            assert first.total_players == 101
+
+            # The response is still fresh in the cache, but is downloaded
+            # again
+            second = await store.refresh(session)
+            assert second.total_players == 102
+            assert len(requests) == 2
+
+            # Not modified, so the snapshot is kept
+            assert await store.refresh(session) is second
+            assert len(requests) == 3
@@ -0,0 +1,270 @@
+import time
+
+import aiohttp
+from aiohttp import web
+
+from fpl import FPL
+from fpl.cache import PersistentCache, ResponseCache
+from fpl.constants import API_BASE_URL
+from fpl.utils import fetch, match_endpoint
+
+static_data = {
+    "events": [
+        {"id": 1, "finished": True, "data_checked": True},
+        {"id": 2, "finished": True, "data_checked": False},
+        {"id": 3, "finished": False, "data_checked": False}
+    ]
+}
+
+
+class TestResponseCache(object):
+    @staticmethod
+    def test_set_and_get():
+        cache = ResponseCache()
+        cache.set("static", static_data, 10, "static")
+        assert cache.get("static") is static_data
+        assert "static" in cache
+        assert len(cache) == 1
+        assert cache.size == 10
+
+    @staticmethod
+    def test_uncached_endpoints():
+        cache = ResponseCache()
+        cache.set("me", {"a": 1}, 10, "me")
+        cache.set("unknown", {"a": 1}, 10)
+        assert cache.get("me") is None
+        assert cache.get("unknown") is None
+        assert len(cache) == 0
+
+    @staticmethod
+    def test_live_endpoints_expire_together():
+        cache = ResponseCache()
+        assert cache.get_ttl("gameweek_fixtures", ("3",)) == cache.get_ttl(
+            "gameweek_live", ("3",))
+
+    @staticmethod
+    def test_login_endpoints_not_cached():
+        cache = ResponseCache()
+        for endpoint in ("league_classic", "league_h2h",
+                         "league_h2h_fixtures", "user_team",
+                         "user_latest_transfers", "me"):
+            cache.set(endpoint, {"a": 1}, 10, endpoint)
+            assert cache.get(endpoint) is None
+        assert len(cache) == 0
+
+    @staticmethod
+    def test_expiry():
+        cache = ResponseCache(ttls={"players": 0.01})
+        cache.set("players", [], 10, "players")
+        assert cache.get("players") == []
+        time.sleep(0.02)
+        assert cache.get("players") is None
+        assert cache.size == 0
+
+    @staticmethod
+    def test_final_gameweeks_never_expire():
+        cache = ResponseCache()
+        assert cache.get_ttl("gameweek_live", ("1",)) == 10
+
+        cache.set("static", static_data, 10, "static")
+        assert cache.get_ttl("gameweek_live", ("1",)) is None
+        assert cache.get_ttl("gameweek_live", ("2",)) == 10
+        assert cache.get_ttl("gameweek_live", ("3",)) == 10
+        assert cache.get_ttl("user_picks", ("91928", "1")) is None
+        assert cache.get_ttl("gameweek_fixtures", ("1",)) is None
+
+    @staticmethod
+    def test_lru_eviction_by_entries():
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", 1, 1, "players")
+        cache.set("b", 2, 1, "players")
+        cache.get("a")
+        cache.set("c", 3, 1, "players")
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    @staticmethod
+    def test_lru_eviction_by_bytes():
+        cache = ResponseCache(max_bytes=100)
+        cache.set("a", 1, 60, "players")
+        cache.set("b", 2, 60, "players")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.size == 60
+
+        cache.set("c", 3, 101, "players")
+        assert cache.get("c") is None
+        assert cache.size == 60
+
+    @staticmethod
+    def test_replace_entry():
+        cache = ResponseCache()
+        cache.set("a", 1, 10, "players")
+        cache.set("a", 2, 20, "players")
+        assert cache.get("a") == 2
+        assert cache.size == 20
+
+    @staticmethod
+    def test_invalidate_and_clear():
+        cache = ResponseCache()
+        cache.set("a", 1, 10, "players")
+        cache.set("b", 2, 10, "players")
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        assert cache.size == 10
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    @staticmethod
+    def test_expired_entry_kept_for_revalidation():
+        cache = ResponseCache(ttls={"players": 0.01})
+        cache.set("players", [], 10, "players", etag='"abc"',
+                  last_modified="Sat, 17 Aug 2019 10:00:00 GMT")
+        time.sleep(0.02)
+
+        assert cache.get("players") is None
+        assert cache.get_validators("players") == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Sat, 17 Aug 2019 10:00:00 GMT"
+        }
+
+        data = cache.revalidate("players", "players")
+        assert data == []
+        assert cache.get("players") is data
+
+    @staticmethod
+    def test_expire():
+        cache = ResponseCache()
+        cache.set("a", [], 10, "players", etag='"abc"')
+        cache.set("b", [], 10, "players")
+        cache.expire("a")
+        cache.expire("b")
+        cache.expire("c")
+
+        assert cache.get("a") is None
+        assert cache.get_validators("a") == {"If-None-Match": '"abc"'}
+        assert "b" not in cache._entries
+
+    @staticmethod
+    def test_expired_entry_without_validators_removed():
+        cache = ResponseCache(ttls={"players": 0.01})
+        cache.set("players", [], 10, "players")
+        time.sleep(0.02)
+
+        assert cache.get("players") is None
+        assert cache.get_validators("players") == {}
+        assert cache.revalidate("players", "players") is None
+
+
+class TestPersistentCache(object):
+    @staticmethod
+    def test_responses_survive_process(tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        cache = PersistentCache(path)
+        cache.set("players", [{"id": 1}], 11, "players", body=b'[{"id": 1}]')
+        cache.set("me", {"id": 1}, 9, "me", body=b'{"id": 1}')
+        cache.close()
+
+        cache = PersistentCache(path)
+        assert len(cache) == 0
+        assert cache.get("players") == [{"id": 1}]
+        assert cache.get("me") is None
+        assert cache.size == 11
+        cache.close()
+
+    @staticmethod
+    def test_journal_mode(tmp_path):
+        cache = PersistentCache(str(tmp_path / "cache.sqlite"))
+        mode = cache._connection.execute("PRAGMA journal_mode").fetchone()
+        assert mode == ("wal",)
+        cache.close()
+
+    @staticmethod
+    def test_final_gameweeks_survive_process(tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        cache = PersistentCache(path)
+        cache.set("static", static_data, 10, "static")
+        cache.set("picks", {"picks": []}, 12, "user_picks", ("91928", "1"))
+        cache.close()
+
+        cache = PersistentCache(path)
+        assert cache.get_ttl("user_picks", ("91928", "1")) is None
+        assert cache.get("picks") == {"picks": []}
+        assert cache._entries["picks"].expires is None
+        cache.close()
+
+    async def test_create_learns_final_gameweeks(self, loop, mocker, tmp_path,
+                                                 aiohttp_server):
+        async def static(request):
+            return web.json_response({"events": [
+                dict(event, is_current=event["id"] == 3)
+                for event in static_data["events"]]})
+
+        async def picks(request):
+            return web.json_response({"picks": []})
+
+        app = web.Application()
+        app.router.add_get("/api/bootstrap-static/", static)
+        app.router.add_get("/api/entry/91928/event/1/picks/", picks)
+        server = await aiohttp_server(app)
+        base_url = str(server.make_url("/api/"))
+        mocker.patch.dict("fpl.fpl.API_URLS", {
+            "static": base_url + "bootstrap-static/"})
+        mocker.patch("fpl.utils.match_endpoint", side_effect=lambda url: (
+            match_endpoint(url.replace(base_url, API_BASE_URL))))
+        mocker.patch("fpl.fpl.requests.get")
+
+        path = str(tmp_path / "cache.sqlite")
+        picks_url = base_url + "entry/91928/event/1/picks/"
+        cache = PersistentCache(path)
+        async with aiohttp.ClientSession() as session:
+            await FPL.create(session, cache=cache)
+            await fetch(session, picks_url)
+        cache.close()
+
+        # The picks of the finished gameweek never have to be fetched again
+        cache = PersistentCache(path)
+        assert cache.get(picks_url) == {"picks": []}
+        assert cache._entries[picks_url].expires is None
+        cache.close()
+
+    @staticmethod
+    def test_expired_responses_purged(tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        cache = PersistentCache(path, ttls={"players": 0.01})
+        cache.set("players", [], 2, "players")
+        cache.set("etag", [], 2, "players", etag='"abc"')
+        cache.close()
+        time.sleep(0.02)
+
+        cache = PersistentCache(path)
+        assert cache.get("players") is None
+        assert cache.get("etag") is None
+        assert cache.get_validators("etag") == {"If-None-Match": '"abc"'}
+        assert cache.revalidate("etag", "players") == []
+        cache.close()
+
+        cache = PersistentCache(path)
+        assert cache.get("etag") == []
+        cache.close()
+
+    @staticmethod
+    def test_invalidate_and_clear(tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        cache = PersistentCache(path)
+        cache.set("a", 1, 1, "players")
+        cache.set("b", 2, 1, "players")
+        cache.invalidate("a")
+        cache.close()
+
+        cache = PersistentCache(path)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        cache.clear()
+        cache.close()
+
+        cache = PersistentCache(path)
+        assert cache.get("b") is None
+        cache.close()
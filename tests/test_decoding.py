@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from fpl import utils
+from fpl.decoding import (Element, Fixture, LiveElement, StandingsRow,
+                          decode, to_records)
+
+
+class TestDecoding(object):
+    @staticmethod
+    def test_loads(monkeypatch):
+        body = json.dumps({"elements": [{"id": 1, "form": "2.5"}]}).encode()
+        assert utils.loads(body) == {"elements": [{"id": 1, "form": "2.5"}]}
+
+        monkeypatch.setattr(utils, "orjson", None)
+        assert utils.loads(body) == {"elements": [{"id": 1, "form": "2.5"}]}
+        assert utils.loads(body.decode()) == utils.loads(body)
+
+    @staticmethod
+    def test_from_dict():
+        element = Element.from_dict(
+            {"id": 1, "web_name": "Cech", "team": 1, "unknown": 3})
+        assert element.id == 1
+        assert element.web_name == "Cech"
+        assert element.now_cost is None
+        assert not hasattr(element, "unknown")
+        assert not hasattr(element, "__dict__")
+
+    @staticmethod
+    def test_to_records():
+        static = {"elements": [{"id": 1, "web_name": "Cech"},
+                               {"id": 2, "web_name": "Leno"}],
+                  "teams": [{"id": 1, "name": "Arsenal"}],
+                  "events": [{"id": 1, "finished": True}],
+                  "total_players": 8000000}
+        records = to_records(static, "static")
+        assert set(records) == {"elements", "teams", "events"}
+        assert [element.web_name for element in records["elements"]] == [
+            "Cech", "Leno"]
+        assert records["teams"][0].name == "Arsenal"
+        assert records["events"][0].finished
+
+        fixtures = to_records([{"id": 1, "team_h": 1, "team_a": 2}],
+                              "fixtures")["fixtures"]
+        assert fixtures == [Fixture.from_dict(
+            {"id": 1, "team_h": 1, "team_a": 2})]
+
+        league = {"standings": {"results": [{"entry": 1, "rank": 1}]}}
+        assert to_records(league, "league_classic")["standings"] == [
+            StandingsRow.from_dict({"entry": 1, "rank": 1})]
+
+        with pytest.raises(ValueError):
+            to_records({}, "settings")
+
+    @staticmethod
+    def test_decode():
+        live = {"elements": [{"id": 1, "stats": {"minutes": 90},
+                              "explain": []}]}
+        records = decode(json.dumps(live).encode(), "gameweek_live")
+        assert records == {"elements": [
+            LiveElement(id=1, stats={"minutes": 90}, explain=[])]}
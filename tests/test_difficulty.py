@@ -0,0 +1,107 @@
+import pytest
+
+from fpl.difficulty import DifficultyMatrix
+
+np = pytest.importorskip("numpy")
+
+
+def fixture(event, team_h, team_a, team_h_difficulty, team_a_difficulty):
+    return {"event": event, "team_h": team_h, "team_a": team_a,
+            "team_h_difficulty": team_h_difficulty,
+            "team_a_difficulty": team_a_difficulty}
+
+
+# Team 3 blanks in gameweek 2 and has a double in gameweek 3, team 4 blanks
+# in gameweek 3
+fixtures = [
+    fixture(1, 1, 2, 2, 4),
+    fixture(1, 3, 4, 3, 3),
+    fixture(2, 2, 1, 3, 3),
+    fixture(2, 4, 5, 5, 2),
+    fixture(3, 3, 1, 2, 4),
+    fixture(3, 2, 3, 3, 2),
+    fixture(None, 1, 3, 4, 4)
+]
+
+
+class TestDifficultyMatrix(object):
+    @staticmethod
+    def test_from_fixtures():
+        matrix = DifficultyMatrix.from_fixtures(fixtures, teams=5,
+                                                gameweeks=3)
+        assert matrix.difficulty.shape == (5, 3)
+        assert matrix.difficulty[0].tolist() == [2, 3, 4]
+        assert np.isnan(matrix.difficulty[2, 1])
+        assert matrix.difficulty[2, 2] == 4
+        assert matrix.is_blank[2].tolist() == [False, True, False]
+        assert matrix.is_double[2].tolist() == [False, False, True]
+
+    @staticmethod
+    def test_gameweeks_from_fixtures():
+        # The 2019/20 season ran past 38 gameweeks
+        matrix = DifficultyMatrix.from_fixtures(
+            fixtures + [fixture(39, 1, 2, 3, 3)], teams=5)
+        assert matrix.difficulty.shape == (5, 39)
+        assert matrix.difficulty[0, 38] == 3
+        assert matrix.is_blank[0, 3:38].all()
+
+        with pytest.raises(ValueError):
+            DifficultyMatrix.from_fixtures(
+                fixtures + [fixture(39, 1, 2, 3, 3)], teams=5, gameweeks=38)
+
+    @staticmethod
+    def test_rolling():
+        matrix = DifficultyMatrix.from_fixtures(fixtures, teams=5,
+                                                gameweeks=3)
+        assert matrix.get_rolling(2)[0].tolist() == [5, 7]
+        # Blank gameweeks are the hardest by default
+        assert matrix.get_rolling(2)[2].tolist() == [8, 9]
+        assert matrix.get_rolling(
+            2, blank_difficulty=0)[2].tolist() == [3, 4]
+        assert matrix.get_rolling(3, per_fixture=True)[2].tolist() == [
+            pytest.approx(7 / 3)]
+
+        with pytest.raises(ValueError):
+            matrix.get_rolling(0)
+
+    @staticmethod
+    def test_window():
+        matrix = DifficultyMatrix.from_fixtures(fixtures, teams=5,
+                                                gameweeks=3)
+        assert matrix.get_window(2, 2).tolist() == [7, 6, 9, 10, 7]
+        # Windows past the last gameweek are cut short
+        assert matrix.get_window(3, 5).tolist() == [4, 3, 4, 5, 5]
+        assert matrix.get_easiest(2, 2).tolist() == [2, 1, 5, 3, 4]
+        assert matrix.get_easiest(
+            2, 2, blank_difficulty=0).tolist() == [5, 3, 4, 2, 1]
+
+        # Teams without fixtures come last when averaging per fixture
+        assert matrix.get_easiest(
+            2, 2, per_fixture=True).tolist() == [3, 5, 2, 1, 4]
+        assert matrix.get_easiest(
+            3, 1, per_fixture=True).tolist() == [3, 2, 1, 4, 5]
+
+    @staticmethod
+    def test_window_after_last_gameweek():
+        matrix = DifficultyMatrix.from_fixtures(fixtures, teams=5,
+                                                gameweeks=3)
+        assert np.isnan(matrix.get_window(4, 6)).all()
+        assert matrix.get_easiest(4, 6).tolist() == [1, 2, 3, 4, 5]
+
+        with pytest.raises(ValueError):
+            matrix.get_window(0, 2)
+
+    @staticmethod
+    def test_from_fdr():
+        fdr = {"Arsenal": {"all": {"H": 1.0, "A": 2.0}},
+               "Aston Villa": {"all": {"H": 4.0, "A": 5.0}}}
+        matrix = DifficultyMatrix.from_fdr(fixtures[:1], fdr, teams=4,
+                                           gameweeks=1)
+        # Arsenal (1) host Aston Villa (2), so Arsenal get Villa's FDR for
+        # players playing at home, and Villa get Arsenal's for players
+        # playing away
+        assert matrix.difficulty[:2, 0].tolist() == [4.0, 2.0]
+
+        matrix = DifficultyMatrix.from_fdr(fixtures[1:2], fdr, teams=4,
+                                           gameweeks=1)
+        assert matrix.difficulty[2:, 0].tolist() == [3.0, 3.0]
@@ -0,0 +1,181 @@
+import math
+
+import pytest
+
+from fpl.fdr import FDREngine, PointsAgainstTensor
+from fpl.utils import average, scale
+
+
+def row(fixture, opponent, was_home, points, minutes=90):
+    return {"fixture": fixture, "round": fixture, "opponent_team": opponent,
+            "was_home": was_home, "total_points": points, "minutes": minutes}
+
+
+players = {
+    1: {"id": 1, "element_type": 1},
+    2: {"id": 2, "element_type": 3},
+    3: {"id": 3, "element_type": 4}
+}
+
+summaries = {
+    1: {"history": [row(1, 2, True, 6), row(2, 3, False, 1)]},
+    2: {"history": [row(1, 2, True, 10), row(2, 3, False, 2),
+                    row(3, 1, True, 0, minutes=0)]},
+    3: {"history": [row(4, 1, False, 4), row(5, 2, True, 8)]}
+}
+
+
+def original_fdr(players, summaries):
+    """The FDR as calculated by FPL.FDR before it used the engine."""
+    positions = ["all", "goalkeeper", "defender", "midfielder", "forward"]
+    names = {1: "goalkeeper", 3: "midfielder", 4: "forward"}
+    teams = {1: "Arsenal", 2: "Aston Villa", 3: "Bournemouth"}
+    points_against = {}
+    for player_id, summary in summaries.items():
+        position = names[players[player_id]["element_type"]]
+        for fixture in summary["history"]:
+            if fixture["minutes"] == 0:
+                continue
+            location = "H" if fixture["was_home"] else "A"
+            team = points_against.setdefault(
+                teams[fixture["opponent_team"]],
+                {p: {"H": [], "A": []} for p in positions})
+            team["all"][location].append(fixture["total_points"])
+            team[position][location].append(fixture["total_points"])
+
+    for team in points_against.values():
+        for locations in team.values():
+            for location in ("H", "A"):
+                locations[location] = average(locations[location])
+
+    for position in positions:
+        for location in ("H", "A"):
+            values = [team[position][location]
+                      for team in points_against.values()]
+            min_, max_ = min(values), max(values)
+            for team in points_against.values():
+                if max_ > min_:
+                    team[position][location] = scale(
+                        team[position][location], 5.0, 1.0, min_, max_)
+                else:
+                    team[position][location] = 3.0
+    return points_against
+
+
+class TestFDREngine(object):
+    @staticmethod
+    def test_get_fdr():
+        engine = FDREngine()
+        engine.ingest_summaries(players, summaries)
+        assert len(engine) == 6
+        assert engine.get_fdr() == original_fdr(players, summaries)
+
+        averages = engine.get_average_points_against()
+        assert averages["Aston Villa"]["all"]["H"] == 8.0
+        assert averages["Aston Villa"]["defender"]["H"] == 0.0
+
+    @staticmethod
+    def test_ingest_is_incremental():
+        engine = FDREngine()
+        engine.ingest_summaries(players, summaries)
+        fdr = engine.get_fdr()
+        assert engine.get_fdr() == fdr
+
+        # Ingesting the same rows again changes nothing
+        engine.ingest_summaries(players, summaries, [1, 2])
+        assert engine.get_fdr() == fdr
+
+        # A new gameweek and a bonus correction of an earlier row
+        new_summaries = dict(summaries)
+        new_summaries[2] = {"history": summaries[2]["history"][:2] +
+                            [row(3, 1, True, 5)]}
+        new_summaries[3] = {"history": [row(4, 1, False, 7),
+                                        row(5, 2, True, 8)]}
+        engine.ingest_summaries(players, new_summaries, [2, 3])
+        assert len(engine) == 7
+        assert engine.get_fdr() == original_fdr(players, new_summaries)
+
+    @staticmethod
+    def test_remove_player():
+        engine = FDREngine()
+        engine.ingest_summaries(players, summaries)
+        engine.remove_player(3)
+        remaining = {1: summaries[1], 2: summaries[2]}
+        assert engine.get_fdr() == original_fdr(players, remaining)
+
+    @staticmethod
+    def test_get_fdr_returns_copy():
+        engine = FDREngine()
+        engine.ingest_summaries(players, summaries)
+        engine.get_fdr()["Arsenal"]["all"]["A"] = 0
+        assert engine.get_fdr()["Arsenal"]["all"]["A"] != 0
+
+
+class TestPointsAgainstTensor(object):
+    @staticmethod
+    def test_from_summaries():
+        pytest.importorskip("numpy")
+        tensor = PointsAgainstTensor.from_summaries(
+            players, summaries, gameweeks=5)
+        assert tensor.totals.shape == (20, 4, 2, 5)
+        # Player 2 (midfielder) scored 10 at home against team 2 in GW 1
+        assert tensor.totals[1, 2, 0, 0] == 10
+        assert tensor.counts.sum() == 6
+
+        player_list = [dict(players[player_id], **summary)
+                       for player_id, summary in summaries.items()]
+        other = PointsAgainstTensor.from_players(player_list, gameweeks=5)
+        assert (other.totals == tensor.totals).all()
+
+    @staticmethod
+    def test_gameweeks_from_history():
+        pytest.importorskip("numpy")
+        # The 2019/20 season ran past 38 gameweeks
+        history = [{"opponent_team": 2, "was_home": True, "round": 39,
+                    "total_points": 6, "minutes": 90}]
+        tensor = PointsAgainstTensor.from_histories([(3, history)])
+        assert tensor.totals.shape == (20, 4, 2, 39)
+        assert tensor.totals[1, 2, 0, 38] == 6
+        assert tensor.get_last(6) == range(34, 40)
+        assert tensor.get_average_points_against(range(39, 48))[
+            1, 3, 0] == 6.0
+
+        with pytest.raises(ValueError):
+            PointsAgainstTensor.from_histories([(3, history)], gameweeks=38)
+
+    @staticmethod
+    def test_get_fdr():
+        pytest.importorskip("numpy")
+        tensor = PointsAgainstTensor.from_summaries(
+            players, summaries, gameweeks=5)
+        engine = FDREngine()
+        engine.ingest_summaries(players, summaries)
+
+        averages = tensor.get_average_points_against()
+        assert averages[1, 0, 0] == 8.0
+        assert math.isnan(averages[5, 0, 0])
+
+        fdr = tensor.to_dict(tensor.get_fdr())
+        expected = engine.get_fdr()
+        assert set(fdr) == set(expected)
+        for team, positions in expected.items():
+            for position, locations in positions.items():
+                for location, value in locations.items():
+                    assert fdr[team][position][location] == pytest.approx(
+                        value)
+
+    @staticmethod
+    def test_get_fdr_window():
+        np = pytest.importorskip("numpy")
+        tensor = PointsAgainstTensor.from_summaries(
+            players, summaries, gameweeks=5)
+        assert tensor.get_last(2) == range(4, 6)
+        assert tensor.get_last(10, current_gameweek=3) == range(1, 4)
+
+        # Only the goalkeeper and midfielder played in GW 1 and 2
+        window = {1: summaries[1], 2: {"history": summaries[2]["history"]}}
+        expected = PointsAgainstTensor.from_summaries(
+            players, window, gameweeks=5).get_fdr()
+        fdr = tensor.get_fdr(range(1, 3))
+        np.testing.assert_array_equal(fdr, expected)
+        assert sorted(tensor.to_dict(fdr)) == ["Aston Villa", "Bournemouth"]
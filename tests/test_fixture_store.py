@@ -0,0 +1,118 @@
+import datetime
+
+import pytest
+
+from fpl.fixture_store import (FixtureStore, get_fixture_store,
+                               get_kickoff_date)
+from tests.helper import AsyncMock
+
+fixtures = [
+    {"id": 1, "event": 1, "team_h": 1, "team_a": 2,
+     "kickoff_time": "2019-08-10T14:00:00Z", "started": True,
+     "finished": True},
+    {"id": 2, "event": 1, "team_h": 3, "team_a": 4,
+     "kickoff_time": "2019-08-09T19:00:00Z", "started": True,
+     "finished": True},
+    {"id": 3, "event": 2, "team_h": 2, "team_a": 3,
+     "kickoff_time": "2019-08-17T14:00:00Z", "started": True,
+     "finished": False},
+    {"id": 4, "event": 2, "team_h": 4, "team_a": 1,
+     "kickoff_time": "2019-08-18T16:30:00Z", "started": False,
+     "finished": False},
+    {"id": 5, "event": None, "team_h": 1, "team_a": 3,
+     "kickoff_time": None, "started": False, "finished": False}
+]
+
+
+def ids(fixtures):
+    return [fixture["id"] for fixture in fixtures]
+
+
+def test_get_kickoff_date():
+    assert get_kickoff_date(fixtures[0]) == datetime.date(2019, 8, 10)
+    assert get_kickoff_date(fixtures[4]) is None
+
+
+class TestFixtureStore(object):
+    @staticmethod
+    def test_get():
+        store = FixtureStore(fixtures)
+        assert len(store) == 5
+        assert store.get(3) is fixtures[2]
+        assert store.get("3") is fixtures[2]
+        assert 6 not in store
+        assert "3" in store
+        assert "three" not in store
+        assert None not in store
+
+        with pytest.raises(ValueError):
+            store.get(6)
+
+    @staticmethod
+    def test_get_fixtures():
+        store = FixtureStore(fixtures)
+        assert ids(store) == [2, 1, 3, 4, 5]
+        assert ids(store.get_fixtures(gameweek=1)) == [2, 1]
+        assert ids(store.get_fixtures(team=1)) == [1, 4, 5]
+        assert ids(store.get_fixtures(team=1, gameweek=2)) == [4]
+        assert ids(store.get_fixtures(
+            date=datetime.date(2019, 8, 17))) == [3]
+        assert ids(store.get_fixtures(team=3, gameweeks=range(1, 3))) == [
+            2, 3]
+        assert store.get_fixtures(gameweek=38) == []
+        assert store.get_gameweeks() == [1, 2]
+        assert store.get_live_gameweeks() == [2]
+
+    @staticmethod
+    def test_update():
+        store = FixtureStore(fixtures)
+        postponed = dict(fixtures[3], event=3,
+                         kickoff_time="2019-08-25T16:30:00Z")
+        store.update([postponed])
+        assert len(store) == 5
+        assert store.get(4) is postponed
+        assert ids(store.get_fixtures(gameweek=2)) == [3]
+        assert ids(store.get_fixtures(gameweek=3)) == [4]
+        assert store.get_fixtures(date=datetime.date(2019, 8, 18)) == []
+
+    @staticmethod
+    def test_get_team_fixtures():
+        double = {"id": 6, "event": 2, "team_h": 1, "team_a": 4,
+                  "team_h_difficulty": 3, "team_a_difficulty": 2,
+                  "kickoff_time": "2019-08-20T19:00:00Z"}
+        store = FixtureStore(fixtures + [double])
+
+        team_fixtures = store.get_team_fixtures(4)
+        assert ids(team_fixtures) == [2, 4, 6]
+        assert [f["is_home"] for f in team_fixtures] == [False, True, False]
+        assert [f["opponent"] for f in team_fixtures] == [3, 1, 1]
+        assert [f["is_double"] for f in team_fixtures] == [False, True, True]
+        assert team_fixtures[2]["difficulty"] == 2
+        assert "is_home" not in double
+
+        schedule = store.get_team_schedule(4, range(1, 4))
+        assert [gameweek["event"] for gameweek in schedule] == [1, 2, 3]
+        assert [gameweek["is_blank"] for gameweek in schedule] == [
+            False, False, True]
+        assert [gameweek["is_double"] for gameweek in schedule] == [
+            False, True, False]
+        assert ids(schedule[1]["fixtures"]) == [4, 6]
+
+    async def test_refresh_live(self, loop, mocker):
+        finished = dict(fixtures[2], finished=True)
+        mocked_fetch = mocker.patch(
+            "fpl.fixture_store.fetch", return_value=[finished, fixtures[3]],
+            new_callable=AsyncMock)
+        store = FixtureStore(fixtures)
+
+        assert await store.refresh_live(None) == [2]
+        mocked_fetch.assert_called_once_with(
+            None, "https://fantasy.premierleague.com/api/fixtures/?event=2")
+        assert store.get(3) is finished
+        assert store.get_live_gameweeks() == []
+
+
+def test_get_fixture_store():
+    store = get_fixture_store(fixtures)
+    assert get_fixture_store(fixtures) is store
+    assert get_fixture_store(list(fixtures)) is not store
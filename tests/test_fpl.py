@@ -1,7 +1,10 @@
+import asyncio
+
 import aiohttp
 import pytest
 
 from fpl import FPL
+from fpl.bootstrap import BootstrapStore
 from fpl.models.classic_league import ClassicLeague
 from fpl.models.fixture import Fixture
 from fpl.models.gameweek import Gameweek
@@ -9,6 +12,9 @@ from fpl.models.h2h_league import H2HLeague
 from fpl.models.player import Player, PlayerSummary
 from fpl.models.team import Team
 from fpl.models.user import User
+from fpl.rate_limit import RateLimiter
+from fpl.retry import RetryPolicy
+from fpl.utils import get_session_option
 from tests.helper import AsyncMock
 
 
@@ -34,6 +40,59 @@ class TestFPL(object):
         assert all([isinstance(getattr(fpl, key), int) for key in keys[-2:]])
         await session.close()
 
+    async def test_create(self, loop, mocker):
+        mocked_get = mocker.patch("fpl.fpl.requests.get")
+        session = aiohttp.ClientSession()
+        fpl = await FPL.create(session)
+        mocked_get.assert_not_called()
+        assert fpl.session is session
+        keys = ["events", "teams", "elements", "current_gameweek"]
+        assert all([hasattr(fpl, key) for key in keys])
+        assert all([isinstance(getattr(fpl, key), dict) for key in keys[:-1]])
+        assert isinstance(fpl.current_gameweek, int)
+        await session.close()
+
+    async def test_create_from_bootstrap(self, loop, mocker):
+        static = {
+            "events": [{"id": 1, "is_current": True}],
+            "elements": [{"id": 1}],
+            "teams": [{"id": 1}]
+        }
+        mocked_fetch = mocker.patch(
+            "fpl.bootstrap.fetch", return_value=static,
+            new_callable=AsyncMock)
+        store = BootstrapStore()
+        session = aiohttp.ClientSession()
+        first = await FPL.create(session, bootstrap=store)
+        second = await FPL.create(session, bootstrap=store)
+        mocked_fetch.assert_called_once()
+        assert first.elements is second.elements
+        assert first.current_gameweek == 1
+        await session.close()
+
+    async def test_create_keeps_session_options(self, loop, mocker):
+        static = {"events": [{"id": 1, "is_current": True}]}
+        mocker.patch("fpl.fpl.fetch", return_value=static,
+                     new_callable=AsyncMock)
+        session = aiohttp.ClientSession()
+        policy = RetryPolicy(max_attempts=2)
+        rate_limiter = RateLimiter()
+        await FPL.create(session, retry_policy=policy,
+                         rate_limiter=rate_limiter, cache=None)
+        semaphore = get_session_option(session, "semaphore")
+        assert isinstance(semaphore, asyncio.Semaphore)
+
+        # Options that aren't given keep the value set for the session
+        await FPL.create(session)
+        assert get_session_option(session, "semaphore") is semaphore
+        assert get_session_option(session, "retry_policy") is policy
+        assert get_session_option(session, "rate_limiter") is rate_limiter
+        assert get_session_option(session, "cache") is None
+
+        await FPL.create(session, max_concurrency=5)
+        assert get_session_option(session, "semaphore") is not semaphore
+        await session.close()
+
     async def test_user(self, loop, fpl):
         # test negative id
         with pytest.raises(AssertionError):
@@ -120,6 +179,41 @@ class TestFPL(object):
 
         assert isinstance(player_with_summary.fixtures, list)
 
+    async def test_player_lookup(self, loop):
+        fpl = FPL.__new__(FPL)
+        fpl.session = None
+        fpl.elements = {1: {"id": 1}, 2: {"id": 2}}
+
+        player = await fpl.get_player("2", return_json=True)
+        assert player is fpl.elements[2]
+
+        players = [{"id": 3}]
+        player = await fpl.get_player(3, players, return_json=True)
+        assert player is players[0]
+
+        with pytest.raises(ValueError):
+            await fpl.get_player(3)
+
+    async def test_stream_players(self, loop, mocker):
+        async def get_summary(session, url):
+            player_id = int(url.rstrip("/").split("/")[-1])
+            await asyncio.sleep(0.01 * (3 - player_id))
+            return {"history": [player_id]}
+
+        mocker.patch("fpl.fpl.fetch", get_summary)
+        fpl = FPL.__new__(FPL)
+        fpl.session = None
+        fpl.elements = {1: {"id": 1}, 2: {"id": 2}}
+
+        summaries = [summary async for summary in
+                     fpl.stream_player_summaries([1, 2], return_json=True)]
+        assert summaries == [{"history": [2]}, {"history": [1]}]
+
+        players = [player async for player in fpl.stream_players(
+            include_summary=True, ordered=True)]
+        assert [player.id for player in players] == [1, 2]
+        assert players[0].history == [1]
+
     async def test_players(self, loop, fpl):
         players = await fpl.get_players()
         assert isinstance(players, list)
@@ -147,6 +241,25 @@ class TestFPL(object):
         fixture = await fpl.get_fixture(6, return_json=True)
         assert isinstance(fixture, dict)
 
+    async def test_fixture_store(self, loop, mocker):
+        fixtures = [{"id": 1, "event": 1, "team_h": 1, "team_a": 2,
+                     "kickoff_time": "2019-08-10T14:00:00Z"}]
+        mocked_fetch = mocker.patch(
+            "fpl.fpl.fetch", return_value=fixtures, new_callable=AsyncMock)
+        fpl = FPL.__new__(FPL)
+        fpl.session = None
+
+        fixture = await fpl.get_fixture(1)
+        assert isinstance(fixture, Fixture)
+        mocked_fetch.assert_called_once()
+
+        store = await fpl.get_fixture_store()
+        assert await fpl.get_fixture_store() is store
+        assert await fpl.get_fixtures_by_id([1, 2], return_json=True) == [
+            fixtures[0]]
+        assert await fpl.get_fixtures_by_id(["1"], return_json=True) == [
+            fixtures[0]]
+
     async def test_fixtures_by_id(self, loop, fpl):
         # test empty fixture ids
         fixtures = await fpl.get_fixtures_by_id([])
@@ -0,0 +1,48 @@
+from fpl.indexes import PlayerIndex, get_player_index
+
+elements = [
+    {"id": 1, "team": 1, "element_type": 1, "status": "a", "now_cost": 45},
+    {"id": 2, "team": 1, "element_type": 3, "status": "a", "now_cost": 80},
+    {"id": 3, "team": 1, "element_type": 3, "status": "i", "now_cost": 105},
+    {"id": 4, "team": 2, "element_type": 3, "status": "a", "now_cost": 75},
+    {"id": 5, "team": 2, "element_type": 4, "status": "d", "now_cost": 60},
+    {"id": 6, "team": 3, "element_type": 3, "status": "a", "now_cost": 80},
+]
+
+
+def ids(players):
+    return [player["id"] for player in players]
+
+
+class TestPlayerIndex(object):
+    @staticmethod
+    def test_where_equality():
+        index = PlayerIndex(elements)
+        assert ids(index.where(team=1)) == [1, 2, 3]
+        assert ids(index.where(element_type=3)) == [2, 3, 4, 6]
+        assert ids(index.where(team=1, element_type=3)) == [2, 3]
+        assert ids(index.where(element_type=3, status="a")) == [2, 4, 6]
+        assert index.where(team=20) == []
+
+    @staticmethod
+    def test_where_cost():
+        index = PlayerIndex(elements)
+        assert ids(index.where(max_cost=75)) == [1, 4, 5]
+        assert ids(index.where(min_cost=80)) == [2, 3, 6]
+        assert ids(index.where(min_cost=60, max_cost=80)) == [2, 4, 5, 6]
+        assert index.where(min_cost=90, max_cost=80) == []
+        assert ids(index.where(team=1, element_type=3, max_cost=80)) == [2]
+
+    @staticmethod
+    def test_where_without_conditions():
+        index = PlayerIndex({player["id"]: player for player in elements})
+        assert ids(index.where()) == [1, 2, 3, 4, 5, 6]
+        assert len(index) == 6
+        assert index[4] is elements[3]
+        assert sorted(index.get_values("status")) == ["a", "d", "i"]
+
+
+def test_get_player_index():
+    index = get_player_index(elements)
+    assert get_player_index(elements) is index
+    assert get_player_index(list(elements)) is not index
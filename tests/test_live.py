@@ -0,0 +1,146 @@
+from fpl.live import (LiveEvent, LiveGameweek, get_events,
+                      get_fixture_stat, get_provisional_bonus, poll_events)
+from tests.helper import AsyncMock
+
+
+def element(element_id, total_points=2, bonus=0, bps=10):
+    return {"id": element_id,
+            "stats": {"total_points": total_points, "bonus": bonus,
+                      "bps": bps}}
+
+
+def fixture(fixture_id, home_bps, away_bps, started=True, finished=False):
+    return {"id": fixture_id, "started": started, "finished": finished,
+            "stats": [{"identifier": "bps",
+                       "h": [{"element": e, "value": v} for e, v in home_bps],
+                       "a": [{"element": e, "value": v} for e, v in away_bps]
+                       }]}
+
+
+class TestLiveHelpers(object):
+    @staticmethod
+    def test_get_fixture_stat():
+        stat = get_fixture_stat(fixture(1, [(1, 30)], [(2, 20)]), "bps")
+        assert stat["h"] == [{"element": 1, "value": 30}]
+        assert get_fixture_stat({"stats": []}, "bps") is None
+
+    @staticmethod
+    def test_get_events():
+        old = {"id": 1, "stats": {"goals_scored": 0, "minutes": 60,
+                                  "total_points": 2, "bps": 10}}
+        new = {"id": 1, "stats": {"goals_scored": 2, "minutes": 70,
+                                  "total_points": 12, "bps": 10}}
+        events = get_events(old, new)
+        assert events == [LiveEvent("goal", 1, 2, 0),
+                          LiveEvent("minutes", 1, 70, 60),
+                          LiveEvent("points", 1, 12, 2)]
+        assert events[0].delta == 2
+
+    @staticmethod
+    def test_get_provisional_bonus():
+        bps = ([(1, 30), (2, 25)], [(3, 20), (4, 5)])
+        assert get_provisional_bonus(fixture(1, *bps)) == {1: 3, 2: 2, 3: 1}
+        assert get_provisional_bonus(fixture(1, *bps, finished=True)) == {}
+        assert get_provisional_bonus(fixture(1, *bps, started=False)) == {}
+
+
+class TestLiveGameweek(object):
+    @staticmethod
+    def test_apply():
+        live_gameweek = LiveGameweek(None, 1)
+        elements = [element(1), element(2), element(3), element(4)]
+        fixtures = [fixture(1, [(1, 30), (2, 25)], [(3, 20), (4, 5)])]
+
+        changed = live_gameweek.apply({"elements": elements}, fixtures)
+        assert changed == {1, 2, 3, 4}
+        assert live_gameweek.bonus == {1: 3, 2: 2, 3: 1}
+        assert live_gameweek.elements[1]["stats"]["total_points"] == 5
+        assert live_gameweek.elements[4] is elements[3]
+        # The live data aren't modified
+        assert elements[0]["stats"]["total_points"] == 2
+
+        # Nothing changed
+        assert live_gameweek.apply({"elements": elements}, fixtures) == set()
+
+        # Player 4's BPS overtakes player 3's, and player 2 scores
+        elements = [element(1), element(2, total_points=8), element(3),
+                    element(4, bps=21)]
+        fixtures = [fixture(1, [(1, 30), (2, 25)], [(3, 20), (4, 21)])]
+        changed = live_gameweek.apply({"elements": elements}, fixtures)
+        assert changed == {2, 3, 4}
+        assert live_gameweek.changed == changed
+        assert live_gameweek.bonus == {1: 3, 2: 2, 4: 1}
+        assert live_gameweek.elements[2]["stats"]["total_points"] == 10
+        assert live_gameweek.elements[3] is elements[2]
+
+    @staticmethod
+    def test_apply_confirmed_bonus():
+        live_gameweek = LiveGameweek(None, 1)
+        fixtures = [fixture(1, [(1, 30), (2, 25)], [(3, 20), (4, 5)])]
+        live_gameweek.apply({"elements": [element(1)]}, fixtures)
+
+        # Once bonus points are in the stats, they aren't added again
+        confirmed = element(1, total_points=5, bonus=3)
+        live_gameweek.apply({"elements": [confirmed]}, fixtures)
+        assert live_gameweek.elements[1] is confirmed
+
+        fixtures = [fixture(1, [(1, 30), (2, 25)], [(3, 20), (4, 5)],
+                            finished=True)]
+        assert live_gameweek.apply(
+            {"elements": [confirmed]}, fixtures) == {1}
+        assert live_gameweek.bonus == {}
+
+    @staticmethod
+    def test_to_dict():
+        live_gameweek = LiveGameweek(None, 1)
+        live_gameweek.apply({"elements": [element(1)], "explain": []})
+        assert live_gameweek.to_dict() == {
+            "elements": {1: element(1)}, "explain": []}
+
+    async def test_update(self, loop, mocker):
+        mocked_fetch = mocker.patch(
+            "fpl.live.fetch", return_value={"elements": [element(1)]},
+            new_callable=AsyncMock)
+        live_gameweek = LiveGameweek(None, 3, include_bonus=False)
+        assert await live_gameweek.update() == {1}
+        mocked_fetch.assert_called_once_with(
+            None, "https://fantasy.premierleague.com/api/event/3/live")
+
+
+class TestLiveEvents(object):
+    @staticmethod
+    def test_get_events():
+        live_gameweek = LiveGameweek(None, 1)
+        fixtures = [fixture(1, [(1, 30), (2, 25)], [(3, 20), (4, 5)])]
+        live_gameweek.apply(
+            {"elements": [element(1), element(3), element(4)]}, fixtures)
+        assert live_gameweek.get_events() == []
+
+        fixtures = [fixture(1, [(1, 30), (2, 25)], [(3, 20), (4, 21)])]
+        live_gameweek.apply({"elements": [
+            element(1), element(3), element(4, bps=21), element(5)]},
+            fixtures)
+        assert live_gameweek.get_events() == [
+            LiveEvent("bonus", 3, 0, 1),
+            LiveEvent("points", 3, 2, 3),
+            LiveEvent("bps", 4, 21, 10),
+            LiveEvent("bonus", 4, 1, 0),
+            LiveEvent("points", 4, 3, 2)
+        ]
+
+    async def test_poll_events(self, loop, mocker):
+        responses = [
+            ({"elements": [element(1)]}, [fixture(1, [], [])]),
+            ({"elements": [element(1)]}, [fixture(1, [], [])]),
+            ({"elements": [element(1, total_points=6)]},
+             [fixture(1, [], [], finished=True)])
+        ]
+
+        async def update(self):
+            return self.apply(*responses.pop(0))
+
+        mocker.patch.object(LiveGameweek, "update", update)
+        events = [event async for event in poll_events(
+            LiveGameweek(None, 1), interval=0)]
+        assert events == [LiveEvent("points", 1, 6, 2)]
+        assert responses == []
@@ -0,0 +1,60 @@
+import time
+
+import pytest
+
+from fpl.rate_limit import RateLimiter, TokenBucket
+
+
+class TestTokenBucket(object):
+    @staticmethod
+    def test_init_invalid_budget():
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+        with pytest.raises(ValueError):
+            TokenBucket(1, 0)
+
+    @staticmethod
+    def test_init_default_capacity():
+        assert TokenBucket(0.5).capacity == 1
+        assert TokenBucket(2.5).capacity == 3
+
+    @staticmethod
+    def test_reserve_burst():
+        bucket = TokenBucket(1, 3)
+        delays = [bucket.reserve() for _ in range(3)]
+        assert delays == [0.0, 0.0, 0.0]
+
+        # Requests after the burst are queued one token apart
+        first = bucket.reserve()
+        second = bucket.reserve()
+        assert 0.9 < first <= 1.0
+        assert 1.9 < second <= 2.0
+
+    async def test_acquire_rate(self, loop):
+        bucket = TokenBucket(50, 1)
+        start = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        assert time.monotonic() - start >= 0.09
+
+
+class TestRateLimiter(object):
+    @staticmethod
+    def test_get_bucket():
+        limiter = RateLimiter({"player": 5, ("league_classic", "league_h2h"):
+                               (2, 4)})
+        assert limiter.get_bucket("player").rate == 5.0
+        assert limiter.get_bucket("league_classic").capacity == 4
+        assert (limiter.get_bucket("league_classic") is
+                limiter.get_bucket("league_h2h"))
+        assert limiter.get_bucket("static") is None
+        assert limiter.get_bucket(None) is None
+
+    @staticmethod
+    def test_get_bucket_default():
+        limiter = RateLimiter({"player": 5}, default=(1, 2))
+        static = limiter.get_bucket("static")
+        assert static.capacity == 2
+        assert static is limiter.get_bucket("static")
+        assert static is not limiter.get_bucket("fixtures")
+        assert limiter.get_bucket("player").rate == 5.0
@@ -0,0 +1,87 @@
+import pytest
+
+from fpl.cache import ResponseCache
+from fpl.refresh import SummaryRefresher, get_changed_players
+from fpl.utils import set_session_options
+
+elements = {
+    1: {"id": 1, "total_points": 10, "minutes": 90, "news": ""},
+    2: {"id": 2, "total_points": 5, "minutes": 45, "news": ""},
+    3: {"id": 3, "total_points": 0, "minutes": 0, "news": ""}
+}
+
+
+def test_get_changed_players():
+    new_elements = dict(elements)
+    new_elements[2] = dict(elements[2], minutes=135)
+    new_elements[3] = dict(elements[3], news="Injured")
+    new_elements[4] = {"id": 4}
+    del new_elements[1]
+
+    assert get_changed_players(elements, elements) == set()
+    assert get_changed_players(elements, new_elements) == {2, 3, 4}
+    assert get_changed_players(
+        elements, new_elements, fields=("minutes",)) == {2, 4}
+
+
+class FakeSession(object):
+    """A session whose summaries are counted and can be made to fail."""
+
+    def __init__(self):
+        self.downloads = []
+        self.failing = set()
+
+    async def fetch(self, session, url):
+        player_id = int(url.rstrip("/").split("/")[-1])
+        if player_id in self.failing:
+            raise ValueError(player_id)
+        self.downloads.append(player_id)
+        return {"history": [len(self.downloads)]}
+
+
+class TestSummaryRefresher(object):
+    async def test_refresh(self, loop, mocker):
+        session = FakeSession()
+        mocker.patch("fpl.refresh.fetch", session.fetch)
+        refresher = SummaryRefresher(session)
+        summaries = refresher.summaries
+
+        assert await refresher.refresh(elements) == {1, 2, 3}
+        assert sorted(session.downloads) == [1, 2, 3]
+
+        new_elements = dict(elements)
+        new_elements[2] = dict(elements[2], total_points=7, minutes=90)
+        del new_elements[3]
+
+        session.downloads = []
+        assert await refresher.refresh(list(new_elements.values())) == {2}
+        assert session.downloads == [2]
+        assert refresher.summaries is summaries
+        assert set(summaries) == {1, 2}
+
+        assert await refresher.refresh(new_elements) == set()
+
+    async def test_refresh_retries_failed_players(self, loop, mocker):
+        session = FakeSession()
+        session.failing.add(2)
+        mocker.patch("fpl.refresh.fetch", session.fetch)
+        refresher = SummaryRefresher(session, limit=1)
+
+        with pytest.raises(ValueError):
+            await refresher.refresh(elements)
+        assert set(refresher.summaries) == {1}
+
+        session.failing.clear()
+        assert await refresher.refresh(elements) == {2, 3}
+
+    async def test_refresh_invalidates_cached_summaries(self, loop, mocker):
+        session = FakeSession()
+        mocker.patch("fpl.refresh.fetch", session.fetch)
+        cache = ResponseCache()
+        set_session_options(session, cache=cache)
+        url = "https://fantasy.premierleague.com/api/element-summary/1/"
+        cache.set(url, {"history": []}, 10, "player", ("1",))
+
+        refresher = SummaryRefresher(session)
+        await refresher.refresh({1: elements[1]})
+        assert url not in cache
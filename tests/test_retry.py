@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from fpl.retry import RetryPolicy, parse_retry_after
+
+
+class TestRetryPolicy(object):
+    @staticmethod
+    def test_init_invalid_max_attempts():
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    @staticmethod
+    def test_should_retry_connection_error():
+        policy = RetryPolicy(max_attempts=3)
+        assert policy.should_retry(1)
+        assert policy.should_retry(2)
+        assert not policy.should_retry(3)
+
+    @staticmethod
+    def test_should_retry_status_rules():
+        policy = RetryPolicy(max_attempts=5, status_rules={503: 2})
+        assert policy.should_retry(1, 503)
+        assert not policy.should_retry(2, 503)
+        assert not policy.should_retry(1, 404)
+        assert not policy.should_retry(1, 429)
+
+    @staticmethod
+    def test_should_retry_max_attempts_overrides_status_rules():
+        policy = RetryPolicy(max_attempts=2, status_rules={429: 10})
+        assert policy.should_retry(1, 429)
+        assert not policy.should_retry(2, 429)
+
+    @staticmethod
+    def test_should_retry_not_idempotent():
+        policy = RetryPolicy()
+        assert not policy.should_retry(1, idempotent=False)
+        assert not policy.should_retry(1, 500, idempotent=False)
+        assert policy.should_retry(1, 429, idempotent=False)
+        assert policy.should_retry(1, 503, idempotent=False)
+
+    @staticmethod
+    def test_get_backoff_exponential():
+        policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0, jitter=False)
+        delays = [policy.get_backoff(attempt) for attempt in range(1, 6)]
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    @staticmethod
+    def test_get_backoff_jitter():
+        policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0)
+        for attempt in range(1, 6):
+            delay = policy.get_backoff(attempt)
+            assert 0.0 <= delay <= min(5.0, 2 ** (attempt - 1))
+
+    @staticmethod
+    def test_get_backoff_retry_after():
+        policy = RetryPolicy(max_backoff=10.0)
+        assert policy.get_backoff(1, "3") == 3.0
+        assert policy.get_backoff(1, "60") is None
+
+    @staticmethod
+    def test_parse_retry_after():
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after("invalid") is None
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after("-1") == 0.0
+
+        date = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = parse_retry_after(format_datetime(date, usegmt=True))
+        assert 25.0 < delay <= 30.0
@@ -0,0 +1,67 @@
+import pytest
+
+from fpl.stats import PlayerTable
+
+np = pytest.importorskip("numpy")
+
+elements = [
+    {"id": 1, "total_points": 90, "minutes": 900, "now_cost": 45,
+     "form": "2.0", "element_type": 1},
+    {"id": 2, "total_points": 120, "minutes": 600, "now_cost": 80,
+     "form": "6.5", "element_type": 3},
+    {"id": 3, "total_points": 0, "minutes": 0, "now_cost": 50,
+     "form": "0.0", "element_type": 3},
+    {"id": 4, "total_points": 150, "minutes": 1350, "now_cost": 100,
+     "form": "4.5", "element_type": 4},
+    {"id": 5, "total_points": 120, "minutes": 1080, "now_cost": 60,
+     "form": None, "element_type": 3},
+]
+
+
+class TestPlayerTable(object):
+    @staticmethod
+    def test_columns():
+        table = PlayerTable(elements)
+        assert len(table) == 5
+        assert table.ids.tolist() == [1, 2, 3, 4, 5]
+        assert table["form"].tolist() == [2.0, 6.5, 0.0, 4.5, 0.0]
+        assert table.get(4, "now_cost") == 100.0
+        assert "pp90" in table
+
+        with pytest.raises(ValueError):
+            table.get_row(6)
+
+    @staticmethod
+    def test_derived_metrics():
+        table = PlayerTable({player["id"]: player for player in elements})
+        assert table.pp90.tolist() == [9.0, 18.0, 0.0, 10.0, 10.0]
+        assert table.get(2, "points_per_million") == 15.0
+
+    @staticmethod
+    def test_rank():
+        table = PlayerTable(elements)
+        assert table.rank("pp90").tolist() == [2, 4, 5, 1, 3]
+        assert table.rank("now_cost", descending=False).tolist() == [
+            1, 3, 5, 2, 4]
+
+        midfielders = table["element_type"] == 3
+        assert table.rank("pp90", mask=midfielders).tolist() == [2, 5, 3]
+
+    @staticmethod
+    def test_top():
+        table = PlayerTable(elements)
+        assert table.top("total_points", 3).tolist() == [4, 2, 5]
+        assert table.top("pp90", 10).tolist() == [2, 4, 5, 1, 3]
+        assert table.top(table["form"], 1).tolist() == [2]
+        assert table.top("pp90", 0).tolist() == []
+
+        cheap = table["now_cost"] <= 60
+        assert table.top("pp90", 2, mask=cheap).tolist() == [5, 1]
+
+
+def test_player_index_table():
+    from fpl.indexes import PlayerIndex
+
+    index = PlayerIndex(elements)
+    assert index.table is index.table
+    assert index.table.ids.tolist() == [1, 2, 3, 4, 5]
@@ -70,3 +70,26 @@ class TestTeam(object):
         fixtures = await team.get_fixtures(return_json=True)
         assert isinstance(fixtures, list)
         assert fixtures == team.fixtures
+
+    async def test_get_fixtures_from_fixture_store(self, loop, mocker):
+        fixtures = [
+            {"id": 1, "event": 1, "team_h": 1, "team_a": 2,
+             "kickoff_time": "2019-08-10T14:00:00Z", "finished": True},
+            {"id": 2, "event": 2, "team_h": 3, "team_a": 1,
+             "kickoff_time": "2019-08-17T14:00:00Z", "finished": False,
+             "team_h_difficulty": 2, "team_a_difficulty": 4}
+        ]
+        mocked_fetch = mocker.patch(
+            "fpl.models.team.fetch", return_value=fixtures,
+            new_callable=AsyncMock)
+        team = Team({"id": 1}, None)
+
+        team_fixtures = await team.get_fixtures(return_json=True)
+        assert [fixture["id"] for fixture in team_fixtures] == [2]
+        assert team_fixtures[0]["difficulty"] == 4
+        assert team_fixtures[0]["is_home"] is False
+
+        schedule = await team.get_schedule(range(1, 4))
+        assert [gameweek["is_blank"] for gameweek in schedule] == [
+            False, False, True]
+        assert mocked_fetch.call_count == 2
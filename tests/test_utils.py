@@ -1,7 +1,20 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
 import pytest
+from aiohttp import web
 
-from fpl.utils import (chip_converter, get_current_gameweek, get_headers,
-                       logged_in, position_converter, team_converter)
+from fpl.cache import ResponseCache
+from fpl.constants import API_URLS
+from fpl.rate_limit import RateLimiter
+from fpl.retry import RetryPolicy
+from fpl.utils import (chip_converter, decode_response, fetch,
+                       get_current_gameweek, get_endpoint, get_headers,
+                       get_session_option, logged_in, position_converter,
+                       post, set_session_options, stream, team_converter)
 
 
 class TestUtils(object):
@@ -36,3 +49,331 @@ class TestUtils(object):
     def test_get_headers():
         headers = get_headers("123")
         assert isinstance(headers, dict)
+
+    @staticmethod
+    def test_get_endpoint():
+        assert get_endpoint(API_URLS["static"]) == "static"
+        assert get_endpoint(API_URLS["fixtures"]) == "fixtures"
+        assert get_endpoint(
+            API_URLS["gameweek_fixtures"].format(1)) == "gameweek_fixtures"
+        assert get_endpoint(API_URLS["player"].format(1)) == "player"
+        assert get_endpoint(
+            API_URLS["user_picks"].format(91928, 1)) == "user_picks"
+        assert get_endpoint(
+            API_URLS["league_classic"].format(967) +
+            "?page_new_entries=1&page_standings=1&phase=1") == "league_classic"
+        assert get_endpoint(API_URLS["league_h2h_fixtures"].format(
+            946125, "event=1&", 1)) == "league_h2h_fixtures"
+        assert get_endpoint("https://example.com/") is None
+
+
+class TestFetch(object):
+    @staticmethod
+    async def create_server(aiohttp_server, statuses, headers=None):
+        """Returns a server that responds with the given statuses in turn,
+        and a list of the requests it received.
+        """
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            status = statuses[min(len(requests), len(statuses)) - 1]
+            return web.json_response(
+                {"status": status}, status=status, headers=headers)
+
+        app = web.Application()
+        app.router.add_route("*", "/", handler)
+        server = await aiohttp_server(app)
+        return server, requests
+
+    async def test_fetch_retries_until_success(self, loop, aiohttp_server):
+        server, requests = await self.create_server(
+            aiohttp_server, [503, 429, 200])
+        policy = RetryPolicy(backoff_factor=0.0)
+
+        async with aiohttp.ClientSession() as session:
+            response = await fetch(
+                session, str(server.make_url("/")), retry_policy=policy)
+
+        assert response == {"status": 200}
+        assert len(requests) == 3
+
+    async def test_fetch_gives_up_after_max_attempts(
+            self, loop, aiohttp_server):
+        server, requests = await self.create_server(aiohttp_server, [503])
+        policy = RetryPolicy(max_attempts=3, backoff_factor=0.0)
+
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(aiohttp.ClientResponseError):
+                await fetch(
+                    session, str(server.make_url("/")), retry_policy=policy)
+
+        assert len(requests) == 3
+
+    async def test_fetch_does_not_retry_client_error(
+            self, loop, aiohttp_server):
+        server, requests = await self.create_server(aiohttp_server, [404])
+
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(aiohttp.ClientResponseError):
+                await fetch(session, str(server.make_url("/")))
+
+        assert len(requests) == 1
+
+    async def test_fetch_uses_session_retry_policy(
+            self, loop, aiohttp_server):
+        server, requests = await self.create_server(aiohttp_server, [500])
+        policy = RetryPolicy(backoff_factor=0.0, status_rules={500: 2})
+
+        async with aiohttp.ClientSession() as session:
+            set_session_options(session, retry_policy=policy)
+            assert get_session_option(session, "retry_policy") is policy
+
+            with pytest.raises(aiohttp.ClientResponseError):
+                await fetch(session, str(server.make_url("/")))
+
+        assert len(requests) == 2
+
+    async def test_fetch_retry_after_too_long(self, loop, aiohttp_server):
+        server, requests = await self.create_server(
+            aiohttp_server, [429], {"Retry-After": "3600"})
+
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(aiohttp.ClientResponseError):
+                await fetch(session, str(server.make_url("/")))
+
+        assert len(requests) == 1
+
+    async def test_post_only_retries_unprocessed_requests(
+            self, loop, aiohttp_server):
+        server, requests = await self.create_server(
+            aiohttp_server, [429, 500])
+        policy = RetryPolicy(backoff_factor=0.0)
+
+        async with aiohttp.ClientSession() as session:
+            response = await post(session, str(server.make_url("/")), "{}",
+                                  {}, retry_policy=policy)
+
+        assert response == {"status": 500}
+        assert len(requests) == 2
+
+    async def test_fetch_limits_concurrent_requests(
+            self, loop, aiohttp_server):
+        concurrent = []
+        active = 0
+
+        async def handler(request):
+            nonlocal active
+            active += 1
+            concurrent.append(active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return web.json_response({})
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+        server = await aiohttp_server(app)
+
+        async with aiohttp.ClientSession() as session:
+            set_session_options(session, semaphore=asyncio.Semaphore(3))
+            await asyncio.gather(*[
+                fetch(session, str(server.make_url(f"/?page={page}")))
+                for page in range(20)])
+
+        assert len(concurrent) == 20
+        assert max(concurrent) == 3
+
+    async def test_fetch_rate_limited(self, loop, aiohttp_server):
+        server, requests = await self.create_server(aiohttp_server, [200])
+
+        async with aiohttp.ClientSession() as session:
+            set_session_options(
+                session, rate_limiter=RateLimiter(default=(50, 1)))
+            start = time.monotonic()
+            await asyncio.gather(*[
+                fetch(session, str(server.make_url(f"/?page={page}")))
+                for page in range(6)])
+
+        assert len(requests) == 6
+        assert time.monotonic() - start >= 0.09
+
+    async def test_fetch_cached(self, loop, mocker, aiohttp_server):
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            return web.json_response({"elements": []})
+
+        app = web.Application()
+        app.router.add_get("/api/bootstrap-static/", handler)
+        server = await aiohttp_server(app)
+        url = str(server.make_url("/api/bootstrap-static/"))
+
+        mocker.patch("fpl.utils.match_endpoint",
+                     return_value=("static", ()))
+        cache = ResponseCache()
+        async with aiohttp.ClientSession() as session:
+            set_session_options(session, cache=cache)
+            first = await fetch(session, url)
+            second = await fetch(session, url)
+
+        assert first is second
+        assert len(requests) == 1
+        assert cache.size > 0
+
+    async def test_decode_response(self, loop, mocker):
+        threads = []
+
+        def loads(body):
+            threads.append(threading.current_thread())
+            return {"length": len(body)}
+
+        mocker.patch("fpl.utils.loads", side_effect=loads)
+        executor = ThreadPoolExecutor(1)
+        async with aiohttp.ClientSession() as session:
+            set_session_options(session, decode_threshold=10,
+                                decode_executor=executor)
+            assert await decode_response(session, b"[1, 2]") == {"length": 6}
+            assert await decode_response(session, b"[1, 2, 3, 4]") == {
+                "length": 12}
+        executor.shutdown()
+
+        assert threads[0] is threading.current_thread()
+        assert threads[1] is not threading.current_thread()
+
+    async def test_fetch_decodes_large_response(self, loop, aiohttp_server):
+        async def handler(request):
+            return web.json_response({"elements": list(range(100))})
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+        server = await aiohttp_server(app)
+
+        async with aiohttp.ClientSession() as session:
+            set_session_options(session, decode_threshold=0)
+            response = await fetch(session, str(server.make_url("/")))
+
+        assert response == {"elements": list(range(100))}
+
+    async def test_fetch_conditional_request(self, loop, mocker,
+                                             aiohttp_server):
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304)
+            return web.json_response({"elements": []}, headers={"ETag": '"v1"'})
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+        server = await aiohttp_server(app)
+
+        mocker.patch("fpl.utils.match_endpoint",
+                     return_value=("players", ()))
+        cache = ResponseCache(ttls={"players": 0.01})
+        async with aiohttp.ClientSession() as session:
+            set_session_options(session, cache=cache)
+            first = await fetch(session, str(server.make_url("/")))
+            await asyncio.sleep(0.02)
+            second = await fetch(session, str(server.make_url("/")))
+
+        assert first is second
+        assert len(requests) == 2
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+
+    async def test_fetch_coalesces_concurrent_requests(
+            self, loop, aiohttp_server):
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            await asyncio.sleep(0.01)
+            return web.json_response({"id": len(requests)})
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+        server = await aiohttp_server(app)
+        url = str(server.make_url("/"))
+
+        async with aiohttp.ClientSession() as session:
+            responses = await asyncio.gather(
+                *[fetch(session, url) for _ in range(5)])
+            assert len(requests) == 1
+            assert all(response is responses[0] for response in responses)
+
+            # Requests made after the shared one completed are sent again
+            await fetch(session, url)
+            assert len(requests) == 2
+
+    async def test_fetch_coalesced_request_survives_cancellation(
+            self, loop, aiohttp_server):
+        async def handler(request):
+            await asyncio.sleep(0.02)
+            return web.json_response({})
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+        server = await aiohttp_server(app)
+        url = str(server.make_url("/"))
+
+        async with aiohttp.ClientSession() as session:
+            first = asyncio.ensure_future(fetch(session, url))
+            second = asyncio.ensure_future(fetch(session, url))
+            await asyncio.sleep(0.005)
+            first.cancel()
+            assert await second == {}
+
+
+class TestStream(object):
+    async def test_stream(self, loop):
+        running = 0
+        max_running = 0
+
+        async def delayed(value, delay):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(delay)
+            running -= 1
+            return value
+
+        delays = [0.03, 0.01, 0.02, 0.005, 0.001]
+        coroutines = (delayed(i, delay) for i, delay in enumerate(delays))
+        results = [result async for result in stream(coroutines, 2)]
+        assert sorted(results) == [0, 1, 2, 3, 4]
+        assert results != [0, 1, 2, 3, 4]
+        assert max_running == 2
+
+        coroutines = (delayed(i, delay) for i, delay in enumerate(delays))
+        results = [result async for result in stream(
+            coroutines, 3, ordered=True)]
+        assert results == [0, 1, 2, 3, 4]
+
+    async def test_stream_cancels_pending_coroutines(self, loop):
+        cancelled = []
+
+        async def slow(value):
+            try:
+                await asyncio.sleep(0.01 * value)
+            except asyncio.CancelledError:
+                cancelled.append(value)
+                raise
+            return value
+
+        results = stream((slow(i) for i in range(1, 4)), 3)
+        async for result in results:
+            break
+        await results.aclose()
+        await asyncio.sleep(0)
+        assert result == 1
+        assert sorted(cancelled) == [2, 3]
+
+    async def test_stream_raises(self, loop):
+        async def fail():
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            async for _ in stream([fail()], 1):
+                pass